@@ -0,0 +1,206 @@
+"""
+FlightFocus Pro - airport database and route generator
+Turns any focus time into real destinations from a home airport:
+- bundled airport list (data/airports.csv) or a full OpenFlights airports.dat
+- k-d tree over unit vectors on the sphere: an annulus query (min/max distance from
+  home) prunes whole subtrees, so only nearby candidates are measured
+- one batched NumPy haversine over the candidates, then the block-time model
+  from route_catalog picks the destinations that fit the focus window
+Generated routes have the same (name, data) shape as REAL_WORLD_FLIGHTS.
+"""
+
+import os
+import csv
+import zlib
+
+import numpy as np
+
+from geodesy import to_unit_vectors, distances_km, EARTH_RADIUS_KM
+from route_catalog import (estimate_block_minutes, block_minutes_to_km, default_aircraft,
+                           WINDOW_MIN_FACTOR, WINDOW_MAX_FACTOR, FALLBACK_COUNT)
+
+AIRPORTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "airports.csv")
+LEAF_SIZE = 16
+# Cards offered per focus time (closest block times first)
+GENERATED_LIMIT = 60
+CALLSIGN_PREFIX = "FFP"
+# Nobody flies between airports of the same city; shorter hops are never offered
+MIN_ROUTE_KM = 150
+
+
+def country_flag(code):
+    """'GB' -> regional-indicator flag emoji ('' for anything that is not two letters)"""
+    if len(code) != 2 or not code.isalpha(): return ""
+    return "".join(chr(0x1F1E6 + ord(c) - ord("A")) for c in code.upper())
+
+
+def _chord(km):
+    """Great-circle km -> straight-line distance between unit vectors"""
+    return 2.0 * np.sin(min(km / EARTH_RADIUS_KM, np.pi) / 2.0)
+
+
+class KDTree:
+    """Static k-d tree over (N, 3) points, stored as flat arrays (no node objects)"""
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        self.points = points
+        self.order = np.arange(len(points))
+        lo, hi, start, end, left, right = [], [], [], [], [], []
+
+        def build(a, b):
+            node = len(start)
+            chunk = points[self.order[a:b]]
+            lo.append(chunk.min(axis=0)); hi.append(chunk.max(axis=0))
+            start.append(a); end.append(b); left.append(-1); right.append(-1)
+            if b - a > leaf_size:
+                axis = int(np.argmax(hi[node] - lo[node]))
+                mid = (a + b) // 2
+                part = np.argpartition(chunk[:, axis], mid - a)
+                self.order[a:b] = self.order[a:b][part]
+                left[node] = build(a, mid)
+                right[node] = build(mid, b)
+            return node
+
+        if len(points): build(0, len(points))
+        self.lo, self.hi = np.array(lo), np.array(hi)
+        self.start, self.end = np.array(start), np.array(end)
+        self.left, self.right = np.array(left), np.array(right)
+
+    def _box_distances(self, node, q):
+        below, above = self.lo[node] - q, q - self.hi[node]
+        near = np.sqrt(np.sum(np.maximum(np.maximum(below, above), 0.0) ** 2))
+        far = np.sqrt(np.sum(np.maximum(np.abs(below), np.abs(above)) ** 2))
+        return near, far
+
+    def query_shell(self, q, r_min, r_max):
+        """Indices of points possibly within r_min..r_max of q (whole leaves; callers measure exactly)"""
+        if not len(self.start): return np.empty(0, dtype=int)
+        ranges, stack = [], [0]
+        while stack:
+            node = stack.pop()
+            near, far = self._box_distances(node, q)
+            if near > r_max or far < r_min: continue
+            if self.left[node] < 0 or (near >= r_min and far <= r_max):
+                ranges.append(self.order[self.start[node]:self.end[node]])
+            else:
+                stack += [self.left[node], self.right[node]]
+        return np.concatenate(ranges) if ranges else np.empty(0, dtype=int)
+
+    def nearest(self, q):
+        best, best_d, stack = -1, np.inf, [0] if len(self.start) else []
+        while stack:
+            node = stack.pop()
+            if self._box_distances(node, q)[0] >= best_d: continue
+            if self.left[node] < 0:
+                idx = self.order[self.start[node]:self.end[node]]
+                d = np.sum((self.points[idx] - q) ** 2, axis=1)
+                i = int(np.argmin(d))
+                if d[i] < best_d ** 2: best, best_d = int(idx[i]), float(np.sqrt(d[i]))
+            else:
+                # Visit the child on q's side of the split last, so it is popped first
+                l, r = self.left[node], self.right[node]
+                near_l = self._box_distances(l, q)[0]
+                near_r = self._box_distances(r, q)[0]
+                stack += [l, r] if near_l > near_r else [r, l]
+        return best
+
+
+class AirportIndex:
+    """Columnar airport table plus a spatial index"""
+
+    def __init__(self, codes, names, cities, countries, lats, lons, source=None):
+        self.codes = codes
+        self.names = names
+        self.cities = cities
+        self.countries = countries
+        self.lats = np.asarray(lats, dtype=float)
+        self.lons = np.asarray(lons, dtype=float)
+        self.source = source
+        self.points = to_unit_vectors(self.lats, self.lons) if len(codes) else np.empty((0, 3))
+        self.tree = KDTree(self.points)
+        self._by_code = {c: i for i, c in enumerate(codes)}
+
+    @classmethod
+    def load(cls, path=AIRPORTS_PATH):
+        """Bundled CSV, or an OpenFlights airports.dat (thousands of airports)"""
+        rows = list(read_openflights_airports(path) if path.endswith(".dat") else read_airports_csv(path))
+        return cls(*(list(col) for col in zip(*rows)) if rows else ([],) * 6, source=path)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def index_of(self, code):
+        return self._by_code.get(code.strip().upper())
+
+    def find(self, query):
+        """IATA code, 'lat,lon' (nearest airport) or part of a city / airport name"""
+        query = query.strip()
+        i = self.index_of(query)
+        if i is not None: return i
+        try:
+            lat, lon = (float(v) for v in query.split(","))
+            return self.nearest(lat, lon)
+        except ValueError:
+            pass
+        q = query.lower()
+        return next((i for i in range(len(self)) if q in self.cities[i].lower() or q in self.names[i].lower()), None)
+
+    def nearest(self, lat, lon):
+        if not len(self): return None
+        return self.tree.nearest(to_unit_vectors(np.array(lat), np.array(lon)))
+
+    def label(self, i):
+        return f"{self.codes[i]} - {self.names[i]}, {self.cities[i]}"
+
+    def place(self, i):
+        return f"{country_flag(self.countries[i])} {self.cities[i].upper()} ({self.codes[i]})".strip()
+
+    def within_km(self, home, lo_km, hi_km):
+        """(indices, distances) of airports lo_km..hi_km from home: tree pruning + one batched haversine"""
+        candidates = self.tree.query_shell(self.points[home], _chord(lo_km), _chord(hi_km))
+        candidates = candidates[candidates != home]
+        km = distances_km(self.lats[home], self.lons[home], self.lats[candidates], self.lons[candidates])
+        keep = (km >= lo_km) & (km <= hi_km)
+        return candidates[keep], km[keep]
+
+    def route(self, home, dest, distance_km):
+        distance_km = float(distance_km)
+        number = zlib.crc32(f"{self.codes[home]}{self.codes[dest]}".encode()) % 900 + 100
+        return (f"{self.place(home)} → {self.place(dest)}", {
+            "coords": [round(float(self.lats[home]), 4), round(float(self.lons[home]), 4),
+                       round(float(self.lats[dest]), 4), round(float(self.lons[dest]), 4)],
+            "real_duration": estimate_block_minutes(distance_km),
+            "distance_km": int(round(distance_km)),
+            "aircraft": default_aircraft(distance_km),
+            "callsign": f"{CALLSIGN_PREFIX}{number}",
+        })
+
+    def routes_for(self, home, focus_minutes, limit=GENERATED_LIMIT):
+        """Destinations from home whose block time fits the focus window, closest block time first;
+        the nearest few by block time when nothing fits (same rule as RouteCatalog.select)"""
+        lo = max(block_minutes_to_km(focus_minutes * WINDOW_MIN_FACTOR), MIN_ROUTE_KM)
+        hi = block_minutes_to_km(focus_minutes * WINDOW_MAX_FACTOR)
+        dest, km = self.within_km(home, lo, hi) if hi > lo else (np.empty(0, dtype=int), np.empty(0))
+        if not len(dest):
+            dest, km = self.within_km(home, MIN_ROUTE_KM, np.inf)
+            limit = FALLBACK_COUNT
+        target_km = block_minutes_to_km(focus_minutes)
+        best = np.argsort(np.abs(km - target_km), kind="stable")[:limit]
+        return [self.route(home, int(dest[j]), km[j]) for j in best]
+
+
+def read_airports_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield row["iata"], row["name"], row["city"], row["country"], float(row["lat"]), float(row["lon"])
+
+
+def read_openflights_airports(path):
+    """OpenFlights airports.dat rows with an IATA code; the country is kept as its full name"""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            try:
+                if len(row[4]) != 3: continue
+                yield row[4], row[1], row[2] or row[1], row[3], float(row[6]), float(row[7])
+            except (IndexError, ValueError):
+                continue
@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - headless benchmark suite
+Runs under QT_QPA_PLATFORM=offscreen and writes a JSON baseline:
+- cold start to first paint (separate process per sample)
+- update_available_flights latency vs. catalog size
+- search-as-you-type keystroke latency vs. catalog size (index build reported separately)
+- start_flight to first map frame
+- in-page frame time and JS heap
+- process RSS (incl. QtWebEngine renderer) and CPU time over a time-compressed long session
+- the same session on the native QPainter map view, for a memory/CPU comparison
+- a whole Marathon session fast-forwarded in simulated time (no GUI)
+- route generation from a home airport (bundled airports and a synthetic 10k-airport index)
+- flight profiles: process-pool table build for a large catalog and the per-tick interpolation
+- session history: batched writes of years of sessions, then setup-page stats from the rollups
+- day/night: solving nightfall along a route, and the per-tick terminator check over a whole flight
+- track export: a Marathon session as GPX, and a whole catalog as GeoJSON on the process pool
+- theme: building and styling both pages under the app-wide stylesheet, and a live light/dark switch
+
+Usage:
+  python benchmarks/run_benchmarks.py --output baseline.json
+  python benchmarks/run_benchmarks.py --compare baseline.json [--tolerance 0.2]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+CATALOG_SIZES = [15, 1_000, 10_000, 50_000]
+SELECTION_FOCUS_TIMES = [25, 60, 120, 360]
+COLD_START_SAMPLES = 3
+PAGE_TIMEOUT_S = 30.0
+SESSION_MINUTES = 360
+SESSION_WARP = 720          # 6 h of session time in 30 s
+RSS_SAMPLE_EVERY_S = 1.0
+SEARCH_TYPING = "city 12 town 3"
+SEARCH_INDEX_TIMEOUT_S = 30.0
+HOME_AIRPORTS = ["LHR", "JFK", "SIN", "SYD", "NBO"]
+SYNTHETIC_AIRPORTS = 10_000
+PROFILE_CATALOG_SIZE = 10_000
+PROFILE_TICKS = 100_000
+HISTORY_YEARS = 3
+HISTORY_SESSIONS_PER_DAY = 4
+THEME_SAMPLES = 5
+EXPORT_CATALOG_SIZE = 2_000
+DAYLIGHT_TICKS = 100_000
+
+# Lower is better for every metric; the compare step flags anything slower than tolerance
+COMPARE_KEYS = [
+    "cold_start.first_paint_ms.median",
+    "start_flight.first_frame_ms",
+    "page.render_ms",
+    "session.rss_growth_mb",
+    "session.cpu_s",
+    "native.first_frame_ms",
+    "native.render_ms",
+    "native.rss_end_mb",
+    "native.cpu_s",
+    "simulation.marathon_ms",
+    "airports.generate_ms.median",
+    "airports.generate_10k_ms.median",
+    "history.stats_ms.max",
+    "theme.window_ms.median",
+    "theme.switch_ms.median",
+    "profiles.build_ms",
+    "profiles.tick_us",
+    "daylight.nightfall_ms",
+    "daylight.tick_us",
+    "export.session_ms",
+    "export.bulk_ms",
+] + [f"selection.{n}.median" for n in CATALOG_SIZES] + [f"search.{n}.keystroke_ms.max" for n in CATALOG_SIZES] \
+    + [f"search.{n}.index_build_ms" for n in CATALOG_SIZES]
+
+
+# --- helpers ---
+def process_tree(pid=None):
+    """A process and all its descendants (Linux /proc)"""
+    pid = pid or os.getpid()
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit(): continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    tree, stack = [], [pid]
+    while stack:
+        p = stack.pop()
+        tree.append(p)
+        stack.extend(children.get(p, []))
+    return tree
+
+
+def process_tree_rss_mb(pid=None):
+    """RSS of a process plus all its descendants, in MB"""
+    total = 0
+    for p in process_tree(pid):
+        try:
+            with open(f"/proc/{p}/statm") as f:
+                total += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            pass
+    return total / (1024 * 1024)
+
+
+def process_tree_cpu_s(pid=None):
+    """User + system CPU seconds consumed so far by a process and its descendants"""
+    ticks = 0
+    for p in process_tree(pid):
+        try:
+            with open(f"/proc/{p}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            ticks += int(fields[11]) + int(fields[12])
+        except (OSError, IndexError, ValueError):
+            pass
+    return ticks / os.sysconf("SC_CLK_TCK")
+
+
+def summarize(samples):
+    return {"median": statistics.median(samples), "min": min(samples), "max": max(samples), "n": len(samples)}
+
+
+def wait_until(app, predicate, timeout):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline: return False
+        app.processEvents()
+        time.sleep(0.002)
+    return True
+
+
+def synthetic_catalog(path, size, seed=1):
+    import route_catalog
+    rng = random.Random(seed)
+    routes = []
+    for i in range(size):
+        lat1, lon1, lat2, lon2 = rng.uniform(-50, 60), rng.uniform(-180, 180), rng.uniform(-50, 60), rng.uniform(-180, 180)
+        distance = route_catalog.haversine_km(lat1, lon1, lat2, lon2)
+        routes.append((f"CITY {i} (A{i % 100:02d}) → TOWN {i} (B{i % 100:02d})", {
+            "coords": [lat1, lon1, lat2, lon2], "real_duration": route_catalog.estimate_block_minutes(distance),
+            "distance_km": int(distance), "aircraft": route_catalog.default_aircraft(distance), "callsign": f"BM{i % 9000}",
+        }))
+    route_catalog.write_catalog(path, routes)
+    return route_catalog.RouteCatalog.open(path)
+
+
+# --- cold start (child process) ---
+def child_cold_start():
+    """Runs in a fresh interpreter: import, build, show, report ms to first paint of the setup page"""
+    import flight_focus as ff
+    from PyQt6.QtCore import QObject, QEvent, QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    imported = time.perf_counter()
+    from tile_cache import register_cache_scheme
+    register_cache_scheme()
+    QApplication.setAttribute(ff.Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    app = QApplication(sys.argv[:1])
+    window = ff.FlightFocusPro()
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                now = time.perf_counter()
+                print(json.dumps({"import_ms": 1000 * (imported - ff.PROCESS_START),
+                                  "first_paint_ms": 1000 * (now - ff.PROCESS_START)}), flush=True)
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    watcher = FirstPaint()
+    window.setup_page.installEventFilter(watcher)
+    window.show()
+    app.exec()
+
+
+def bench_cold_start():
+    spawn_ms, paint_ms, import_ms = [], [], []
+    for _ in range(COLD_START_SAMPLES):
+        t0 = time.perf_counter()
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child-cold-start"],
+                             capture_output=True, text=True, timeout=120, env=os.environ)
+        wall = 1000 * (time.perf_counter() - t0)
+        lines = [l for l in out.stdout.splitlines() if l.startswith("{")]
+        if not lines:
+            return {"error": out.stderr.strip().splitlines()[-1:] or ["no output"]}
+        result = json.loads(lines[-1])
+        spawn_ms.append(wall)
+        paint_ms.append(result["first_paint_ms"])
+        import_ms.append(result["import_ms"])
+    return {"first_paint_ms": summarize(paint_ms), "import_ms": summarize(import_ms), "process_wall_ms": summarize(spawn_ms)}
+
+
+# --- in-process benchmarks ---
+def bench_simulation():
+    from route_catalog import RouteCatalog
+    from flights import REAL_WORLD_FLIGHTS
+    from session_replay import simulate
+    catalog = RouteCatalog.from_flights(REAL_WORLD_FLIGHTS)
+    _, data = catalog.record(catalog.select(SESSION_MINUTES)[0])
+    t0 = time.perf_counter()
+    ticks = simulate(data, SESSION_MINUTES)
+    return {"marathon_ms": 1000 * (time.perf_counter() - t0), "ticks": len(ticks)}
+
+
+def bench_airports():
+    import numpy as np
+    from airports import AirportIndex
+
+    def generate(index, homes):
+        samples = []
+        for home in homes:
+            for minutes in SELECTION_FOCUS_TIMES:
+                t0 = time.perf_counter()
+                index.routes_for(home, minutes)
+                samples.append(1000 * (time.perf_counter() - t0))
+        return summarize(samples)
+
+    t0 = time.perf_counter()
+    index = AirportIndex.load()
+    load_ms = 1000 * (time.perf_counter() - t0)
+    results = {"airports": len(index), "load_ms": load_ms,
+               "generate_ms": generate(index, [index.index_of(code) for code in HOME_AIRPORTS])}
+
+    rng = np.random.default_rng(1)
+    n = SYNTHETIC_AIRPORTS
+    lats = np.degrees(np.arcsin(rng.uniform(-0.9, 0.95, n)))
+    codes = [f"X{i:04d}" for i in range(n)]
+    t0 = time.perf_counter()
+    synthetic = AirportIndex(codes, codes, codes, ["ZZ"] * n, lats, rng.uniform(-180, 180, n))
+    results["build_10k_ms"] = 1000 * (time.perf_counter() - t0)
+    results["generate_10k_ms"] = generate(synthetic, range(0, n, n // len(HOME_AIRPORTS)))
+    return results
+
+
+def bench_profiles(tmpdir):
+    from route_catalog import RouteCatalog
+    from flight_profiles import build_table, table_path, ProfileTable
+    path = os.path.join(tmpdir, "profiles.ffcat")
+    synthetic_catalog(path, PROFILE_CATALOG_SIZE)
+    catalog = RouteCatalog.open(path)
+    t0 = time.perf_counter()
+    build_table(catalog, table_path(path))
+    results = {"routes": len(catalog), "workers": os.cpu_count(), "build_ms": 1000 * (time.perf_counter() - t0)}
+    profile = ProfileTable.open(catalog).profile(len(catalog) // 2)
+    t0 = time.perf_counter()
+    for k in range(PROFILE_TICKS): profile.at(k / PROFILE_TICKS)
+    results["tick_us"] = 1e6 * (time.perf_counter() - t0) / PROFILE_TICKS
+    return results
+
+
+def bench_daylight():
+    from flights import REAL_WORLD_FLIGHTS
+    from flight_profiles import FlightProfile
+    from geodesy import great_circle_route, ROUTE_STEPS
+    from daylight import SessionDaylight
+    data = max(REAL_WORLD_FLIGHTS.values(), key=lambda d: d["real_duration"])
+    route = great_circle_route(*data["coords"], fractions=FlightProfile.for_flight(data).distance_fractions(ROUTE_STEPS))
+    samples = []
+    for _ in range(20):
+        t0 = time.perf_counter()
+        daylight = SessionDaylight(route, data["real_duration"] * 60)
+        samples.append(1000 * (time.perf_counter() - t0))
+    # One check per telemetry tick; only a few hundred of them move the terminator
+    sent = 0
+    t0 = time.perf_counter()
+    for k in range(DAYLIGHT_TICKS):
+        shape, sun = daylight.update(k / DAYLIGHT_TICKS)
+        if sun is not None: sent += 1
+    return {"nightfall_ms": statistics.median(samples), "tick_us": 1e6 * (time.perf_counter() - t0) / DAYLIGHT_TICKS,
+            "updates_sent": sent}
+
+
+def bench_export(tmpdir):
+    from flights import REAL_WORLD_FLIGHTS
+    from track_export import Track, export_tracks, export_catalog
+    name = max(REAL_WORLD_FLIGHTS, key=lambda n: REAL_WORLD_FLIGHTS[n]["real_duration"])
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as out:
+        export_tracks([Track.for_session(name, REAL_WORLD_FLIGHTS[name], SESSION_MINUTES, 1)], out, "gpx")
+    results = {"session_points": SESSION_MINUTES * 60 + 1, "session_ms": 1000 * (time.perf_counter() - t0)}
+    catalog = synthetic_catalog(os.path.join(tmpdir, "export.ffcat"), EXPORT_CATALOG_SIZE)
+    path = os.path.join(tmpdir, "routes.geojson")
+    t0 = time.perf_counter()
+    with open(path, "w") as out: export_catalog(catalog, out, "geojson")
+    results.update({"routes": len(catalog), "workers": os.cpu_count(), "bulk_ms": 1000 * (time.perf_counter() - t0),
+                    "bulk_mb": os.path.getsize(path) / 2**20})
+    return results
+
+
+def bench_history(tmpdir):
+    from session_history import SessionHistory
+    history = SessionHistory(os.path.join(tmpdir, "history.sqlite3"))
+    days = 365 * HISTORY_YEARS
+    start = time.time() - days * 86400
+    values = {"progress": 0.5, "remaining_km": 1000, "altitude_ft": 35000}
+    t0 = time.perf_counter()
+    for day in range(days):
+        for n in range(HISTORY_SESSIONS_PER_DAY):
+            started_at = start + day * 86400 + n * 3600
+            handle = history.begin(f"ROUTE {(day * HISTORY_SESSIONS_PER_DAY + n) % 500}", {}, 60, started_at)
+            for minute in range(60): history.sample(handle, minute * 60, values)
+            history.end(handle, 3600, 5000, True, started_at + 3600)
+    enqueue_ms = 1000 * (time.perf_counter() - t0)
+    history.flush()
+    results = {"sessions": days * HISTORY_SESSIONS_PER_DAY, "enqueue_ms": enqueue_ms,
+               "write_ms": 1000 * (time.perf_counter() - t0)}
+    samples = []
+    for _ in range(20):
+        t0 = time.perf_counter()
+        history.stats()
+        samples.append(1000 * (time.perf_counter() - t0))
+    results["stats_ms"] = summarize(samples)
+    history.close()
+    return results
+
+
+def bench_selection(app, ff, tmpdir):
+    results = {}
+    for size in CATALOG_SIZES:
+        catalog = synthetic_catalog(os.path.join(tmpdir, f"bench_{size}.ffcat"), size)
+        window = ff.FlightFocusPro(catalog)
+        window.show()
+        app.processEvents()
+        samples = []
+        for _ in range(5):
+            for minutes in SELECTION_FOCUS_TIMES:
+                window.selected_focus_time = minutes
+                t0 = time.perf_counter()
+                window.update_available_flights()
+                window.flight_list.viewport().repaint()
+                samples.append(1000 * (time.perf_counter() - t0))
+        results[str(size)] = summarize(samples)
+        window.close(); window.deleteLater()
+        app.processEvents()
+    return results
+
+
+def bench_theme(app, ff):
+    """Window build + first paint of both pages (stylesheet parse and polish), then scheme switches"""
+    from PyQt6.QtCore import QEvent
+    build = []
+    for _ in range(THEME_SAMPLES):
+        t0 = time.perf_counter()
+        window = ff.FlightFocusPro(map_renderer="native")
+        window.show()
+        window.grab()
+        window.pages.setCurrentIndex(1)
+        window.grab()
+        build.append(1000 * (time.perf_counter() - t0))
+        window.pages.setCurrentIndex(0)
+        if len(build) < THEME_SAMPLES:
+            window.close(); window.deleteLater()
+            # Outside exec() deleteLater never runs: earlier windows would be restyled by every switch
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    switch = []
+    for k in range(2 * THEME_SAMPLES):
+        t0 = time.perf_counter()
+        window.theme.set_scheme("light" if k % 2 == 0 else "dark")
+        window.grab()
+        switch.append(1000 * (time.perf_counter() - t0))
+    window.theme.apply("dark")
+    window.close(); window.deleteLater()
+    app.processEvents()
+    return {"window_ms": summarize(build), "switch_ms": summarize(switch)}
+
+
+def bench_search(app, ff, tmpdir):
+    """Type SEARCH_TYPING one key at a time into the search box; each sample includes the list repaint"""
+    results = {}
+    for size in CATALOG_SIZES:
+        catalog = synthetic_catalog(os.path.join(tmpdir, f"bench_{size}.ffcat"), size)
+        window = ff.FlightFocusPro(catalog)
+        window.show()
+        window.on_focus_time_selected(120)
+        app.processEvents()
+        t0 = time.perf_counter()
+        window.search_index(window.flight_model.catalog)
+        # Built on a worker thread: time until the window has it, which needs the event loop for the signal
+        if not wait_until(app, lambda: window._search is not None, SEARCH_INDEX_TIMEOUT_S):
+            raise RuntimeError(f"search index for {size:,} routes not delivered within {SEARCH_INDEX_TIMEOUT_S:.0f} s")
+        build_ms = 1000 * (time.perf_counter() - t0)
+        assert window._search.catalog is window.flight_model.catalog
+        samples = []
+        for _ in range(3):
+            for k in range(1, len(SEARCH_TYPING) + 1):
+                t0 = time.perf_counter()
+                window.search_input.setText(SEARCH_TYPING[:k])
+                window.flight_list.viewport().repaint()
+                samples.append(1000 * (time.perf_counter() - t0))
+                # Every sample must be an index lookup, not the unfiltered list shown while indexing
+                assert "MATCHING" in window.flights_group.title(), window.flights_group.title()
+            window.search_input.clear()
+        results[str(size)] = {"index_build_ms": build_ms, "keystroke_ms": summarize(samples)}
+        window.close(); window.deleteLater()
+        app.processEvents()
+    return results
+
+
+def run_session(app, window):
+    """Let a started session run for SESSION_MINUTES of warped time; sample tree RSS and CPU"""
+    rss = []
+    cpu_start = process_tree_cpu_s()
+    end = time.perf_counter() + SESSION_MINUTES * 60 / SESSION_WARP
+    while time.perf_counter() < end:
+        wait_until(app, lambda: False, RSS_SAMPLE_EVERY_S)
+        rss.append(round(process_tree_rss_mb(), 1))
+    return {
+        "session_minutes": SESSION_MINUTES, "warp": SESSION_WARP,
+        "rss_mb": rss, "rss_start_mb": rss[0] if rss else None, "rss_end_mb": rss[-1] if rss else None,
+        "rss_growth_mb": (rss[-1] - rss[0]) if rss else None,
+        "cpu_s": round(process_tree_cpu_s() - cpu_start, 2),
+        "telemetry": window.telemetry_stats(),
+    }
+
+
+def start_warped_session(window):
+    """start_flight with the session clock and the map both running SESSION_WARP x faster"""
+    window.on_focus_time_selected(SESSION_MINUTES)
+    window.sim.set_warp(SESSION_WARP)
+    t0 = time.perf_counter()
+    window.start_flight()
+    return t0
+
+
+def bench_page(app, ff):
+    """start_flight -> first map frame, then frame time / JS heap and a time-compressed session"""
+    window = ff.FlightFocusPro()
+    window.show()
+    try:
+        window.ensure_web_view()
+    except ImportError as exc:
+        return {"skipped": f"QtWebEngine unavailable: {exc}"}, None, None
+
+    if not wait_until(app, lambda: window.map_bridge.ready, PAGE_TIMEOUT_S):
+        return {"skipped": "map page did not become ready"}, None, None
+
+    first_frame = []
+    window.map_bridge.firstFrameRendered.connect(lambda: first_frame.append(time.perf_counter()))
+    t0 = start_warped_session(window)
+    got_frame = wait_until(app, lambda: first_frame, PAGE_TIMEOUT_S)
+    start_result = {"first_frame_ms": 1000 * (first_frame[0] - t0) if got_frame else None}
+    session_result = run_session(app, window)
+
+    done = []
+    window.web_view.page().runJavaScript("getRenderStats()", 0, lambda value: done.append(value))
+    wait_until(app, lambda: done, 5.0)
+    page_stats = done[0] if done and done[0] else {}
+
+    page_result = {
+        "render_ms": page_stats.get("renderMs"), "max_render_ms": page_stats.get("maxRenderMs"),
+        "fps": page_stats.get("fps"), "renders": page_stats.get("renders"),
+        "js_heap_mb": page_stats["heapBytes"] / (1024 * 1024) if page_stats.get("heapBytes") else None,
+    }
+    return start_result, page_result, session_result
+
+
+def bench_native():
+    """Same session on the QPainter view, in a child process so the RSS is not shared with QtWebEngine"""
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child-native"],
+                         capture_output=True, text=True, timeout=SESSION_MINUTES * 60 / SESSION_WARP + 120, env=os.environ)
+    lines = [l for l in out.stdout.splitlines() if l.startswith("{")]
+    if not lines:
+        return {"error": out.stderr.strip().splitlines()[-1:] or ["no output"]}
+    return json.loads(lines[-1])
+
+
+def child_native():
+    import flight_focus as ff
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    window = ff.FlightFocusPro(map_renderer="native")
+    window.show()
+    app.processEvents()
+
+    first_frame = []
+    window.map_view.firstFrameRendered.connect(lambda: first_frame.append(time.perf_counter()))
+    t0 = start_warped_session(window)
+    got_frame = wait_until(app, lambda: first_frame, PAGE_TIMEOUT_S)
+    session = run_session(app, window)
+    stats = window.map_view.render_stats()
+    session.update({
+        "first_frame_ms": 1000 * (first_frame[0] - t0) if got_frame else None,
+        "render_ms": stats["renderMs"], "max_render_ms": stats["maxRenderMs"],
+        "fps": stats["fps"], "renders": stats["renders"],
+    })
+    print(json.dumps(session), flush=True)
+
+
+def run_all():
+    from PyQt6.QtWidgets import QApplication
+    from tile_cache import register_cache_scheme
+    import flight_focus as ff
+    from PyQt6.QtCore import Qt
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+            "platform": platform.platform(), "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+            "git": subprocess.run(["git", "-C", REPO_ROOT, "rev-parse", "--short", "HEAD"],
+                                  capture_output=True, text=True).stdout.strip() or None,
+        },
+        "cold_start": bench_cold_start(),
+        "simulation": bench_simulation(),
+        "airports": bench_airports(),
+        "daylight": bench_daylight(),
+    }
+
+    register_cache_scheme()
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    app = QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results["selection"] = bench_selection(app, ff, tmpdir)
+        results["search"] = bench_search(app, ff, tmpdir)
+        results["theme"] = bench_theme(app, ff)
+        results["history"] = bench_history(tmpdir)
+        results["profiles"] = bench_profiles(tmpdir)
+        results["export"] = bench_export(tmpdir)
+    start_result, page_result, session_result = bench_page(app, ff)
+    results["start_flight"] = start_result
+    results["page"] = page_result
+    results["session"] = session_result
+    results["native"] = bench_native()
+    return results
+
+
+# --- baseline comparison ---
+def lookup(results, dotted):
+    node = results
+    for key in dotted.split("."):
+        if not isinstance(node, dict) or key not in node: return None
+        node = node[key]
+    return node if isinstance(node, (int, float)) else None
+
+
+def compare(current, baseline, tolerance):
+    regressions = []
+    for key in COMPARE_KEYS:
+        old, new = lookup(baseline, key), lookup(current, key)
+        if old is None or new is None:
+            print(f"  {key:<40} n/a")
+            continue
+        change = (new - old) / old if old else 0.0
+        flag = "REGRESSION" if change > tolerance else ""
+        print(f"  {key:<40} {old:10.2f} -> {new:10.2f}  ({change:+.1%}) {flag}")
+        if flag: regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FlightFocus Pro headless benchmarks")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON to compare against (non-zero exit on regression)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before flagging (default 20%%)")
+    parser.add_argument("--child-cold-start", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--child-native", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_cold_start:
+        child_cold_start()
+        return
+    if args.child_native:
+        child_native()
+        return
+
+    results = run_all()
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f: f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f: baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
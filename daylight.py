@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - day / night
+Where the sun is along a simulated flight, for the map's terminator overlay:
+- the flight keeps the real flight's clock: at progress p it is departure + p x block time,
+  with the departure anchored so the plane's sky matches the real one when the session starts
+- subsolar point and sun elevation are vectorized NumPy (low-precision almanac, ~0.01 deg)
+- the terminator only depends on the declination and on the longitude from the subsolar
+  point, so its shape is sent to the map once per flight (again only if the declination
+  drifts) and every update afterwards is the subsolar point alone, every DAYLIGHT_STEP_S of
+  flight time; the map shifts the shape in longitude
+- nightfall: where the route crosses into darkness, solved once per route over its table
+  (rows are evenly spaced in flight time)
+
+Usage:
+  python daylight.py [--time 2026-06-21T12:00]
+  python daylight.py route -f QFA [--depart 2026-06-21T22:00]
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Flight seconds between terminator updates (the sun moves 0.25 deg of longitude a minute)
+DAYLIGHT_STEP_S = 240
+# Declination drift before the terminator shape is rebuilt (a whole flight rarely gets there)
+DECLINATION_STEP_DEG = 0.1
+# Terminator vertices, in longitude from the subsolar point; spans three worlds so a shifted
+# copy still covers unwrapped routes on either side of the antimeridian
+SHAPE_STEP_DEG = 2.0
+SHAPE_SPAN_DEG = 540.0
+# tan(declination) floor: at the equinox the terminator is a meridian, not a division by zero
+MIN_TAN_DECLINATION = 1e-4
+# Sun centre on the geometric horizon: the same line the overlay draws
+NIGHT_ELEVATION_DEG = 0.0
+
+UNIX_EPOCH_JD = 2440587.5
+J2000_JD = 2451545.0
+
+
+def subsolar_point(t):
+    """(lat, lon) in degrees where the sun is overhead at unix time(s) t; lat is the declination"""
+    n = np.asarray(t, dtype=float) / 86400.0 + UNIX_EPOCH_JD - J2000_JD
+    mean_lon = 280.460 + 0.9856474 * n
+    anomaly = np.radians(357.528 + 0.9856003 * n)
+    ecliptic_lon = np.radians(mean_lon + 1.915 * np.sin(anomaly) + 0.020 * np.sin(2 * anomaly))
+    obliquity = np.radians(23.439 - 4e-7 * n)
+    declination = np.degrees(np.arcsin(np.sin(obliquity) * np.sin(ecliptic_lon)))
+    right_ascension = np.degrees(np.arctan2(np.cos(obliquity) * np.sin(ecliptic_lon), np.cos(ecliptic_lon)))
+    gmst = 280.46061837 + 360.98564736629 * n
+    lon = (right_ascension - gmst + 180.0) % 360.0 - 180.0
+    return declination, lon
+
+
+def sun_elevation(lats, lons, t):
+    """Sun elevation in degrees at each (lat, lon, time)"""
+    declination, sub_lon = subsolar_point(t)
+    phi, delta = np.radians(lats), np.radians(declination)
+    hour_angle = np.radians(np.asarray(lons) - sub_lon)
+    sin_elev = np.sin(phi) * np.sin(delta) + np.cos(phi) * np.cos(delta) * np.cos(hour_angle)
+    return np.degrees(np.arcsin(np.clip(sin_elev, -1.0, 1.0)))
+
+
+def night_shape(declination):
+    """Night-side polygon as (lon offsets from the subsolar point, lats), closed over the dark pole"""
+    dlon = np.arange(-SHAPE_SPAN_DEG, SHAPE_SPAN_DEG + SHAPE_STEP_DEG / 2, SHAPE_STEP_DEG)
+    tan_decl = np.tan(np.radians(declination))
+    if abs(tan_decl) < MIN_TAN_DECLINATION: tan_decl = MIN_TAN_DECLINATION if tan_decl >= 0 else -MIN_TAN_DECLINATION
+    lats = np.degrees(np.arctan(-np.cos(np.radians(dlon)) / tan_decl))
+    # Northern summer: the north pole is lit, so the night side closes over the south pole
+    pole = -90.0 if declination >= 0 else 90.0
+    return np.concatenate([dlon, [dlon[-1], dlon[0]]]), np.concatenate([lats, [pole, pole]])
+
+
+def nightfall(route, departure, flight_seconds):
+    """[(progress, lat, lon)] where the route enters darkness; rows are evenly spaced in flight time"""
+    fractions = np.linspace(0.0, 1.0, len(route.lats))
+    elevation = sun_elevation(route.lats, route.lons, departure + fractions * flight_seconds) - NIGHT_ELEVATION_DEG
+    dusk = np.nonzero((elevation[:-1] >= 0) & (elevation[1:] < 0))[0]
+    # Linear between the two rows either side of the crossing
+    f = elevation[dusk] / (elevation[dusk] - elevation[dusk + 1])
+    progress = (dusk + f) / route.steps
+    lats = route.lats[dusk] + (route.lats[dusk + 1] - route.lats[dusk]) * f
+    lons = route.lons[dusk] + (route.lons[dusk + 1] - route.lons[dusk]) * f
+    return list(zip(progress.tolist(), lats.tolist(), lons.tolist()))
+
+
+class SessionDaylight:
+    """The sun along one session's flight; update() says when the map needs to hear about it"""
+
+    def __init__(self, route, flight_seconds, progress=0.0, now=None):
+        self.route = route
+        self.flight_seconds = float(flight_seconds)
+        # Resumed sessions departed as long ago as the part already flown
+        self.departure = (time.time() if now is None else now) - progress * self.flight_seconds
+        self.nightfall = nightfall(route, self.departure, self.flight_seconds)
+        self.sent_at = None     # flight time of the last subsolar point sent
+        self.shape_declination = None
+
+    def time_at(self, progress):
+        return self.departure + min(max(progress, 0.0), 1.0) * self.flight_seconds
+
+    def payload(self, declination):
+        """Terminator shape and nightfall points, shipped to the map once per flight"""
+        dlon, lats = night_shape(declination)
+        return json.dumps({"dlng": np.round(dlon, 2).tolist(), "lat": np.round(lats, 3).tolist(),
+                           "nightfall": [{"progress": round(p, 5), "lat": round(lat, 5), "lng": round(lon, 5)}
+                                         for p, lat, lon in self.nightfall]}, separators=(",", ":"))
+
+    def update(self, progress):
+        """(shape payload or None, subsolar (lat, lon) or None): only once the sun has moved DAYLIGHT_STEP_S"""
+        t = self.time_at(progress)
+        if self.sent_at is not None and abs(t - self.sent_at) < DAYLIGHT_STEP_S: return None, None
+        self.sent_at = t
+        declination, lon = (float(v) for v in subsolar_point(t))
+        shape = None
+        if self.shape_declination is None or abs(declination - self.shape_declination) >= DECLINATION_STEP_DEG:
+            self.shape_declination = declination
+            shape = self.payload(declination)
+        return shape, (declination, lon)
+
+
+def _parse_time(text):
+    if not text: return time.time()
+    moment = datetime.fromisoformat(text)
+    if moment.tzinfo is None: moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sun position and nightfall along FlightFocus Pro routes")
+    parser.add_argument("command", nargs="?", choices=["sun", "route"], default="sun")
+    parser.add_argument("--time", help="sun: UTC time, ISO 8601 (default: now)")
+    parser.add_argument("-f", "--flight", help="route: part of a route name or a callsign prefix")
+    parser.add_argument("--depart", help="route: departure, ISO 8601 UTC (default: now)")
+    parser.add_argument("--catalog", help="compiled route catalog (default: built-in routes)")
+    args = parser.parse_args(argv)
+
+    if args.command == "sun":
+        t = _parse_time(args.time)
+        lat, lon = subsolar_point(t)
+        print(f"{datetime.fromtimestamp(t, timezone.utc):%Y-%m-%d %H:%M} UTC  sun overhead at {lat:+.2f}, {lon:+.2f}")
+        return 0
+
+    from flights import REAL_WORLD_FLIGHTS
+    from flight_profiles import FlightProfile
+    from geodesy import great_circle_route, ROUTE_STEPS
+    from route_catalog import load_catalog
+    catalog = load_catalog(args.catalog, REAL_WORLD_FLIGHTS)
+    index = catalog.find(args.flight) if args.flight else None
+    if index is None: sys.exit(f"No route matches {args.flight!r}." if args.flight else "Pick a route with --flight.")
+    name, data = catalog.record(index)
+    profile = FlightProfile.for_flight(data)
+    route = great_circle_route(*data["coords"], fractions=profile.distance_fractions(ROUTE_STEPS))
+    departure = _parse_time(args.depart)
+    daylight = SessionDaylight(route, data["real_duration"] * 60, now=departure)
+    print(f"{name}  departs {datetime.fromtimestamp(departure, timezone.utc):%Y-%m-%d %H:%M} UTC")
+    if not daylight.nightfall: print("  no nightfall on the way")
+    for progress, lat, lon in daylight.nightfall:
+        when = datetime.fromtimestamp(daylight.time_at(progress), timezone.utc)
+        print(f"  nightfall at {progress:.0%} of the flight, {when:%H:%M} UTC, {lat:+.2f} {(lon + 180) % 360 - 180:+.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+FlightFocus Pro - team fleet
+Many concurrent sessions on one map (shared "team focus" screens):
+- every session runs on the window's shared SimClock; nothing ticks per flight
+- the map gets all routes in one message and progress updates as one batch,
+  then extrapolates every plane itself from (progress, rate)
+- Python only wakes for the next arrival
+"""
+
+import sys
+import json
+import math
+
+from flights import MAX_FOCUS_MINUTES
+from geodesy import great_circle_route
+from session_clock import SessionClock
+
+# Coarser tables than the main route: hundreds of these are shipped to the page at once
+FLEET_ROUTE_STEPS = 64
+
+
+class FleetSession:
+    __slots__ = ("id", "label", "name", "data", "route", "clock")
+
+    def __init__(self, session_id, label, name, data, route, clock):
+        self.id = session_id
+        self.label = label
+        self.name = name
+        self.data = data
+        self.route = route
+        self.clock = clock
+
+
+class Fleet:
+    """Concurrent sessions sharing one simulation clock"""
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.sessions = {}
+        self._next_id = 1
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def add(self, name, data, focus_minutes, label=None, elapsed_s=0.0):
+        route = great_circle_route(*data["coords"], steps=FLEET_ROUTE_STEPS)
+        clock = SessionClock(focus_minutes * 60, self.sim)
+        clock.started_at -= elapsed_s  # joined a session that was already under way
+        session = FleetSession(self._next_id, label or data["callsign"], name, data, route, clock)
+        self.sessions[session.id] = session
+        self._next_id += 1
+        return session
+
+    def remove(self, session_id):
+        return self.sessions.pop(session_id, None)
+
+    def clear(self):
+        self.sessions.clear()
+
+    def pop_arrived(self):
+        arrived = [s for s in self.sessions.values() if s.clock.finished()]
+        for s in arrived: del self.sessions[s.id]
+        return arrived
+
+    def next_arrival_in(self):
+        """Simulated seconds until the next session arrives (None when the fleet is empty)"""
+        return min((s.clock.remaining() for s in self.sessions.values()), default=None)
+
+    def _rate(self, session):
+        return self.sim.rate / session.clock.total_seconds
+
+    def progress_batch(self):
+        """[[id, progress, progress per second], ...] for every session, in one message"""
+        return json.dumps([[s.id, round(s.clock.progress(), 7), self._rate(s)] for s in self.sessions.values()],
+                          separators=(",", ":"))
+
+    def payload(self):
+        """Routes and current progress of the whole fleet"""
+        flights = []
+        for s in self.sessions.values():
+            table = s.route.to_payload()
+            flights.append({"id": s.id, "label": s.label, "lat": table["lat"], "lng": table["lng"],
+                            "bearing": table["bearing"], "progress": round(s.clock.progress(), 7), "rate": self._rate(s)})
+        return json.dumps({"flights": flights}, separators=(",", ":"), ensure_ascii=False)
+
+
+def _entry_error(entry):
+    """Why a team-file entry can't become a session (None when it can)"""
+    if not isinstance(entry, dict): return "not an object"
+    minutes = entry.get("minutes", 60)
+    if isinstance(minutes, bool) or not isinstance(minutes, int) or not 0 < minutes <= MAX_FOCUS_MINUTES:
+        return f"minutes must be an integer from 1 to {MAX_FOCUS_MINUTES}"
+    elapsed = entry.get("elapsed_minutes", 0)
+    if isinstance(elapsed, bool) or not isinstance(elapsed, (int, float)) or not math.isfinite(elapsed) or elapsed < 0:
+        return "elapsed_minutes must be a number >= 0"
+    query = entry.get("flight")
+    if query is not None and not isinstance(query, str): return "flight must be a string"
+    return None
+
+
+def read_team_file(path, catalog):
+    """Team sessions from JSON: [{"who": "Alice", "flight": "BAW", "minutes": 90, "elapsed_minutes": 5}, ...]
+    -> [(name, data, minutes, label, elapsed_s)]; invalid entries and unknown flights are reported and skipped"""
+    with open(path) as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        print(f"[team] {path}: expected a list of sessions", file=sys.stderr)
+        return []
+    sessions = []
+    for n, entry in enumerate(entries, 1):
+        error = _entry_error(entry)
+        if error:
+            print(f"[team] {path} entry {n}: {error}; skipped", file=sys.stderr)
+            continue
+        minutes = entry.get("minutes", 60)
+        query = entry.get("flight")
+        index = catalog.find(query) if query else (catalog.select(minutes) or [None])[0]
+        if index is None:
+            print(f"[team] {path} entry {n}: no flight matches {query or f'{minutes} min'!r}; skipped", file=sys.stderr)
+            continue
+        name, data = catalog.record(index)
+        label = entry.get("who") or data["callsign"]
+        sessions.append((name, data, minutes, label, 60.0 * entry.get("elapsed_minutes", 0)))
+    return sessions
@@ -8,70 +8,70 @@ FlightFocus Pro - Fedora Edition (v1.2)
 
 import os
 import sys
+import time
 import math
+import argparse
+import threading
 from datetime import datetime, timedelta
 
+PROCESS_START = time.perf_counter()
+
 # --- FEDORA-SPECIFIC OPTIMIZATIONS ---
 os.environ["QTWEBENGINE_DISABLE_SANDBOX"] = "1"
 os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--disable-gpu --no-sandbox --disable-software-rasterizer"
 os.environ["QT_QPA_PLATFORMTHEME"] = "gnome" 
 
-# --- FEDORA GNOME THEME COLORS ---
-FEDORA_COLORS = {
-    "background": "#2d2d2d",      # Dark Grey (Window)
-    "surface": "#3d3d3d",         # Lighter Grey (Cards/Widgets)
-    "primary": "#367bf0",         # Fedora Blue
-    "secondary": "#2ec27e",       # Fedora Green
-    "accent": "#f9f06b",          # Fedora Yellow
-    "text": "#f6f5f4",            # White/Grey Text
-    "text_secondary": "#deddda",  # Muted Text
-    "border": "#5e5c64",          # Border Grey
-    "success": "#57e389",
-    "warning": "#f8e45c",
-    "error": "#ff7b63"
-}
-
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+from PyQt6.QtWidgets import (QApplication, QLineEdit, QCompleter, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QComboBox, QPushButton, 
                              QStackedWidget, QFrame, QGridLayout, QGroupBox,
-                             QScrollArea, QButtonGroup, QSizePolicy)
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon
-
-# --- REAL WORLD ROUTES ---
-REAL_WORLD_FLIGHTS = {
-    # Short Flights (25-90 mins)
-    "🇬🇧 LONDON → 🇫🇷 PARIS": { "coords": [51.4700, -0.4543, 49.0097, 2.5479], "real_duration": 85, "distance_km": 344, "aircraft": "Airbus A320", "callsign": "BAF123" },
-    "🇺🇸 NY (JFK) → 🇺🇸 WASHINGTON": { "coords": [40.6413, -73.7781, 38.9531, -77.4565], "real_duration": 75, "distance_km": 333, "aircraft": "Boeing 737", "callsign": "DAL456" },
-    "🇦🇪 DUBAI → 🇶🇦 DOHA": { "coords": [25.2532, 55.3657, 25.2609, 51.5651], "real_duration": 70, "distance_km": 379, "aircraft": "Airbus A320", "callsign": "QTR789" },
-    "🇯🇵 TOKYO → 🇰🇷 SEOUL": { "coords": [35.5494, 139.7798, 37.4602, 126.4407], "real_duration": 135, "distance_km": 1157, "aircraft": "Boeing 787", "callsign": "JAL234" },
-    "🇩🇪 BERLIN → 🇨🇿 PRAGUE": { "coords": [52.3667, 13.5033, 50.1008, 14.2600], "real_duration": 65, "distance_km": 280, "aircraft": "Airbus A319", "callsign": "BER567" },
-    
-    # Medium Flights (90-180 mins)
-    "🇪🇸 MADRID → 🇮🇹 ROME": { "coords": [40.4839, -3.5679, 41.8003, 12.2389], "real_duration": 145, "distance_km": 1365, "aircraft": "Airbus A321", "callsign": "IBE345" },
-    "🇺🇸 SEATTLE → 🇺🇸 SAN FRANCISCO": { "coords": [47.4502, -122.3088, 37.6213, -122.3790], "real_duration": 125, "distance_km": 1090, "aircraft": "Boeing 737", "callsign": "UAL678" },
-    "🇮🇳 MUMBAI → 🇦🇪 DUBAI": { "coords": [19.0896, 72.8656, 25.2532, 55.3657], "real_duration": 180, "distance_km": 1934, "aircraft": "Boeing 777", "callsign": "UAE901" },
-    "🇬🇧 LONDON → 🇹🇷 ISTANBUL": { "coords": [51.4700, -0.4543, 41.2768, 28.7293], "real_duration": 235, "distance_km": 2502, "aircraft": "Airbus A330", "callsign": "THY123" },
-    
-    # Long Flights (180-360 mins)
-    "🇺🇸 NEW YORK → 🇬🇧 LONDON": { "coords": [40.6413, -73.7781, 51.4700, -0.4543], "real_duration": 415, "distance_km": 5566, "aircraft": "Boeing 777", "callsign": "BAW001" },
-    "🇯🇵 TOKYO → 🇸🇬 SINGAPORE": { "coords": [35.5494, 139.7798, 1.3644, 103.9915], "real_duration": 440, "distance_km": 5328, "aircraft": "Boeing 787", "callsign": "SIA012" },
-    "🇩🇪 FRANKFURT → 🇺🇸 NEW YORK": { "coords": [50.0379, 8.5622, 40.6413, -73.7781], "real_duration": 510, "distance_km": 6205, "aircraft": "Airbus A380", "callsign": "DLH403" },
-    
-    # Ultra Long Haul (360+ mins)
-    "🇺🇸 LOS ANGELES → 🇦🇺 SYDNEY": { "coords": [33.9416, -118.4085, -33.9399, 151.1753], "real_duration": 900, "distance_km": 12051, "aircraft": "Boeing 787", "callsign": "QFA012" },
-    "🇬🇧 LONDON → 🇦🇺 PERTH": { "coords": [51.4700, -0.4543, -31.9385, 115.9672], "real_duration": 1020, "distance_km": 14498, "aircraft": "Boeing 787", "callsign": "QFA009" },
-    "🇶🇦 DOHA → 🇳🇿 AUCKLAND": { "coords": [25.2609, 51.5651, -37.0082, 174.7850], "real_duration": 960, "distance_km": 14535, "aircraft": "Boeing 777", "callsign": "QTR920" }
-}
-
-FOCUS_PRESETS = [
-    ("Quick Focus", 25), ("Standard Session", 40), ("Deep Work", 60), ("Extended Focus", 90),
-    ("Movie Length", 120), ("Study Block", 180), ("Work Shift", 240), ("Marathon", 360)
-]
-
-# --- MAP TEMPLATE ---
-MAP_HTML_TEMPLATE = """
+                             QScrollArea, QButtonGroup, QSizePolicy, QListView,
+                             QAbstractItemView, QStyledItemDelegate, QStyle, QMessageBox)
+from PyQt6.QtCore import QTimer, Qt, pyqtSignal, pyqtSlot, QSize, QUrl, QEvent, QAbstractListModel, QModelIndex, QRect, QRectF, QSettings
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPainter, QPen, QShortcut, QKeySequence
+
+from flights import REAL_WORLD_FLIGHTS, FOCUS_PRESETS, MAX_FOCUS_MINUTES, telemetry, format_hms
+from flight_profiles import FlightProfile, ProfileTable
+from geodesy import great_circle_route, ROUTE_STEPS
+from daylight import SessionDaylight
+from map_bridge import MapBridge
+from session_clock import SessionClock, SimClock
+from session_replay import SessionRecorder
+from session_history import SessionHistory, DEFAULT_HISTORY_PATH
+from session_checkpoint import SessionCheckpoint, DEFAULT_CHECKPOINT_PATH
+from fleet import Fleet, read_team_file
+from instrumentation import Profiler, NULL_PROFILER, process_rss_mb
+from route_catalog import RouteCatalog, load_catalog, route_cities, DEFAULT_CATALOG_PATH
+from airports import AirportIndex, AIRPORTS_PATH
+from route_search import RouteSearchIndex
+from tile_prefetch import TilePrefetcher, plan_tiles
+from theme import Theme, COLORS, THEME_MODES, set_state
+from status_server import StatusServer, StatusSession, DEFAULT_SOCKET_PATH
+# QtWebEngine (and the tile cache that plugs into it) is imported lazily, see ensure_web_view()
+
+# Profiler sampling period and how many samples between rotating-log flushes
+PROFILE_INTERVAL_MS = 1000
+PROFILE_LOG_EVERY = 10
+
+# "web" = Leaflet page in QtWebEngine, "native" = QPainter view (native_map.py); remembered in QSettings
+MAP_RENDERERS = ("web", "native")
+SETTINGS_ORG, SETTINGS_APP = "FlightFocus", "FlightFocusPro"
+
+# Chromium spin-up is started this long after the setup page first paints
+WEB_WARMUP_DELAY_MS = 200
+
+# While typing a search, the top match is only selected (and its tiles prefetched) once keystrokes pause this long
+SELECT_DEBOUNCE_MS = 300
+
+# A telemetry tick this far off schedule means we were suspended or stalled
+RESYNC_JITTER_S = 1.0
+
+# Screen lock is reported on the session bus (freedesktop first, GNOME Shell as fallback)
+SCREENSAVER_SERVICES = (("org.freedesktop.ScreenSaver", "/org/freedesktop/ScreenSaver"),
+                        ("org.gnome.ScreenSaver", "/org/gnome/ScreenSaver"))
+
+# --- MAP PAGE ---
+# Loaded once per window and driven through the QWebChannel bridge (see map_bridge.py)
+MAP_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -87,221 +87,571 @@ MAP_HTML_TEMPLATE = """
         
         .progress-label { position: absolute; background: rgba(45, 45, 45, 0.95); color: #f6f5f4; padding: 6px 12px; border-radius: 6px; font-size: 13px; font-weight: bold; white-space: nowrap; transform: translate(-50%, -60px); border: 2px solid #367bf0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3); }
         .info-panel { position: absolute; top: 20px; right: 20px; background: rgba(45, 45, 45, 0.95); border: 2px solid #5e5c64; border-radius: 12px; padding: 20px; color: #f6f5f4; font-size: 14px; min-width: 240px; backdrop-filter: blur(10px); z-index: 1000; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3); }
+        .info-panel.idle { display: none; }
         .route-info { margin: 8px 0; color: #deddda; line-height: 1.5; }
         .flight-id { font-size: 18px; font-weight: bold; color: #57e389; margin-bottom: 12px; border-bottom: 2px solid #5e5c64; padding-bottom: 8px; }
+        .leaflet-night-pane { pointer-events: none; }
+        .sun-icon { font-size: 26px; line-height: 32px; text-align: center; filter: drop-shadow(0 0 10px rgba(249, 240, 107, 0.9)); }
+        .nightfall-label { position: absolute; background: rgba(20, 24, 40, 0.92); color: #f6f5f4; padding: 4px 10px; border-radius: 6px; font-size: 12px; font-weight: bold; white-space: nowrap; transform: translate(-50%, 14px); border: 2px solid #5e5c64; }
+        .leaflet-fleet-pane canvas { position: absolute; top: 0; left: 0; pointer-events: none; }
         .fedora-header { position: absolute; top: 20px; left: 20px; background: rgba(54, 123, 240, 0.9); color: white; padding: 10px 20px; border-radius: 8px; font-weight: bold; font-size: 16px; z-index: 1000; box-shadow: 0 4px 12px rgba(54, 123, 240, 0.4); }
     </style>
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
-    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <link rel="stylesheet" href="ffcache://assets/leaflet.css" />
+    <script src="ffcache://assets/leaflet.js"></script>
+    <script src="ffcache://qt/qtwebchannel/qwebchannel.js"></script>
 </head>
 <body>
     <div id="map"></div>
     <div class="fedora-header">✈️ FlightFocus Pro - Fedora Edition</div>
-    <div class="info-panel">
-        <div class="flight-id">✈️ FLIGHT_ID_VAL</div>
-        <div class="route-info">📏 Distance: DISTANCE_VAL km</div>
-        <div class="route-info">🛩️ Aircraft: AIRCRAFT_VAL</div>
-        <div class="route-info">🕐 Real Duration: DURATION_VAL</div>
-        <div class="route-info">📍 Route: START_CITY → END_CITY</div>
-        <div class="route-info">⚡ Speed: SPEED_VAL</div>
+    <div class="info-panel idle" id="info-panel">
+        <div class="flight-id">✈️ <span id="info-callsign"></span></div>
+        <div class="route-info">📏 Distance: <span id="info-distance"></span> km</div>
+        <div class="route-info">🛩️ Aircraft: <span id="info-aircraft"></span></div>
+        <div class="route-info">🕐 Real Duration: <span id="info-duration"></span></div>
+        <div class="route-info">📍 Route: <span id="info-route"></span></div>
+        <div class="route-info">⚡ Speed: <span id="info-speed"></span></div>
     </div>
     <script>
-        var startLat = START_LAT_VAL; var startLng = START_LNG_VAL;
-        var endLat = END_LAT_VAL; var endLng = END_LNG_VAL;
-        var focusDuration = FOCUS_DURATION_VAL; 
-        var realDuration = REAL_DURATION_VAL;
-        var speedMultiplier = (realDuration / focusDuration).toFixed(1);
-        var animationDuration = realDuration / speedMultiplier;
-
-        var map = L.map('map', { zoomControl: true, attributionControl: false, fadeAnimation: true, zoomAnimation: true }).setView([startLat, startLng], 3);
-        L.tileLayer('https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png', { maxZoom: 19, subdomains: 'abcd' }).addTo(map);
-
-        // --- GREAT CIRCLE CALCULATION ---
-        function toRad(deg) { return deg * Math.PI / 180; }
-        function toDeg(rad) { return rad * 180 / Math.PI; }
-
-        // Calculate Bearing (Direction) between two points
-        function calculateBearing(lat1, lon1, lat2, lon2) {
-            var phi1 = toRad(lat1), lambda1 = toRad(lon1);
-            var phi2 = toRad(lat2), lambda2 = toRad(lon2);
-            var y = Math.sin(lambda2 - lambda1) * Math.cos(phi2);
-            var x = Math.cos(phi1) * Math.sin(phi2) - Math.sin(phi1) * Math.cos(phi2) * Math.cos(lambda2 - lambda1);
-            var theta = Math.atan2(y, x);
-            return (toDeg(theta) + 360) % 360;
-        }
+        var map = L.map('map', { zoomControl: true, attributionControl: false, fadeAnimation: true, zoomAnimation: true }).setView([30, 0], 2);
+        L.tileLayer('ffcache://tiles/{s}/{z}/{x}/{y}{r}.png', { maxZoom: 19, subdomains: 'abcd' }).addTo(map);
 
-        var routeCoordinates = [];
-        var steps = 150; // More steps for smoother curve
-        for(var i = 0; i <= steps; i++) {
-            var f = i / steps;
-            var lat = startLat + (endLat - startLat) * f;
-            var lng = startLng + (endLng - startLng) * f;
-            // Handle date line crossing simply for visualization
-            if(Math.abs(endLng - startLng) > 180) {
-                if(startLng < 0) startLng += 360; if(endLng < 0) endLng += 360;
-                lng = startLng + (endLng - startLng) * f; if(lng > 180) lng -= 360;
-            }
-            routeCoordinates.push([lat, lng]);
+        var infoPanel = document.getElementById('info-panel');
+        var infoFields = {};
+        ['callsign', 'distance', 'aircraft', 'duration', 'route', 'speed'].forEach(function(k) {
+            infoFields[k] = document.getElementById('info-' + k);
+        });
+
+        // --- GREAT CIRCLE TABLE (precomputed in Python, see geodesy.py) ---
+        var route = null, steps = 0, routeCoordinates = [];
+
+        // Table lookup only: linear blend between neighbouring slerp waypoints, bearing per segment
+        function tableAt(table, progress) {
+            var n = table.lat.length - 1;
+            var x = Math.min(Math.max(progress, 0), 1) * n;
+            var i = Math.min(Math.floor(x), n - 1);
+            var f = x - i;
+            return {
+                lat: table.lat[i] + (table.lat[i + 1] - table.lat[i]) * f,
+                lng: table.lng[i] + (table.lng[i + 1] - table.lng[i]) * f,
+                bearing: table.bearing[i]
+            };
         }
 
-        var pathLine = L.polyline(routeCoordinates, { color: '#367bf0', weight: 4, opacity: 0.9, dashArray: '12, 12', lineCap: 'round', lineJoin: 'round' }).addTo(map);
-        map.fitBounds(pathLine.getBounds(), {padding: [120, 120]});
+        function routeAt(progress) { return tableAt(route, progress); }
+
+        // Map layers are created once and re-used by every session
+        var pathLine = L.polyline([], { color: '#367bf0', weight: 4, opacity: 0.9, dashArray: '12, 12', lineCap: 'round', lineJoin: 'round' });
 
         // SVG Plane pointing UP (North) by default
         var svgPlane = `<div class="plane-wrapper"><svg viewBox="0 0 24 24" fill="#367bf0" xmlns="http://www.w3.org/2000/svg"><path d="M21 16v-2l-8-5V3.5c0-.83-.67-1.5-1.5-1.5S10 2.67 10 3.5V9l-8 5v2l8-2.5V19l-2 1.5V22l3.5-1 3.5 1v-1.5L13 19v-5.5l8 2.5z"/></svg></div>`;
         var planeIcon = L.divIcon({ html: svgPlane, className: 'plane-icon', iconSize: [56, 56], iconAnchor: [28, 28] });
-        var marker = L.marker([startLat, startLng], {icon: planeIcon}).addTo(map);
+        var marker = L.marker([0, 0], {icon: planeIcon});
 
         var progressLabel = L.divIcon({ html: '<div class="progress-label">DEPARTING FROM FEDORA WORKSTATION</div>', className: '', iconSize: [0, 0] });
-        var progressMarker = L.marker([startLat, startLng], { icon: progressLabel }).addTo(map);
+        var progressMarker = L.marker([0, 0], { icon: progressLabel });
 
-        var startTime = Date.now();
-        var endTime = startTime + (animationDuration * 1000);
+        // Progress is pushed from Python (setProgress) and extrapolated locally between syncs
+        var syncProgress = 0, syncTime = 0, progressRate = 0, durationMs = 1;
 
-        function animate() {
-            var now = Date.now();
-            var remaining = endTime - now;
-            var progress = 1 - (remaining / (animationDuration * 1000));
-            
-            if (progress >= 1) {
-                marker.setLatLng([endLat, endLng]);
-                progressMarker.setLatLng([endLat, endLng]);
-                document.querySelector('.progress-label').textContent = 'ARRIVED ✓ FOCUS COMPLETE';
-                
-                // Final rotation adjustment
-                var finalBearing = calculateBearing(routeCoordinates[steps-1][0], routeCoordinates[steps-1][1], endLat, endLng);
-                var el = document.querySelector('.plane-wrapper');
-                if(el) el.style.transform = `rotate(${finalBearing}deg)`;
-                return;
+        function progressAt(now) { return Math.min(syncProgress + progressRate * (now - syncTime) / 1000, 1); }
+
+        // --- RENDER SCHEDULER ---
+        // Only touches the DOM when the plane moves a visible pixel, turns, or the percent changes,
+        // and sleeps until the next such change instead of running every animation frame.
+        var MIN_INTERVAL_MS = 16, MAX_INTERVAL_MS = 500;
+        var planeEl = null, labelEl = null, labelSuffix = '';
+        var lastPx = null, lastBearing = null, lastPercent = -1;
+        var pendingTimer = null, pendingFrame = null, running = false;
+        var renderStats = { ticks: 0, renders: 0, fps: 0, intervalMs: 0, windowStart: performance.now(), windowRenders: 0, renderMs: 0, maxRenderMs: 0 };
+        var bridge = null, firstFramePending = false;
+
+        function render(progress) {
+            var pos = routeAt(progress);
+            var px = map.latLngToContainerPoint([pos.lat, pos.lng]);
+            var drawn = false;
+
+            if (!lastPx || Math.abs(px.x - lastPx.x) >= 1 || Math.abs(px.y - lastPx.y) >= 1) {
+                marker.setLatLng([pos.lat, pos.lng]);
+                progressMarker.setLatLng([pos.lat, pos.lng]);
+                lastPx = px; drawn = true;
+            }
+            if (pos.bearing !== lastBearing) {
+                planeEl.style.transform = `rotate(${pos.bearing}deg)`;
+                lastBearing = pos.bearing; drawn = true;
             }
-            
-            var currentLat = startLat + (endLat - startLat) * progress;
-            var currentLng = startLng + (endLng - startLng) * progress;
-            
-            // Calculate NEXT position slightly ahead to get tangent bearing
-            var nextProgress = Math.min(progress + 0.01, 1);
-            var nextLat = startLat + (endLat - startLat) * nextProgress;
-            var nextLng = startLng + (endLng - startLng) * nextProgress;
-            
-            // Calculate bearing based on geographic coordinates
-            var bearing = calculateBearing(currentLat, currentLng, nextLat, nextLng);
-            
-            marker.setLatLng([currentLat, currentLng]);
-            progressMarker.setLatLng([currentLat, currentLng]);
-            
-            // Update Rotation
-            var el = document.querySelector('.plane-wrapper');
-            if(el) el.style.transform = `rotate(${bearing}deg)`;
-            
             var percent = Math.round(progress * 100);
-            var hours = Math.floor(focusDuration / 3600);
-            var minutes = Math.floor((focusDuration % 3600) / 60);
-            document.querySelector('.progress-label').textContent = 'FEDORA FOCUS: ' + percent + '% | Time: ' + hours + 'h ' + minutes + 'm';
-            
-            requestAnimationFrame(animate);
+            if (percent !== lastPercent) {
+                labelEl.textContent = 'FEDORA FOCUS: ' + percent + labelSuffix;
+                lastPercent = percent; drawn = true;
+            }
+            return { pos: pos, px: px, percent: percent, drawn: drawn };
+        }
+
+        // Milliseconds until the next visible change: one screen pixel of travel or the next percent step
+        function nextChangeIn(progress, state) {
+            var ahead = routeAt(Math.min(progress + 1000 / durationMs, 1));
+            var aheadPx = map.latLngToContainerPoint([ahead.lat, ahead.lng]);
+            var pxPerSec = Math.max(Math.abs(aheadPx.x - state.px.x), Math.abs(aheadPx.y - state.px.y));
+            var untilPixel = pxPerSec > 0 ? 1000 / pxPerSec : MAX_INTERVAL_MS;
+            var untilPercent = ((state.percent + 0.5) / 100 - progress) * durationMs;
+            return Math.min(Math.max(Math.min(untilPixel, untilPercent), MIN_INTERVAL_MS), MAX_INTERVAL_MS);
+        }
+
+        function cancelScheduled() {
+            clearTimeout(pendingTimer); cancelAnimationFrame(pendingFrame);
+        }
+
+        function schedule(delay) {
+            cancelScheduled();
+            renderStats.intervalMs = delay;
+            if (delay <= MIN_INTERVAL_MS) pendingFrame = requestAnimationFrame(animate);
+            else pendingTimer = setTimeout(animate, delay);
+        }
+
+        // One scheduler for everything on the map: the session's own plane and the whole fleet layer
+        function animate() {
+            if (!running && !fleet.flights.length) return;
+            var t0 = performance.now();
+            var drawn = false, next = MAX_INTERVAL_MS;
+            renderStats.ticks++;
+
+            if (running) {
+                var progress = progressAt(t0);
+                if (progress >= 1) {
+                    marker.setLatLng(routeCoordinates[steps]);
+                    progressMarker.setLatLng(routeCoordinates[steps]);
+                    labelEl.textContent = 'ARRIVED ✓ FOCUS COMPLETE';
+                    // Final rotation adjustment
+                    planeEl.style.transform = `rotate(${route.bearing[steps]}deg)`;
+                    running = false; drawn = true;
+                } else {
+                    var state = render(progress);
+                    drawn = state.drawn;
+                    next = nextChangeIn(progress, state);
+                }
+            }
+            if (fleet.flights.length) {
+                drawFleet(t0);
+                drawn = true;
+                next = Math.min(next, fleet.nextMs);
+            }
+
+            var now = performance.now();
+            if (drawn) {
+                renderStats.renders++; renderStats.windowRenders++;
+                // Exponential moving average of the script-side cost of one frame
+                renderStats.renderMs += ((now - t0) - renderStats.renderMs) * 0.1;
+                renderStats.maxRenderMs = Math.max(renderStats.maxRenderMs, now - t0);
+            }
+            if (firstFramePending && running) { firstFramePending = false; bridge.notifyFirstFrame(); }
+
+            if (now - renderStats.windowStart >= 1000) {
+                renderStats.fps = renderStats.windowRenders * 1000 / (now - renderStats.windowStart);
+                renderStats.windowStart = now; renderStats.windowRenders = 0;
+            }
+            if (running || fleet.flights.length) schedule(next);
+        }
+
+        // --- FLEET LAYER ---
+        // Concurrent team sessions: every plane and label is drawn into one canvas per tick
+        // (no per-flight DOM nodes or CSS filters); routes are cached in a second canvas.
+        var PLANE_PATH = new Path2D('M21 16v-2l-8-5V3.5c0-.83-.67-1.5-1.5-1.5S10 2.67 10 3.5V9l-8 5v2l8-2.5V19l-2 1.5V22l3.5-1 3.5 1v-1.5L13 19v-5.5l8 2.5z');
+        var FLEET_PLANE_PX = 26, FLEET_MARGIN_PX = 40;
+        var fleet = { flights: [], byId: {}, canvas: null, ctx: null, routes: null, routesDirty: true,
+                      width: 0, height: 0, origin: null, nextMs: MAX_INTERVAL_MS };
+
+        function ensureFleetCanvas() {
+            if (fleet.canvas) return;
+            var pane = map.createPane('fleet');
+            pane.classList.add('leaflet-fleet-pane');
+            pane.style.zIndex = 450;  // above routes (400), below the session's own plane (600)
+            fleet.canvas = L.DomUtil.create('canvas', '', pane);
+            fleet.ctx = fleet.canvas.getContext('2d');
+            fleet.routes = document.createElement('canvas');
+            resizeFleet();
+        }
+
+        function resizeFleet() {
+            var size = map.getSize(), dpr = window.devicePixelRatio || 1;
+            [fleet.canvas, fleet.routes].forEach(function(c) { c.width = size.x * dpr; c.height = size.y * dpr; });
+            fleet.canvas.style.width = size.x + 'px'; fleet.canvas.style.height = size.y + 'px';
+            fleet.width = size.x; fleet.height = size.y; fleet.routesDirty = true;
+        }
+
+        function drawFleetRoutes() {
+            var ctx = fleet.routes.getContext('2d'), dpr = window.devicePixelRatio || 1;
+            ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+            ctx.clearRect(0, 0, fleet.width, fleet.height);
+            ctx.strokeStyle = 'rgba(54, 123, 240, 0.35)'; ctx.lineWidth = 1.5;
+            ctx.beginPath();
+            fleet.flights.forEach(function(f) {
+                for (var i = 0; i < f.lat.length; i++) {
+                    var p = map.latLngToContainerPoint([f.lat[i], f.lng[i]]);
+                    if (i) ctx.lineTo(p.x, p.y); else ctx.moveTo(p.x, p.y);
+                }
+            });
+            ctx.stroke();
+            fleet.routesDirty = false;
+        }
+
+        function drawFleet(now) {
+            var ctx = fleet.ctx, dpr = window.devicePixelRatio || 1;
+            // The pane pans with the map; keep the canvas pinned to the viewport
+            fleet.origin = map.containerPointToLayerPoint([0, 0]);
+            L.DomUtil.setPosition(fleet.canvas, fleet.origin);
+            if (fleet.routesDirty) drawFleetRoutes();
+            ctx.setTransform(1, 0, 0, 1, 0, 0);
+            ctx.clearRect(0, 0, fleet.canvas.width, fleet.canvas.height);
+            ctx.drawImage(fleet.routes, 0, 0);
+
+            var until = MAX_INTERVAL_MS, scale = FLEET_PLANE_PX / 24;
+            ctx.font = 'bold 11px Cantarell, sans-serif';
+            ctx.textBaseline = 'middle';
+            ctx.lineWidth = 3; ctx.strokeStyle = 'rgba(45, 45, 45, 0.9)';
+            for (var k = 0; k < fleet.flights.length; k++) {
+                var f = fleet.flights[k];
+                var progress = Math.min(f.progress + f.rate * (now - f.syncTime) / 1000, 1);
+                var pos = tableAt(f, progress);
+                var px = map.latLngToContainerPoint([pos.lat, pos.lng]);
+                var percent = Math.round(progress * 100);
+                if (f.rate > 0 && progress < 1) {
+                    // Same wakeup rule as the session's plane: one pixel of travel or the next percent
+                    var ahead = tableAt(f, Math.min(progress + f.rate, 1));
+                    var aheadPx = map.latLngToContainerPoint([ahead.lat, ahead.lng]);
+                    var pxPerSec = Math.max(Math.abs(aheadPx.x - px.x), Math.abs(aheadPx.y - px.y));
+                    if (pxPerSec > 0) until = Math.min(until, 1000 / pxPerSec);
+                    until = Math.min(until, ((percent + 0.5) / 100 - progress) / f.rate * 1000);
+                }
+                if (px.x < -FLEET_MARGIN_PX || px.y < -FLEET_MARGIN_PX || px.x > fleet.width + FLEET_MARGIN_PX || px.y > fleet.height + FLEET_MARGIN_PX) continue;
+
+                var rad = pos.bearing * Math.PI / 180, cos = Math.cos(rad) * scale * dpr, sin = Math.sin(rad) * scale * dpr;
+                ctx.setTransform(cos, sin, -sin, cos, px.x * dpr, px.y * dpr);
+                ctx.translate(-12, -12);
+                ctx.fillStyle = progress >= 1 ? '#57e389' : '#367bf0';
+                ctx.fill(PLANE_PATH);
+
+                ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+                var text = f.label + ' ' + percent + '%';
+                ctx.strokeText(text, px.x + FLEET_PLANE_PX / 2 + 2, px.y);
+                ctx.fillStyle = '#f6f5f4';
+                ctx.fillText(text, px.x + FLEET_PLANE_PX / 2 + 2, px.y);
+            }
+            fleet.nextMs = Math.min(Math.max(until, MIN_INTERVAL_MS), MAX_INTERVAL_MS);
         }
-        setTimeout(animate, 1000);
+
+        function setFleet(payload) {
+            ensureFleetCanvas();
+            var now = performance.now();
+            fleet.flights = payload.flights;
+            fleet.byId = {};
+            fleet.flights.forEach(function(f) { f.syncTime = now; fleet.byId[f.id] = f; });
+            fleet.routesDirty = true;
+            if (fleet.flights.length) schedule(0);
+            else fleet.ctx.clearRect(0, 0, fleet.canvas.width, fleet.canvas.height);
+        }
+
+        // Batched re-sync (pause / resume / suspend): one message for every flight
+        function setFleetProgress(batch) {
+            var now = performance.now();
+            batch.forEach(function(item) {
+                var f = fleet.byId[item[0]];
+                if (f) { f.progress = item[1]; f.rate = item[2]; f.syncTime = now; }
+            });
+            if (fleet.flights.length) schedule(0);
+        }
+
+        map.on('resize', function() { if (fleet.canvas) resizeFleet(); });
+        map.on('move', function() { fleet.routesDirty = true; if (fleet.flights.length) drawFleet(performance.now()); });
+        // The canvas is not zoom-animated: hide it while Leaflet scales the panes
+        map.on('zoomstart', function() { if (fleet.canvas) fleet.canvas.style.visibility = 'hidden'; });
+        map.on('zoomend', function() { if (fleet.canvas) fleet.canvas.style.visibility = ''; fleet.routesDirty = true; });
+
+        // --- DAY / NIGHT ---
+        // The terminator shape comes once per flight (longitudes relative to the subsolar point);
+        // each update after that is just the subsolar point, and the shape is shifted here.
+        var night = { dlng: null, lat: null, sun: null, latlngs: [], layer: null, sunMarker: null, nightfall: null };
+
+        function ensureNightLayers() {
+            if (night.layer) return;
+            map.createPane('night').style.zIndex = 350;  // above tiles (200), below routes (400)
+            map.getPane('night').classList.add('leaflet-night-pane');
+            night.layer = L.polygon([], { pane: 'night', stroke: false, fillColor: '#0b1026', fillOpacity: 0.35, interactive: false });
+            night.sunMarker = L.marker([0, 0], { pane: 'night', interactive: false, keyboard: false,
+                icon: L.divIcon({ html: '<div class="sun-icon">☀️</div>', className: '', iconSize: [32, 32], iconAnchor: [16, 16] }) });
+            night.nightfall = L.layerGroup();
+        }
+
+        function placeNight() {
+            if (!night.dlng || !night.sun) return;
+            var lng = night.sun[1], pts = night.latlngs;
+            for (var i = 0; i < night.dlng.length; i++) pts[i] = [night.lat[i], night.dlng[i] + lng];
+            night.layer.setLatLngs(pts).addTo(map);
+            night.sunMarker.setLatLng(night.sun).addTo(map);
+        }
+
+        function setDaylight(payload) {
+            ensureNightLayers();
+            night.dlng = payload.dlng; night.lat = payload.lat; night.latlngs = new Array(payload.dlng.length);
+            night.nightfall.clearLayers();
+            payload.nightfall.forEach(function(p) {
+                L.circleMarker([p.lat, p.lng], { radius: 6, color: '#f6f5f4', weight: 2, fillColor: '#0b1026', fillOpacity: 1 }).addTo(night.nightfall);
+                L.marker([p.lat, p.lng], { interactive: false, keyboard: false, icon: L.divIcon({ className: '', iconSize: [0, 0],
+                    html: '<div class="nightfall-label">🌙 NIGHTFALL · ' + Math.round(p.progress * 100) + '%</div>' }) }).addTo(night.nightfall);
+            });
+            night.nightfall.addTo(map);
+            placeNight();
+        }
+
+        function moveSun(lat, lng) {
+            ensureNightLayers();
+            night.sun = [lat, lng];
+            placeNight();
+        }
+
+        function clearNight() {
+            if (!night.layer) return;
+            night.dlng = night.sun = null;
+            [night.layer, night.sunMarker, night.nightfall].forEach(function(layer) { map.removeLayer(layer); });
+        }
+
+        // Pixel speed depends on zoom, so re-plan immediately when the view changes
+        map.on('zoomend moveend', function() { lastPx = null; if (running || fleet.flights.length) schedule(0); });
+
+        // Effective frame rate for diagnostics: window.getRenderStats()
+        window.getRenderStats = function() {
+            return { fps: renderStats.fps, ticks: renderStats.ticks, renders: renderStats.renders, intervalMs: renderStats.intervalMs,
+                     renderMs: renderStats.renderMs, maxRenderMs: renderStats.maxRenderMs,
+                     heapBytes: performance.memory ? performance.memory.usedJSHeapSize : null };
+        };
+
+        // Periodic stats push for the Python-side profiler overlay (off unless requested)
+        var statsTimer = null;
+        function setStatsInterval(ms) {
+            clearInterval(statsTimer);
+            statsTimer = ms > 0 ? setInterval(function() { bridge.reportStats(JSON.stringify(window.getRenderStats())); }, ms) : null;
+        }
+
+        // --- BRIDGE COMMANDS ---
+        function loadRoute(payload) {
+            reset();
+            route = payload.route;
+            steps = route.lat.length - 1;
+            routeCoordinates = [];
+            for(var i = 0; i <= steps; i++) routeCoordinates.push([route.lat[i], route.lng[i]]);
+
+            var info = payload.info;
+            for (var k in infoFields) infoFields[k].textContent = info[k];
+            infoPanel.classList.remove('idle');
+            labelSuffix = '% | Time: ' + Math.floor(payload.focusSeconds / 3600) + 'h ' + Math.floor((payload.focusSeconds % 3600) / 60) + 'm';
+
+            pathLine.setLatLngs(routeCoordinates).addTo(map);
+            marker.setLatLng(routeCoordinates[0]).addTo(map);
+            progressMarker.setLatLng(routeCoordinates[0]).addTo(map);
+            planeEl = marker.getElement().querySelector('.plane-wrapper');
+            labelEl = progressMarker.getElement().querySelector('.progress-label');
+            labelEl.textContent = 'DEPARTING FROM FEDORA WORKSTATION';
+
+            // The view may have been resized while the page was hidden behind the setup page
+            map.invalidateSize(false);
+            map.fitBounds(pathLine.getBounds(), {padding: [120, 120]});
+        }
+
+        function setProgress(progress, ratePerSec) {
+            if (!route) return;
+            syncProgress = progress; syncTime = performance.now(); progressRate = ratePerSec;
+            durationMs = ratePerSec > 0 ? 1000 / ratePerSec : 1e12;
+            if (!running) firstFramePending = true;
+            running = true;
+            schedule(0);
+        }
+
+        function reset() {
+            running = false; cancelScheduled();
+            route = null; steps = 0; routeCoordinates = [];
+            lastPx = null; lastBearing = null; lastPercent = -1;
+            [pathLine, marker, progressMarker].forEach(function(layer) { map.removeLayer(layer); });
+            clearNight();
+            infoPanel.classList.add('idle');
+            if (fleet.flights.length) schedule(0);
+        }
+
+        new QWebChannel(qt.webChannelTransport, function(channel) {
+            bridge = channel.objects.bridge;
+            bridge.loadRouteRequested.connect(function(json) { loadRoute(JSON.parse(json)); });
+            bridge.progressChanged.connect(setProgress);
+            bridge.resetRequested.connect(reset);
+            bridge.statsIntervalChanged.connect(setStatsInterval);
+            bridge.fleetChanged.connect(function(json) { setFleet(JSON.parse(json)); });
+            bridge.fleetProgressChanged.connect(function(json) { setFleetProgress(JSON.parse(json)); });
+            bridge.daylightChanged.connect(function(json) { setDaylight(JSON.parse(json)); });
+            bridge.sunMoved.connect(moveSun);
+            bridge.notifyReady();
+        });
     </script>
 </body>
 </html>
 """
 
-class FlightCard(QFrame):
-    """Custom widget for displaying flight information"""
-    selected = pyqtSignal(str)
-    
-    def __init__(self, flight_name, flight_data, focus_time):
-        super().__init__()
-        self.flight_name = flight_name
-        self.flight_data = flight_data
+# --- FLIGHT LIST (model/view) ---
+FLIGHT_DATA_ROLE = Qt.ItemDataRole.UserRole + 1
+SELECTED_ROLE = Qt.ItemDataRole.UserRole + 2
+
+CARD_HEIGHT = 130
+CARD_SPACING = 12
+
+def format_duration(minutes):
+    return f"{minutes // 60}h {minutes % 60:02d}m"
+
+class FlightListModel(QAbstractListModel):
+    """Lazy view over catalog rows: records are decoded only when a row is painted or selected"""
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.indices = []
+        self.focus_time = 60
+        self.selected_row = -1
+        self._records = {}   # row -> (name, data)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.indices)
+
+    def record(self, row):
+        rec = self._records.get(row)
+        if rec is None:
+            rec = self._records[row] = self.catalog.record(self.indices[row])
+        return rec
+
+    def row_of_index(self, index):
+        """Row of a catalog index, -1 if it is not listed"""
+        try:
+            return self.indices.index(index)
+        except ValueError:
+            return -1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        if role == Qt.ItemDataRole.DisplayRole: return self.record(index.row())[0]
+        if role == FLIGHT_DATA_ROLE: return self.record(index.row())[1]
+        if role == SELECTED_ROLE: return index.row() == self.selected_row
+        return None
+
+    def set_routes(self, indices, focus_time, catalog=None):
+        # Any sequence: a search result list, a range, or the catalog's lazy ClosenessOrder
+        catalog = catalog or self.catalog
+        if indices == self.indices and catalog is self.catalog:
+            # Same routes, new focus time: only the speed multiplier changed, repaint in place
+            self.focus_time = focus_time
+            if indices: self.dataChanged.emit(self.index(0), self.index(len(indices) - 1))
+            return
+        self.beginResetModel()
+        self.catalog = catalog
+        self.indices = indices
         self.focus_time = focus_time
-        
-        # Flexible height to prevent squashing
-        self.setMinimumHeight(130)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        
-        self.setStyleSheet(f"""
-            FlightCard {{
-                background-color: {FEDORA_COLORS['surface']};
-                border: 2px solid {FEDORA_COLORS['border']};
-                border-radius: 12px;
-                padding: 0px;
-            }}
-            FlightCard:hover {{
-                border-color: {FEDORA_COLORS['primary']};
-                background-color: #454545;
-            }}
-            FlightCard[selected="true"] {{
-                border-color: {FEDORA_COLORS['success']};
-                background-color: #3a4a3a;
-                border-width: 3px;
-            }}
-        """)
-        
-        layout = QVBoxLayout()
-        layout.setSpacing(8)
-        layout.setContentsMargins(16, 16, 16, 16)
-        
+        self.selected_row = -1
+        self._records.clear()
+        self.endResetModel()
+
+    def set_selected_row(self, row):
+        previous, self.selected_row = self.selected_row, row
+        for r in (previous, row):
+            if 0 <= r < len(self.indices):
+                self.dataChanged.emit(self.index(r), self.index(r), [SELECTED_ROLE])
+
+class FlightCardDelegate(QStyledItemDelegate):
+    """Paints the flight cards on demand; only visible rows ever exist as pixels"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Cantarell", 12); self.title_font.setBold(True); self.title_font.setPixelSize(16)
+        self.time_font = QFont("Cantarell"); self.time_font.setBold(True); self.time_font.setPixelSize(14)
+        self.detail_font = QFont("Cantarell"); self.detail_font.setPixelSize(13)
+        self.button_font = QFont("Cantarell"); self.button_font.setBold(True); self.button_font.setPixelSize(13)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), CARD_HEIGHT)
+
+    def paint(self, painter, option, index):
+        name = index.data(Qt.ItemDataRole.DisplayRole)
+        data = index.data(FLIGHT_DATA_ROLE)
+        selected = index.data(SELECTED_ROLE)
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        speed = data['real_duration'] / index.model().focus_time
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if selected: bg, border, width = COLORS['selected'], COLORS['success'], 3
+        elif hover: bg, border, width = COLORS['hover'], COLORS['primary'], 2
+        else: bg, border, width = COLORS['surface'], COLORS['border'], 2
+        card = QRectF(option.rect).adjusted(width / 2, width / 2, -width / 2, -width / 2)
+        painter.setPen(QPen(QColor(border), width))
+        painter.setBrush(QColor(bg))
+        painter.drawRoundedRect(card, 12, 12)
+
+        inner = option.rect.adjusted(16, 12, -16, -12)
+
         # Header row
-        header_layout = QHBoxLayout()
-        self.flight_label = QLabel(flight_name)
-        self.flight_label.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {FEDORA_COLORS['text']};")
-        self.flight_label.setWordWrap(True)
-        
-        time_label = QLabel(f"🕐 {self.format_duration(flight_data['real_duration'])}")
-        time_label.setStyleSheet(f"font-size: 14px; color: {FEDORA_COLORS['accent']}; font-weight: bold;")
-        
-        header_layout.addWidget(self.flight_label, stretch=1)
-        header_layout.addWidget(time_label)
-        
-        # Details row
-        details_layout = QGridLayout()
-        details_layout.setHorizontalSpacing(15)
-        details_layout.setVerticalSpacing(4)
-        
-        details_layout.addWidget(QLabel(f"📏 {flight_data['distance_km']:,} km"), 0, 0)
-        details_layout.addWidget(QLabel(f"🛩️ {flight_data['aircraft']}"), 0, 1)
-        details_layout.addWidget(QLabel(f"📡 {flight_data['callsign']}"), 1, 0)
-        details_layout.addWidget(QLabel(f"⚡ {self.calculate_speed_multiplier():.1f}x speed"), 1, 1)
-        
-        # Apply style to all labels in grid
-        for i in range(details_layout.count()):
-            widget = details_layout.itemAt(i).widget()
-            if widget:
-                widget.setStyleSheet(f"color: {FEDORA_COLORS['text_secondary']}; font-size: 13px;")
+        time_text = f"🕐 {format_duration(data['real_duration'])}"
+        painter.setFont(self.time_font)
+        time_width = painter.fontMetrics().horizontalAdvance(time_text)
+        painter.setPen(QColor(COLORS['accent']))
+        header = QRect(inner.left(), inner.top(), inner.width(), 24)
+        painter.drawText(header, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, time_text)
+
+        painter.setFont(self.title_font)
+        painter.setPen(QColor(COLORS['text']))
+        title_rect = header.adjusted(0, 0, -time_width - 12, 0)
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         painter.fontMetrics().elidedText(name, Qt.TextElideMode.ElideRight, title_rect.width()))
+
+        # Details grid
+        painter.setFont(self.detail_font)
+        painter.setPen(QColor(COLORS['text_secondary']))
+        col_w = inner.width() // 2
+        details = [f"📏 {data['distance_km']:,} km", f"🛩️ {data['aircraft']}", f"📡 {data['callsign']}", f"⚡ {speed:.1f}x speed"]
+        for i, text in enumerate(details):
+            cell = QRect(inner.left() + (i % 2) * col_w, inner.top() + 30 + (i // 2) * 20, col_w, 20)
+            painter.drawText(cell, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
 
         # Select button
-        self.select_btn = QPushButton("SELECT FLIGHT")
-        self.select_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.select_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {FEDORA_COLORS['primary']}; color: white; border: none;
-                border-radius: 6px; padding: 8px 12px; font-weight: bold; font-size: 13px;
-            }}
-            QPushButton:hover {{ background-color: #4a8bf8; }}
-        """)
-        self.select_btn.clicked.connect(self.on_select)
-        
-        layout.addLayout(header_layout)
-        layout.addLayout(details_layout)
-        layout.addWidget(self.select_btn)
-        self.setLayout(layout)
-        
-    def format_duration(self, minutes):
-        return f"{minutes // 60}h {minutes % 60:02d}m"
-    
-    def calculate_speed_multiplier(self):
-        return self.flight_data['real_duration'] / self.focus_time
-    
-    def on_select(self):
-        self.selected.emit(self.flight_name)
-    
-    def set_selected(self, selected):
-        self.setProperty("selected", selected)
-        self.style().polish(self)
+        button = QRectF(inner.left(), inner.bottom() - 32, inner.width(), 32)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(COLORS['primary_hover'] if hover else COLORS['primary']))
+        painter.drawRoundedRect(button, 6, 6)
+        painter.setFont(self.button_font)
+        painter.setPen(QColor(COLORS['on_primary']))
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, "✓ SELECTED" if selected else "SELECT FLIGHT")
+
+        painter.restore()
+
+class StartupTrace:
+    """Per-phase wall-clock timings printed to stderr with --startup-trace"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.last = PROCESS_START
+        self.phases = []
+
+    def mark(self, phase):
+        if not self.enabled: return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last, now - PROCESS_START))
+        print(f"[startup] {phase:<30} +{(now - self.last) * 1000:8.1f} ms  {(now - PROCESS_START) * 1000:8.1f} ms total", file=sys.stderr)
+        self.last = now
 
 class FlightFocusPro(QMainWindow):
-    def __init__(self):
+    # Emitted from the history writer thread once a finished session is committed, and with the stats it read
+    historyChanged = pyqtSignal()
+    historyStats = pyqtSignal(object)
+    # Emitted from the status server thread: (command, arguments, concurrent future for the reply)
+    remoteCommand = pyqtSignal(str, object, object)
+    # Emitted from the search indexing thread with the finished RouteSearchIndex
+    searchIndexReady = pyqtSignal(object)
+
+    def __init__(self, catalog=None, trace=None, profiler=None, map_renderer="web", sim_clock=None, record_path=None,
+                 airports_path=AIRPORTS_PATH, history=None, checkpoint=None, resume=None,
+                 status_server=None):
         super().__init__()
         self.setWindowTitle("FlightFocus Pro - Fedora Edition")
         
@@ -312,31 +662,100 @@ class FlightFocusPro(QMainWindow):
         
         self.selected_focus_time = 60
         self.selected_flight = None
-        self.flight_cards = []
+        self.selected_flight_data = None
+        self.selected_route = None   # (catalog, index) of the selection, for its precomputed profile
+        self._profiles = (None, None)  # (catalog, ProfileTable or None)
+        self.catalog = catalog or RouteCatalog.from_flights(REAL_WORLD_FLIGHTS)
+        # With a home airport the list is generated from the airport index instead (loaded on first use)
+        self.airports_path = airports_path
+        self._airports = None
+        self.home_airport = None
+        self._generated = None     # ((home, focus minutes), catalog)
+        self._search = None        # RouteSearchIndex of the catalog on screen, built on first use
+        self._search_pending = None  # catalog whose index is being built off the UI thread
+        self.searchIndexReady.connect(self.on_search_index_ready)
         self.time_button_group = QButtonGroup(self)
         self.time_button_group.setExclusive(True)
+        self.select_timer = QTimer(self)
+        self.select_timer.setSingleShot(True)
+        self.select_timer.setInterval(SELECT_DEBOUNCE_MS)
+        self.select_timer.timeout.connect(self.select_first_flight)
+        # Resuming a checkpointed session opens straight on the flight page; the list is filled on the way back
+        self.flights_stale = resume is not None
+        
+        self.trace = trace or StartupTrace()
+        self.profiler = profiler or NULL_PROFILER
+        self.map_renderer = map_renderer
+        self.web_view = None
+        self.prefetcher = None     # created with the tile cache, see ensure_web_view()
+        self.selection_status = ""
+        self.map_bridge = MapBridge(self)
+        self.map_view = self.map_bridge  # whatever draws the flight: the page bridge or a NativeMapView
         
         self.setup_fedora_theme()
         self.init_ui()
+        # Cards are painted from theme.COLORS: a scheme switch only needs a repaint
+        self.theme.changed.connect(lambda scheme: self.flight_list.viewport().update())
+        self.trace.mark("setup + flight pages built")
+        if self.profiler.enabled: self.init_profiling()
         
+        self.clock = None
+        self.daylight = None
+        # One simulation clock drives both the dashboard and the map (warp / pause / replay)
+        self.sim = sim_clock or SimClock()
+        self.record_path = record_path
+        self.recorder = None
+        # Completed sessions go to the SQLite history (written off the UI thread); None disables it
+        self.history = history
+        self.history_session = None
+        self.history_start = (0.0, 0.0)   # (elapsed s, progress) the history row started at
+        if history is not None:
+            history.on_commit = self.historyChanged.emit
+            self.historyChanged.connect(self.refresh_history)
+            self.historyStats.connect(self.show_history)
+            QTimer.singleShot(0, self.refresh_history)
+
+        # Concurrent team sessions on the same map; one timer wakes for the next arrival only
+        self.fleet = Fleet(self.sim)
+        self.fleet_timer = QTimer(self)
+        self.fleet_timer.setSingleShot(True)
+        self.fleet_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.fleet_timer.timeout.connect(self.on_fleet_tick)
+        self.label_updates = self.label_skips = 0
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_telemetry)
+
+        # Minimized / covered / screen locked: labels stop and the map is frozen until restored
+        self.hidden = False
+        self.screen_locked = False
+        self.resume_telemetry = False
+        self.watch_screen_lock()
+
+        # Periodic crash-safe checkpoints of the running session; None disables them
+        self.checkpoint = checkpoint
+        # Local status API: reads the session clock on its own thread, asks us only for start / abort
+        self.status_server = status_server
+        if status_server is not None:
+            status_server.on_command = self.remoteCommand.emit
+            self.remoteCommand.connect(self.on_remote_command)
+        if resume is not None: self.resume_session(resume)
         
     def setup_fedora_theme(self):
-        self.setStyleSheet(f"""
-            QMainWindow {{ background-color: {FEDORA_COLORS['background']}; font-family: 'Cantarell', 'Ubuntu', sans-serif; }}
-            QLabel {{ color: {FEDORA_COLORS['text']}; font-family: 'Cantarell'; }}
-            QGroupBox {{
-                color: {FEDORA_COLORS['primary']}; font-weight: bold; font-size: 14px;
-                border: 2px solid {FEDORA_COLORS['border']}; border-radius: 12px; margin-top: 10px; padding-top: 20px;
-            }}
-            QGroupBox::title {{ subcontrol-origin: margin; left: 12px; padding: 0 8px; background-color: {FEDORA_COLORS['background']}; }}
-            QScrollArea {{ border: none; background: transparent; }}
-            QScrollBar:vertical {{ border: none; background: {FEDORA_COLORS['surface']}; width: 10px; border-radius: 5px; margin: 0; }}
-            QScrollBar::handle:vertical {{ background: {FEDORA_COLORS['border']}; border-radius: 5px; min-height: 20px; }}
-            QScrollBar::handle:vertical:hover {{ background: {FEDORA_COLORS['primary']}; }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
-        """)
+        # One cached app-wide stylesheet; widgets only carry object names / role properties
+        self.theme = Theme(self)
+        self.theme.apply(QSettings(SETTINGS_ORG, SETTINGS_APP).value("ui/theme", "system"))
+
+    def cycle_theme(self):
+        """System -> light -> dark, remembered; widgets are restyled in place"""
+        mode = self.theme.next_mode()
+        QSettings(SETTINGS_ORG, SETTINGS_APP).setValue("ui/theme", mode)
+        self.theme.apply(mode)
+        self.update_theme_button()
+
+    def update_theme_button(self):
+        icon = {"system": "🖥️", "light": "☀️", "dark": "🌙"}[self.theme.mode]
+        self.theme_btn.setText(f"{icon} {self.theme.mode.capitalize()}")
 
     def init_ui(self):
         self.central_widget = QWidget()
@@ -355,6 +774,7 @@ class FlightFocusPro(QMainWindow):
         
         self.init_setup_page()
         self.init_flight_page()
+        self.setup_page.installEventFilter(self)
         
         self.pages.addWidget(self.setup_page)
         self.pages.addWidget(self.flight_page)
@@ -366,20 +786,33 @@ class FlightFocusPro(QMainWindow):
 
         # Header
         header_container = QFrame()
-        header_container.setStyleSheet(f"background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {FEDORA_COLORS['primary']}, stop:1 {FEDORA_COLORS['secondary']});")
+        header_container.setObjectName("header")
         header_layout = QVBoxLayout(header_container)
         header_layout.setContentsMargins(30, 20, 30, 20)
         
         title_box = QHBoxLayout()
         header = QLabel("✈️ FlightFocus Pro")
-        header.setStyleSheet("font-size: 32px; font-weight: 900; color: white;")
+        header.setObjectName("headerTitle")
         badge = QLabel("  Fedora Workstation  ")
-        badge.setStyleSheet("font-size: 12px; background: rgba(0,0,0,0.2); color: white; border-radius: 10px; padding: 4px 8px;")
+        badge.setObjectName("headerBadge")
+        self.theme_btn = QPushButton()
+        self.theme_btn.setObjectName("themeButton")
+        self.theme_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.theme_btn.setToolTip("Theme: follow the system, light or dark")
+        self.theme_btn.clicked.connect(self.cycle_theme)
+        self.update_theme_button()
         
         title_box.addWidget(header)
         title_box.addWidget(badge)
         title_box.addStretch()
+        title_box.addWidget(self.theme_btn)
         header_layout.addLayout(title_box)
+
+        # Filled from the history rollups once the window is up (see refresh_history)
+        self.history_label = QLabel()
+        self.history_label.setObjectName("headerStats")
+        self.history_label.setVisible(False)
+        header_layout.addWidget(self.history_label)
         main_layout.addWidget(header_container)
 
         # Scrollable Area
@@ -400,22 +833,11 @@ class FlightFocusPro(QMainWindow):
             btn = QPushButton(f"{name}\n{minutes} min")
             btn.setMinimumHeight(70)
             btn.setProperty("minutes", minutes)
+            btn.setProperty("role", "preset")
+            btn.setProperty("length", "marathon" if minutes > 180 else "long" if minutes > 90 else "normal")
             btn.setCheckable(True)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             
-            border_col = FEDORA_COLORS['border']
-            if minutes > 180: border_col = FEDORA_COLORS['error']
-            elif minutes > 90: border_col = FEDORA_COLORS['warning']
-            
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {FEDORA_COLORS['surface']}; border: 2px solid {border_col};
-                    border-radius: 12px; color: {FEDORA_COLORS['text']}; font-weight: bold;
-                }}
-                QPushButton:checked {{ background-color: #2a3a2a; border-color: {FEDORA_COLORS['success']}; }}
-                QPushButton:hover {{ background-color: #454545; border-color: {FEDORA_COLORS['primary']}; }}
-            """)
-            
             self.time_button_group.addButton(btn)
             btn.clicked.connect(lambda checked, m=minutes: self.on_focus_time_selected(m))
             time_layout.addWidget(btn, i // 4, i % 4)
@@ -428,38 +850,71 @@ class FlightFocusPro(QMainWindow):
         custom_layout = QHBoxLayout()
         self.custom_time_input = QComboBox()
         self.custom_time_input.setEditable(True)
-        self.custom_time_input.addItems([str(i) for i in range(10, 721, 5)])
+        self.custom_time_input.addItems([str(i) for i in range(10, MAX_FOCUS_MINUTES + 1, 5)])
         self.custom_time_input.setCurrentText("60")
         self.custom_time_input.setFixedSize(120, 45)
-        self.custom_time_input.setStyleSheet(f"background: {FEDORA_COLORS['surface']}; color: white; border: 2px solid {FEDORA_COLORS['border']}; border-radius: 8px; padding-left: 10px;")
+        self.custom_time_input.setProperty("role", "field")
         
         custom_btn = QPushButton("Set Custom Time")
         custom_btn.setFixedSize(150, 45)
         custom_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        custom_btn.setStyleSheet(f"background: {FEDORA_COLORS['surface']}; color: white; border: 2px solid {FEDORA_COLORS['border']}; border-radius: 8px; font-weight: bold;")
+        custom_btn.setProperty("role", "field")
         custom_btn.clicked.connect(self.on_custom_time_set)
         
         custom_layout.addWidget(QLabel("Or Custom Minutes:"))
         custom_layout.addWidget(self.custom_time_input)
         custom_layout.addWidget(custom_btn)
         custom_layout.addStretch()
+
+        # Home airport: any focus time gets real destinations from here (blank = featured routes)
+        self.home_input = QLineEdit()
+        self.home_input.setPlaceholderText("Home airport (LHR, city, lat,lon)")
+        self.home_input.setClearButtonEnabled(True)
+        self.home_input.setFixedSize(320, 45)
+        self.home_input.setProperty("role", "field")
+        self.home_input.textEdited.connect(self.ensure_airport_completer)
+        self.home_input.editingFinished.connect(self.on_home_airport_set)
+        custom_layout.addWidget(QLabel("🏠 From:"))
+        custom_layout.addWidget(self.home_input)
         content_layout.addLayout(custom_layout)
+        self.restore_home_airport()
 
-        # Flight List
+        # Flight List: model/view so only the visible cards are painted, whatever the catalog size
         self.flights_group = QGroupBox("✈️ STEP 2: SELECT FLIGHT")
         self.flights_layout = QVBoxLayout()
-        self.flights_layout.setSpacing(12)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Search routes, cities, airport codes, callsigns")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setMinimumHeight(40)
+        self.search_input.setProperty("role", "field")
+        self.search_input.textChanged.connect(lambda text: self.update_available_flights(debounce=True))
+        self.search_input.installEventFilter(self)
+        self.flights_layout.addWidget(self.search_input)
+        self.flight_model = FlightListModel(self.catalog, self)
+        self.flight_list = QListView()
+        self.flight_list.setModel(self.flight_model)
+        self.flight_list.setItemDelegate(FlightCardDelegate(self.flight_list))
+        self.flight_list.setUniformItemSizes(True)
+        self.flight_list.setSpacing(CARD_SPACING // 2)
+        self.flight_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.flight_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.flight_list.setMouseTracking(True)
+        self.flight_list.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.flight_list.setMinimumHeight(3 * (CARD_HEIGHT + CARD_SPACING))
+        self.flight_list.setObjectName("flightList")
+        self.flight_list.clicked.connect(lambda index: self.on_flight_selected(index.row()))
+        self.flight_list.activated.connect(lambda index: self.on_flight_selected(index.row()))
+        self.flights_layout.addWidget(self.flight_list)
         self.flights_group.setLayout(self.flights_layout)
         
-        content_layout.addWidget(self.flights_group)
-        content_layout.addStretch()
+        content_layout.addWidget(self.flights_group, stretch=1)
         
         scroll_area.setWidget(content_widget)
         main_layout.addWidget(scroll_area)
 
         # Footer
         footer_container = QFrame()
-        footer_container.setStyleSheet(f"background-color: {FEDORA_COLORS['surface']}; border-top: 1px solid {FEDORA_COLORS['border']};")
+        footer_container.setObjectName("footer")
         footer_layout = QVBoxLayout(footer_container)
         footer_layout.setContentsMargins(30, 20, 30, 20)
         
@@ -467,25 +922,31 @@ class FlightFocusPro(QMainWindow):
         self.start_btn.setEnabled(False)
         self.start_btn.setMinimumHeight(60)
         self.start_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.start_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {FEDORA_COLORS['primary']}, stop:1 {FEDORA_COLORS['secondary']});
-                color: white; border: none; border-radius: 12px; font-size: 18px; font-weight: 900; letter-spacing: 1px;
-            }}
-            QPushButton:hover {{ transform: translateY(-2px); }}
-            QPushButton:disabled {{ background: {FEDORA_COLORS['border']}; color: {FEDORA_COLORS['text_secondary']}; }}
-        """)
-        self.start_btn.clicked.connect(self.start_flight)
+        self.start_btn.setObjectName("beginButton")
+        self.start_btn.clicked.connect(lambda: self.start_flight())
+
+        # Team screens: fly the selection alongside the others without leaving the setup page
+        self.add_btn = QPushButton("✚ ADD TO TEAM MAP")
+        self.add_btn.setEnabled(False)
+        self.add_btn.setMinimumHeight(60)
+        self.add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.add_btn.setObjectName("teamButton")
+        self.add_btn.clicked.connect(lambda: self.add_team_session(self.selected_flight, self.selected_flight_data, self.selected_focus_time))
+        # Only the Leaflet page draws the team fleet layer
+        self.add_btn.setVisible(self.map_renderer == "web")
         
         self.status_label = QLabel("🐧 Fedora Workstation Ready")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("margin-top: 10px; color: #888;")
+        self.status_label.setObjectName("status")
         
-        footer_layout.addWidget(self.start_btn)
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.start_btn, stretch=1)
+        buttons.addWidget(self.add_btn)
+        footer_layout.addLayout(buttons)
         footer_layout.addWidget(self.status_label)
         main_layout.addWidget(footer_container)
         
-        self.update_available_flights(show_all=True)
+        if not self.flights_stale: self.update_available_flights(show_all=True)
 
     def on_focus_time_selected(self, minutes):
         self.selected_focus_time = minutes
@@ -502,46 +963,148 @@ class FlightFocusPro(QMainWindow):
         except:
             self.custom_time_input.setCurrentText("60")
 
-    def update_available_flights(self, show_all=False):
-        while self.flights_layout.count():
-            item = self.flights_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-        self.flight_cards.clear()
-        
-        matching = []
-        if show_all:
-            matching = list(REAL_WORLD_FLIGHTS.items())
-        else:
-            for name, data in REAL_WORLD_FLIGHTS.items():
-                dur = data['real_duration']
-                if (self.selected_focus_time * 0.3) <= dur <= (self.selected_focus_time * 2.0):
-                    matching.append((name, data))
-            matching.sort(key=lambda x: abs(x[1]['real_duration'] - self.selected_focus_time))
-            if not matching:
-                all_f = list(REAL_WORLD_FLIGHTS.items())
-                all_f.sort(key=lambda x: abs(x[1]['real_duration'] - self.selected_focus_time))
-                matching = all_f[:3]
-
-        self.flights_group.setTitle(f"✈️ STEP 2: SELECT FLIGHT ({len(matching)} AVAILABLE)")
-        
-        for name, data in matching:
-            card = FlightCard(name, data, self.selected_focus_time)
-            card.selected.connect(self.on_flight_selected)
-            self.flights_layout.addWidget(card)
-            self.flight_cards.append(card)
-            
-        if self.flight_cards: self.on_flight_selected(matching[0][0])
+    def update_available_flights(self, show_all=False, debounce=False):
+        with self.profiler.span("flight_list.rebuild"):
+            catalog = self.generated_catalog() if self.home_airport is not None else self.catalog
+            matches = index = None
+            if self.search_input.text().strip():
+                # Word-prefix index lookup, not a scan: well under a millisecond per keystroke.
+                # Until the index is built the list stays unfiltered
+                index = self.search_index(catalog)
+                if index is not None: matches = index.search(self.search_input.text())
+            if matches is not None:
+                matching = (matches if show_all else index.select(matches, self.selected_focus_time)).tolist()
+            elif show_all:
+                matching = range(len(catalog))
+            else:
+                # Bisect range query over the duration-sorted catalog; the model decodes rows as they are painted
+                matching = catalog.select(self.selected_focus_time)
+            self.flight_model.set_routes(matching, self.selected_focus_time, catalog)
+
+            found = "MATCHING" if matches is not None else "AVAILABLE"
+            if self.search_input.text().strip() and index is None: found += ", INDEXING SEARCH…"
+            self.flights_group.setTitle(f"✈️ STEP 2: SELECT FLIGHT ({len(matching)} {found})")
+
+            # Keep the selection if it is still listed; otherwise the top row, once typing settles
+            row = -1
+            if self.selected_route is not None and self.selected_route[0] is catalog:
+                row = self.flight_model.row_of_index(self.selected_route[1])
+            if row >= 0:
+                self.select_timer.stop()
+                self.flight_model.set_selected_row(row)
+            elif not len(matching):
+                self.select_timer.stop()
+            elif debounce and self.selected_route is not None:
+                self.select_timer.start()
+            else:
+                self.select_first_flight()
+
+    def select_first_flight(self):
+        self.select_timer.stop()
+        if self.flight_model.rowCount(): self.on_flight_selected(0)
+
+    def search_index(self, catalog):
+        """The catalog's search index, or None while it is built on a worker thread (~0.5 s for 50k routes)"""
+        if self._search is not None and self._search.catalog is catalog: return self._search
+        if self._search_pending is not catalog:
+            self._search_pending = catalog
+            threading.Thread(target=self.build_search_index, args=(catalog,), name="search-index", daemon=True).start()
+        return None
+
+    def build_search_index(self, catalog):
+        # Worker thread: nothing here touches widgets, the result goes back through a queued signal
+        with self.profiler.span("search.index_build"):
+            index = RouteSearchIndex(catalog)
+        self.searchIndexReady.emit(index)
+
+    def on_search_index_ready(self, index):
+        # A newer catalog (another home airport or focus time) may have been requested meanwhile
+        if index.catalog is not self._search_pending: return
+        self._search, self._search_pending = index, None
+        if self.search_input.text().strip(): self.update_available_flights(debounce=True)
+
+    # --- HOME AIRPORT ---
+    def generated_catalog(self):
+        """Routes from the home airport for the current focus time (k-d tree shell query, ~1-2 ms)"""
+        key = (self.home_airport, self.selected_focus_time)
+        if self._generated is None or self._generated[0] != key:
+            routes = self.airports().routes_for(self.home_airport, self.selected_focus_time)
+            self._generated = (key, RouteCatalog.from_flights(dict(routes)))
+        return self._generated[1]
 
-    def on_flight_selected(self, flight_name):
+    def airports(self):
+        if self._airports is None:
+            self._airports = AirportIndex.load(self.airports_path)
+            self.trace.mark(f"airport index built ({len(self._airports)} airports)")
+        return self._airports
+
+    def ensure_airport_completer(self):
+        if self.home_input.completer() is not None: return
+        completer = QCompleter([self.airports().label(i) for i in range(len(self.airports()))], self.home_input)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.activated.connect(lambda text: self.on_home_airport_set())
+        self.home_input.setCompleter(completer)
+
+    def restore_home_airport(self):
+        code = QSettings(SETTINGS_ORG, SETTINGS_APP).value("routes/home_airport", "")
+        home = self.airports().find(code) if code else None
+        if home is None: return
+        self.home_airport = home
+        self.home_input.setText(self.airports().label(home))
+
+    def on_home_airport_set(self):
+        text = self.home_input.text().strip()
+        if text and self.home_airport is not None and text == self.airports().label(self.home_airport): return
+        if not text and self.home_airport is None: return
+        home = self.airports().find(text.split(" - ")[0]) if text else None
+        if text and home is None:
+            self.status_label.setText(f"❓ Unknown airport: {text}")
+            return
+        self.home_airport = home
+        QSettings(SETTINGS_ORG, SETTINGS_APP).setValue("routes/home_airport", self.airports().codes[home] if text else "")
+        if text: self.home_input.setText(self.airports().label(home))
+        self.update_available_flights()
+        where = f"routes from {self.airports().codes[home]}" if text else "featured routes"
+        self.status_label.setText(f"🏠 {self.flight_model.rowCount()} {where} for {self.selected_focus_time} minutes")
+
+    def on_flight_selected(self, row):
+        # By row, not by name: names need not be unique in a large catalog
+        if not 0 <= row < self.flight_model.rowCount(): return
+        flight_name, data = self.flight_model.record(row)
         self.selected_flight = flight_name
-        for card in self.flight_cards:
-            card.set_selected(card.flight_name == flight_name)
+        self.selected_route = (self.flight_model.catalog, self.flight_model.indices[row])
+        self.flight_model.set_selected_row(row)
         
         self.start_btn.setEnabled(True)
-        data = REAL_WORLD_FLIGHTS[flight_name]
+        self.add_btn.setEnabled(True)
+        self.selected_flight_data = data
         speed = data['real_duration'] / self.selected_focus_time
         self.start_btn.setText(f"🚀 BEGIN JOURNEY ({self.selected_focus_time}m Focus ➔ {data['real_duration']}m Flight)")
-        self.status_label.setText(f"✅ Selected: {flight_name} • Sim Speed: {speed:.1f}x")
+        self.selection_status = f"✅ Selected: {flight_name} • Sim Speed: {speed:.1f}x"
+        self.status_label.setText(self.selection_status)
+        self.prefetch_selected()
+
+    def prefetch_selected(self):
+        """Queue the selected route's tiles (first view + corridor) so BEGIN opens on a warm cache"""
+        if self.prefetcher is None or not self.selected_flight_data: return
+        with self.profiler.span("prefetch.plan"):
+            route = great_circle_route(*self.selected_flight_data['coords'])
+            size = self.map_container.size()
+            width, height = (size.width(), size.height()) if size.width() > 0 else (self.width(), self.height() - 140)
+            paths = plan_tiles(route, width, height, retina=self.devicePixelRatioF() > 1)
+        self.prefetcher.prefetch(paths)
+
+    def on_prefetch_progress(self, done, total, fetched):
+        if self.pages.currentIndex() != 0: return
+        self.status_label.setText(f"{self.selection_status} • 🗺️ Map tiles {done}/{total}")
+
+    def on_prefetch_finished(self, total, fetched):
+        if not total or self.pages.currentIndex() != 0: return
+        if fetched == total:
+            self.status_label.setText(f"{self.selection_status} • 🗺️ Map ready ({total} tiles cached)")
+        else:
+            self.status_label.setText(f"{self.selection_status} • 📴 Offline: {fetched}/{total} map tiles cached")
 
     def init_flight_page(self):
         # KEY FIX: Layout stretch factors ensure map takes all available space
@@ -549,13 +1112,20 @@ class FlightFocusPro(QMainWindow):
         layout.setSpacing(0)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        self.web_view = QWebEngineView()
-        self.web_view.setStyleSheet("background: #2d2d2d;")
-        # stretch=1 makes web_view consume all extra vertical space on maximize
-        layout.addWidget(self.web_view, stretch=1) 
+        # The web view is created by ensure_web_view() once the setup page is on screen
+        self.map_container = QWidget()
+        self.map_container.setObjectName("mapContainer")
+        self.map_layout = QVBoxLayout(self.map_container)
+        self.map_layout.setContentsMargins(0, 0, 0, 0)
+        if self.map_renderer == "native":
+            from native_map import NativeMapView
+            self.map_view = NativeMapView()
+            self.map_layout.addWidget(self.map_view)
+        # stretch=1 makes the map consume all extra vertical space on maximize
+        layout.addWidget(self.map_container, stretch=1) 
         
         dashboard = QFrame()
-        dashboard.setStyleSheet(f"background: {FEDORA_COLORS['surface']}; border-top: 3px solid {FEDORA_COLORS['primary']};")
+        dashboard.setObjectName("dashboard")
         dashboard.setFixedHeight(140)
         
         dash_layout = QGridLayout(dashboard)
@@ -566,14 +1136,15 @@ class FlightFocusPro(QMainWindow):
         self.val_alt = QLabel("0 ft")
         self.val_dist = QLabel("0 km")
         
-        for lbl, color in [(self.val_time, 'success'), (self.val_progress, 'primary'), (self.val_alt, 'warning'), (self.val_dist, 'accent')]:
-            lbl.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {FEDORA_COLORS[color]};")
+        for lbl, tone in [(self.val_time, 'success'), (self.val_progress, 'primary'), (self.val_alt, 'warning'), (self.val_dist, 'accent')]:
+            lbl.setProperty("role", "value")
+            lbl.setProperty("tone", tone)
             lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         headers = ["TIME REMAINING", "PROGRESS", "ALTITUDE", "DISTANCE LEFT"]
         for i, text in enumerate(headers):
             lbl = QLabel(text)
-            lbl.setStyleSheet(f"color: {FEDORA_COLORS['text_secondary']}; font-weight: bold; font-size: 12px;")
+            lbl.setProperty("role", "caption")
             lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
             dash_layout.addWidget(lbl, 0, i)
             
@@ -582,66 +1153,605 @@ class FlightFocusPro(QMainWindow):
         dash_layout.addWidget(self.val_alt, 1, 2)
         dash_layout.addWidget(self.val_dist, 1, 3)
         
+        self.end_btn = QPushButton("✕ END FLIGHT")
+        self.end_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.end_btn.setMinimumHeight(45)
+        self.end_btn.setProperty("role", "control")
+        self.end_btn.clicked.connect(self.end_flight)
+        dash_layout.addWidget(self.end_btn, 1, 4)
+
+        self.pause_btn = QPushButton("⏸ PAUSE")
+        self.pause_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.pause_btn.setMinimumHeight(45)
+        self.pause_btn.setProperty("role", "control")
+        self.pause_btn.clicked.connect(self.toggle_pause)
+        dash_layout.addWidget(self.pause_btn, 0, 4)
+        
         layout.addWidget(dashboard)
 
-    def start_flight(self):
+    # --- PROFILING (only wired up when started with --profile) ---
+    def init_profiling(self):
+        self.profile_overlay = QLabel(self.map_container)
+        self.profile_overlay.setObjectName("profileOverlay")
+        self.profile_overlay.move(20, 80)
+        self.profile_overlay.hide()
+        QShortcut(QKeySequence("F3"), self, activated=self.toggle_profile_overlay)
+        self.profile_map_view()
+
+        self.profile_ticks = 0
+        self.profile_timer = QTimer(self)
+        self.profile_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.profile_timer.timeout.connect(self.on_profile_tick)
+        self.profile_timer.start(PROFILE_INTERVAL_MS)
+
+    def profile_map_view(self):
+        self.map_view.statsReported.connect(self.on_page_stats)
+        self.map_view.firstFrameRendered.connect(lambda: self.profiler.end("session.first_frame"))
+        self.map_view.setStatsInterval(PROFILE_INTERVAL_MS)
+
+    def toggle_profile_overlay(self):
+        self.profile_overlay.setVisible(not self.profile_overlay.isVisible())
+        if self.profile_overlay.isVisible(): self.refresh_profile_overlay()
+
+    def on_page_stats(self, stats):
+        self.profiler.sample("page.render_ms", stats.get("renderMs"))
+        self.profiler.sample("page.fps", stats.get("fps"))
+        if stats.get("heapBytes"): self.profiler.sample("page.js_heap_mb", stats["heapBytes"] / (1024 * 1024))
+
+    def on_profile_tick(self):
+        self.profiler.sample("process.rss_mb", process_rss_mb(os.getpid()))
+        if self.web_view is not None:
+            self.profiler.sample("renderer.rss_mb", process_rss_mb(self.web_view.page().renderProcessPid()))
+        if self.profile_overlay.isVisible(): self.refresh_profile_overlay()
+        self.profile_ticks += 1
+        if self.profile_ticks % PROFILE_LOG_EVERY == 0: self.profiler.flush_log()
+
+    def refresh_profile_overlay(self):
+        lines = ["PROFILER (F3)"]
+        for name, m in self.profiler.summary().items():
+            lines.append(f"{name:<24} last {m['last']:9.2f}  mean {m['mean']:9.2f}  max {m['max']:9.2f}  n={m['count']}")
+        self.profile_overlay.setText("\n".join(lines))
+        self.profile_overlay.adjustSize()
+
+    def eventFilter(self, obj, event):
+        if obj is self.search_input and event.type() == QEvent.Type.FocusIn:
+            # Start indexing when the user reaches for the box, not on every launch
+            self.search_index(self.flight_model.catalog)
+        if event.type() == QEvent.Type.Expose and obj is self.windowHandle():
+            self.update_visibility()
+            return False
+        if obj is self.setup_page and event.type() == QEvent.Type.Paint:
+            self.setup_page.removeEventFilter(self)
+            self.trace.mark("first paint (setup page)")
+            # Chromium spin-up is off the critical path: it starts only after the user can see the app
+            if self.map_renderer == "web": QTimer.singleShot(WEB_WARMUP_DELAY_MS, self.ensure_web_view)
+        return super().eventFilter(obj, event)
+
+    # --- VISIBILITY (window hidden / screen locked) ---
+    def watch_screen_lock(self):
+        try:
+            from PyQt6.QtDBus import QDBusConnection
+        except ImportError:
+            return
+        bus = QDBusConnection.sessionBus()
+        if not bus.isConnected(): return
+        for service, path in SCREENSAVER_SERVICES:
+            bus.connect(service, path, service, "ActiveChanged", self.on_screen_lock)
+
+    @pyqtSlot(bool)
+    def on_screen_lock(self, active):
+        self.screen_locked = active
+        self.update_visibility()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Expose events tell us when the compositor reports the window fully covered
+        handle = self.windowHandle()
+        if handle is not None and not getattr(self, "_watching_expose", False):
+            handle.installEventFilter(self)
+            self._watching_expose = True
+        self.update_visibility()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_visibility()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange: self.update_visibility()
+
+    def update_visibility(self):
+        handle = self.windowHandle()
+        hidden = (self.screen_locked or not self.isVisible() or self.isMinimized()
+                  or (handle is not None and not handle.isExposed()))
+        if hidden == self.hidden: return
+        self.hidden = hidden
+        if hidden: self.on_hidden()
+        else: self.on_restored()
+
+    def on_hidden(self):
+        # Nothing ticks while nobody can see it: no label updates, no arrivals, no page frames
+        self.resume_telemetry = self.timer.isActive()
+        self.timer.stop()
+        self.fleet_timer.stop()
+        if self.clock is not None: self.clock.cancel_wakeup()
+        # Hidden is when machines get suspended or shut down: make the position durable now
+        if self.resume_telemetry: self.write_checkpoint(sync=True)
+        self.set_map_frozen(True)
+        self.profiler.begin("window.hidden")
+
+    def on_restored(self):
+        # One catch-up step: everything is derived from the clock, so just re-read it
+        self.profiler.end("window.hidden")
+        self.set_map_frozen(False)
+        if self.fleet.pop_arrived(): self.push_fleet()
+        self.resync_map()
+        if self.resume_telemetry: self.update_telemetry()
+        self.resume_telemetry = False
+
+    def set_map_frozen(self, frozen):
+        if self.map_renderer == "native":
+            self.map_view.setFrozen(frozen)
+        elif self.web_view is not None:
+            from PyQt6.QtWebEngineCore import QWebEnginePage
+            page = self.web_view.page()
+            # Chromium only freezes pages it considers invisible (a minimized view still counts as shown)
+            if frozen:
+                page.setVisible(False)
+                page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+            else:
+                page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+                page.setVisible(True)
+
+    def ensure_web_view(self):
+        """Import QtWebEngine, create the profile/view and pre-load the map page (once)"""
+        if self.web_view is not None or self.map_renderer != "web": return
+        self.trace.mark("web warm-up started")
+        try:
+            from PyQt6.QtWebEngineWidgets import QWebEngineView
+            from PyQt6.QtWebEngineCore import QWebEngineProfile
+            from PyQt6.QtWebChannel import QWebChannel
+            from tile_cache import TileCache, CacheSchemeHandler, upstream_for, CACHE_SCHEME, CACHE_BASE_URL
+        except (ImportError, OSError) as e:
+            # Missing or broken QtWebEngine (e.g. a system library it links against): this runs from a timer slot
+            self.use_native_map(e)
+            return
+        self.trace.mark("QtWebEngine imported")
+
+        # Leaflet + basemap tiles are served from a local LRU cache (works offline once warm)
+        self.tile_cache = TileCache()
+        self.cache_handler = CacheSchemeHandler(self.tile_cache, self)
+        QWebEngineProfile.defaultProfile().installUrlSchemeHandler(CACHE_SCHEME, self.cache_handler)
+        self.trace.mark("web profile + tile cache ready")
+
+        # Fills the same cache in the background for whichever flight is selected
+        self.prefetcher = TilePrefetcher(self.tile_cache, upstream_for, profiler=self.profiler, parent=self)
+        self.prefetcher.progress.connect(self.on_prefetch_progress)
+        self.prefetcher.finished.connect(self.on_prefetch_finished)
+        QApplication.instance().aboutToQuit.connect(self.prefetcher.shutdown)
+        self.prefetch_selected()
+
+        self.web_view = QWebEngineView()
+        self.web_view.setObjectName("mapView")
+        self.map_layout.addWidget(self.web_view)
+        
+        # The map page is loaded once and warms up while the user is still on the setup page;
+        # sessions only talk to it over the bridge.
+        self.web_channel = QWebChannel(self)
+        self.web_channel.registerObject("bridge", self.map_bridge)
+        self.web_view.page().setWebChannel(self.web_channel)
+        self.web_view.loadFinished.connect(lambda ok: self.trace.mark(f"map page loaded (ok={ok})"))
+        self.web_view.loadFinished.connect(lambda ok: self.profiler.end("page.load"))
+        self.profiler.begin("page.load")
+        self.web_view.setHtml(MAP_HTML, QUrl(CACHE_BASE_URL))
+        if self.profiler.enabled: self.profile_overlay.raise_()
+        self.trace.mark("web view created")
+
+    def use_native_map(self, error):
+        """Switch to the QPainter view when QtWebEngine cannot be loaded (for this run only)"""
+        print(f"[map] QtWebEngine unavailable ({error}); using the native map", file=sys.stderr)
+        from native_map import NativeMapView
+        self.map_renderer = "native"
+        self.map_view = NativeMapView()
+        self.map_layout.addWidget(self.map_view)
+        if self.profiler.enabled: self.profile_map_view()
+        # Same as starting with --map-renderer native: no team map
+        self.add_btn.setVisible(False)
+        self.status_label.setText("🗺️ Web map unavailable (QtWebEngine failed to load): using the native map")
+
+    def start_flight(self, elapsed_s=0.0):
+        # BEGIN during the search debounce flies the top match on screen, not the previous selection
+        if self.select_timer.isActive(): self.select_first_flight()
         if not self.selected_flight: return
-        data = REAL_WORLD_FLIGHTS[self.selected_flight]
+        self.ensure_web_view()
+        data = self.selected_flight_data
         
         self.total_seconds = self.selected_focus_time * 60
-        self.remaining_seconds = self.total_seconds
+        self.sim.resume()
+        self.clock = SessionClock(self.total_seconds, self.sim, elapsed_s)
+        self.label_updates = self.label_skips = 0
         real_seconds = data['real_duration'] * 60
-        self.total_dist_km = data['distance_km']
-        
-        html = MAP_HTML_TEMPLATE
-        flight_parts = self.selected_flight.split(" → ")
-        
-        replacements = {
-            "START_LAT_VAL": str(data['coords'][0]), "START_LNG_VAL": str(data['coords'][1]),
-            "END_LAT_VAL": str(data['coords'][2]), "END_LNG_VAL": str(data['coords'][3]),
-            "FOCUS_DURATION_VAL": str(self.total_seconds), "REAL_DURATION_VAL": str(real_seconds),
-            "DISTANCE_VAL": f"{data['distance_km']:,}", "AIRCRAFT_VAL": data['aircraft'],
-            "FLIGHT_ID_VAL": data['callsign'], "DURATION_VAL": f"{data['real_duration']} min",
-            "START_CITY": flight_parts[0][2:], "END_CITY": flight_parts[1][2:],
-            "SPEED_VAL": f"{(real_seconds/self.total_seconds):.1f}x"
-        }
+        # Rows are re-timed with the profile's distance curve: the page, the native view and val_dist
+        # all read the same flight from this one batched great-circle solve
+        self.profile = self.flight_profile()
+        self.route = great_circle_route(*data['coords'], fractions=self.profile.distance_fractions(ROUTE_STEPS))
         
-        for k, v in replacements.items(): html = html.replace(k, v)
+        start_city, end_city = route_cities(self.selected_flight)
+        info = {
+            "callsign": data['callsign'], "distance": f"{data['distance_km']:,}", "aircraft": data['aircraft'],
+            "duration": f"{data['real_duration']} min", "route": f"{start_city} → {end_city}",
+            "speed": f"{(real_seconds/self.total_seconds):.1f}x"
+        }
         
-        self.web_view.setHtml(html)
+        # Same page as last session: no re-parse, no Leaflet bootstrap, tiles already in memory
+        self.profiler.begin("session.first_frame")
         self.pages.setCurrentIndex(1)
-        self.timer.start(1000)
+        self.map_view.loadRoute(self.route, info, self.total_seconds)
+        self.resync_map()
+        # The sun follows the real flight's clock: terminator shape once, then only the subsolar point
+        self.daylight = SessionDaylight(self.route, real_seconds, self.clock.progress())
+        self.update_daylight(self.clock.progress())
+        if self.record_path:
+            self.recorder = SessionRecorder(self.record_path, self.selected_flight, data, self.selected_focus_time,
+                                            self.route.total_km, self.sim.warp)
+        if self.history is not None:
+            self.history_session = self.history.begin(self.selected_flight, data, self.selected_focus_time)
+            self.history_start = (self.clock.elapsed(), self.clock.progress())
+        if self.checkpoint is not None:
+            self.checkpoint.begin(self.selected_flight, data, self.selected_focus_time, self.clock.elapsed(), self.sim.warp)
+        self.pause_btn.setText("⏸ PAUSE")
+        set_state(self.pause_btn, "paused", False)
+        self.publish_status()
         self.update_telemetry()
 
+    def flight_profile(self):
+        """The selection's profile: a row of the catalog's precomputed table if it has one, else built now"""
+        if self.selected_route is not None:
+            catalog, index = self.selected_route
+            if self._profiles[0] is not catalog: self._profiles = (catalog, ProfileTable.open(catalog))
+            if self._profiles[1] is not None: return self._profiles[1].profile(index)
+        return FlightProfile.for_flight(self.selected_flight_data)
+
+    def end_flight(self):
+        self.timer.stop()
+        self.sim.resume()
+        self.stop_recording()
+        self.finish_history(completed=False)
+        if self.checkpoint is not None: self.checkpoint.clear()
+        if self.status_server is not None: self.status_server.set_session(None)
+        self.map_view.reset()
+        self.resync_fleet()
+        if self.flights_stale:
+            self.flights_stale = False
+            self.update_available_flights(show_all=True)
+        self.pages.setCurrentIndex(0)
+
+    def resume_session(self, state):
+        """Fly a checkpointed session from where it stopped, without going through the setup page"""
+        self.selected_flight = state["flight"]
+        self.selected_flight_data = state["data"]
+        self.selected_route = None
+        self.selected_focus_time = state["focus_minutes"]
+        # Same warp as before the restart, and still paused if it was left paused
+        self.sim.set_warp(state["warp"])
+        self.start_flight(state["elapsed_s"])
+        if state["paused"]: self.toggle_pause()
+        self.trace.mark("session resumed")
+
+    # --- STATUS API ---
+    def publish_status(self):
+        """Hand the running session to the status server; again on pause / resume / arrival to push at once"""
+        if self.status_server is None or self.clock is None: return
+        data = self.selected_flight_data
+        info = {"flight": self.selected_flight, "callsign": data["callsign"], "aircraft": data["aircraft"],
+                "focus_minutes": self.selected_focus_time}
+        self.status_server.set_session(StatusSession(info, self.clock, self.route.total_km, self.profile, self.sim))
+
+    @pyqtSlot(str, object, object)
+    def on_remote_command(self, cmd, args, future):
+        """start / abort from a status API client, acted on here on the UI thread"""
+        flying = self.pages.currentIndex() == 1
+        if cmd == "abort":
+            if not flying:
+                future.set_result({"error": "no session in progress"})
+                return
+            self.end_flight()
+            future.set_result({"ok": True})
+            return
+        if flying:
+            future.set_result({"error": "a session is already in progress"})
+            return
+        minutes = args.get("minutes")
+        if minutes is not None:
+            # JSON true is a Python int too
+            if isinstance(minutes, bool) or not isinstance(minutes, int) or not 0 < minutes <= MAX_FOCUS_MINUTES:
+                future.set_result({"error": f"minutes must be an integer from 1 to {MAX_FOCUS_MINUTES}"})
+                return
+            self.on_focus_time_selected(minutes)
+        if args.get("flight"):
+            catalog = self.flight_model.catalog
+            index = catalog.find(str(args["flight"]))
+            if index is None:
+                future.set_result({"error": f"no flight matches {args['flight']!r}"})
+                return
+            self.selected_flight, self.selected_flight_data = catalog.record(index)
+            self.selected_route = (catalog, index)
+        if not self.selected_flight:
+            future.set_result({"error": "no flight selected"})
+            return
+        self.start_flight()
+        future.set_result({"ok": True, "flight": self.selected_flight, "focus_minutes": self.selected_focus_time})
+
+    # --- TEAM FLEET ---
+    def add_team_session(self, name, data, focus_minutes, label=None, elapsed_s=0.0):
+        if not name: return
+        self.fleet.add(name, data, focus_minutes, label, elapsed_s)
+        self.push_fleet()
+        self.status_label.setText(f"👥 Team map: {len(self.fleet)} flights in the air")
+
+    def load_team(self, path):
+        """Team screen: open straight on the map with every session from the file in flight"""
+        for session in read_team_file(path, self.catalog):
+            self.fleet.add(*session)
+        self.push_fleet()
+        self.pages.setCurrentIndex(1)
+        QTimer.singleShot(0, self.ensure_web_view)
+
+    def push_fleet(self):
+        # Queued by the bridge until the page is up, so this never forces the web view into existence
+        self.map_view.setFleet(self.fleet.payload())
+        self.schedule_fleet_tick()
+
+    def schedule_fleet_tick(self):
+        delay = self.sim.real_seconds(self.fleet.next_arrival_in())
+        if delay is None: self.fleet_timer.stop()
+        else: self.fleet_timer.start(max(1, math.ceil(delay * 1000)))
+
+    def on_fleet_tick(self):
+        if self.fleet.pop_arrived(): self.push_fleet()
+        else: self.schedule_fleet_tick()
+
+    def resync_fleet(self):
+        if not len(self.fleet): return
+        self.map_view.setFleetProgress(self.fleet.progress_batch())
+        self.schedule_fleet_tick()
+
+    def resync_map(self):
+        """Re-anchor the page's extrapolation of every plane (pause / resume / late wakeup)"""
+        if self.clock is not None and not self.clock.finished():
+            self.map_view.setProgress(self.clock.progress(), self.sim.rate / self.total_seconds)
+        self.resync_fleet()
+
+    def update_daylight(self, progress):
+        """Move the terminator once the sun has moved noticeably; a no-op on most ticks"""
+        shape, sun = self.daylight.update(progress)
+        if shape is not None: self.map_view.setDaylight(shape)
+        if sun is not None: self.map_view.setSunPosition(*sun)
+
+    def stop_recording(self):
+        if self.recorder: self.recorder.close()
+        self.recorder = None
+
+    # --- HISTORY ---
+    def finish_history(self, completed):
+        """Close the session's history row (arrival, abort or quit); no-op if already closed"""
+        if self.history_session is None: return
+        # A resumed session's row only counts the part flown since the resume
+        elapsed, progress = self.history_start
+        self.history.end(self.history_session, self.clock.elapsed() - elapsed,
+                         self.route.total_km * (self.clock.progress() - progress), completed)
+        self.history_session = None
+
+    def close_history(self):
+        if self.history is None: return
+        self.finish_history(completed=False)
+        self.history.close()
+
+    # --- CHECKPOINTS ---
+    def write_checkpoint(self, sync=False):
+        if self.checkpoint is None or self.clock is None or self.clock.finished(): return
+        self.checkpoint.write(self.clock.elapsed(), self.sim.paused, sync)
+
+    def close_checkpoint(self):
+        """Quit mid-session: the last position is synced, and the next launch offers to resume"""
+        if self.checkpoint is None: return
+        self.write_checkpoint(sync=True)
+        self.checkpoint.close()
+
+    def refresh_history(self):
+        # Read on the history writer thread (its own connection, after pending writes), shown by show_history
+        self.history.request_stats(self.historyStats.emit)
+
+    def show_history(self, stats):
+        if not stats["sessions"]: return
+        parts = [f"⏱️ {stats['today_min']:.0f} min today", f"📅 {stats['weeks_min'][-1][1] / 60:.1f} h this week"]
+        if stats["streak_days"]: parts.append(f"🔥 {stats['streak_days']}-day streak")
+        parts.append(f"🌍 {stats['distance_km']:,.0f} km flown")
+        if stats["top_routes"]:
+            flight, flights, _ = stats["top_routes"][0]
+            parts.append(f"⭐ {flight} ×{flights}")
+        self.history_label.setText("  •  ".join(parts))
+        self.history_label.setVisible(True)
+
+    def toggle_pause(self):
+        if self.clock is None or self.clock.finished(): return
+        if self.sim.paused:
+            self.sim.resume()
+            self.pause_btn.setText("⏸ PAUSE")
+            set_state(self.pause_btn, "paused", False)
+            if self.recorder: self.recorder.event(self.clock, "resume")
+            self.write_checkpoint(sync=True)
+            self.publish_status()
+            self.resync_map()
+            self.update_telemetry()
+        else:
+            self.sim.pause()
+            self.timer.stop()
+            self.pause_btn.setText("▶ RESUME")
+            set_state(self.pause_btn, "paused", True)
+            if self.recorder: self.recorder.event(self.clock, "pause")
+            self.write_checkpoint(sync=True)
+            self.publish_status()
+            self.resync_map()
+
+    def set_label_text(self, label, text):
+        # Skip no-op setText calls: each one costs a relayout + repaint of the dashboard
+        if label.text() == text:
+            self.label_skips += 1
+            return
+        label.setText(text)
+        self.label_updates += 1
+
+    def telemetry_stats(self):
+        """Timer accuracy / wakeup counts for the current session"""
+        stats = self.clock.stats() if self.clock else {}
+        # The session clock measures jitter in simulated time; report it in real milliseconds
+        for key in ("mean_jitter_ms", "max_jitter_ms"):
+            if key in stats: stats[key] /= self.sim.warp
+        stats.update(label_updates=self.label_updates, label_skips=self.label_skips)
+        return stats
+
     def update_telemetry(self):
-        if self.remaining_seconds <= 0:
+        # Jitter in real seconds: the session clock measures it in (possibly warped) simulated time
+        jitter = self.clock.on_wakeup() / self.sim.warp
+        self.profiler.sample("telemetry.jitter_ms", jitter * 1000)
+        if abs(jitter) > RESYNC_JITTER_S:
+            # Woke far off schedule (suspend, stalled event loop): re-anchor the page's extrapolation
+            self.resync_map()
+
+        if self.clock.finished():
             self.timer.stop()
-            self.val_time.setText("00:00:00"); self.val_progress.setText("100%")
-            self.val_alt.setText("ARRIVED ✓"); self.val_dist.setText("0 km")
+            self.set_label_text(self.val_time, "00:00:00"); self.set_label_text(self.val_progress, "100%")
+            self.set_label_text(self.val_alt, "ARRIVED ✓"); self.set_label_text(self.val_dist, "0 km")
+            self.update_daylight(1.0)
+            if self.recorder: self.recorder.tick(telemetry(self.clock, self.route.total_km, self.profile))
+            self.stop_recording()
+            self.finish_history(completed=True)
+            if self.checkpoint is not None: self.checkpoint.clear()
+            self.publish_status()
             return
 
-        self.remaining_seconds -= 1
-        progress = (self.total_seconds - self.remaining_seconds) / self.total_seconds
+        values = telemetry(self.clock, self.route.total_km, self.profile)
+        if self.recorder: self.recorder.tick(values)
+        if self.history_session: self.history.sample(self.history_session, self.clock.elapsed(), values)
+        if self.checkpoint is not None and self.checkpoint.due(): self.write_checkpoint()
+        progress = values["progress"]
+        self.update_daylight(progress)
         
-        m, s = divmod(self.remaining_seconds, 60)
-        h, m = divmod(m, 60)
-        self.val_time.setText(f"{h:02}:{m:02}:{s:02}")
-        self.val_progress.setText(f"{progress*100:.0f}%")
-        
-        alt = 38000
-        if progress < 0.1: alt = 38000 * (progress * 10)
-        elif progress > 0.9: alt = 38000 * ((1 - progress) * 10)
-        self.val_alt.setText(f"{int(alt):,} ft")
-        self.val_dist.setText(f"{int(self.total_dist_km * (1 - progress)):,} km")
+        self.set_label_text(self.val_time, format_hms(values["seconds_left"]))
+        self.set_label_text(self.val_progress, f"{progress*100:.0f}%")
+        self.set_label_text(self.val_alt, f"{values['altitude_ft']:,} ft")
+        self.set_label_text(self.val_dist, f"{values['remaining_km']:,} km")
+
+        # Sleep until the next visible change. In cruise the altitude is flat, so let the OS
+        # coalesce wakeups (coarse timers may fire ~5% early, hence the stretch).
+        delay = self.sim.real_seconds(self.clock.plan_wakeup())
+        if delay is None: return  # paused: toggle_pause() wakes us again
+        cruising = self.profile.in_cruise(progress)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer if cruising else Qt.TimerType.PreciseTimer)
+        self.timer.start(max(1, math.ceil(delay * 1000 * (1.05 if cruising else 1.0))))
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="FlightFocus Pro - Fedora Edition")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH,
+                        help="compiled route catalog (.ffcat, see route_catalog.py); built-in routes if missing")
+    parser.add_argument("--startup-trace", action="store_true", help="print per-phase startup timings to stderr")
+    parser.add_argument("--map-renderer", choices=MAP_RENDERERS,
+                        help="flight view backend: Leaflet in QtWebEngine or the lightweight native view (remembered)")
+    parser.add_argument("--theme", choices=THEME_MODES, help="colour scheme; system follows the desktop (remembered)")
+    parser.add_argument("--warp", type=float, default=1.0, help="run sessions N times faster than real time (demos, testing)")
+    parser.add_argument("--record", metavar="PATH", help="record each session's telemetry for session_replay.py verify")
+    parser.add_argument("--home", metavar="AIRPORT", help="home airport (IATA code or city) for generated routes (remembered)")
+    parser.add_argument("--airports", metavar="PATH", default=AIRPORTS_PATH,
+                        help="airport list: bundled CSV or an OpenFlights airports.dat")
+    parser.add_argument("--history", metavar="PATH", default=DEFAULT_HISTORY_PATH, help="session history database (SQLite)")
+    parser.add_argument("--no-history", action="store_true", help="do not record sessions or show history stats")
+    parser.add_argument("--checkpoint", metavar="PATH", default=DEFAULT_CHECKPOINT_PATH,
+                        help="crash-safe checkpoint of the running session, offered for resume on the next launch")
+    parser.add_argument("--no-checkpoint", action="store_true", help="do not checkpoint sessions or offer to resume")
+    parser.add_argument("--status-socket", metavar="PATH", default=DEFAULT_SOCKET_PATH,
+                        help="Unix socket of the local status API (see status_server.py)")
+    parser.add_argument("--no-status-server", action="store_true", help="do not serve the local status API")
+    parser.add_argument("--team", metavar="FILE", help="JSON list of team sessions to show on the map alongside your own")
+    parser.add_argument("--profile", action="store_true", help="enable hot-path instrumentation (F3 toggles the overlay)")
+    parser.add_argument("--profile-log", metavar="PATH", help="append instrumentation summaries to a rotating log (implies --profile)")
+    parser.add_argument("--profile-trace", metavar="PATH", help="write a Chrome-trace JSON on exit (implies --profile)")
+    # Unknown arguments are left for Qt (-platform, -style, ...)
+    return parser.parse_known_args(argv[1:])
+
+def offer_resume(checkpoint):
+    """Checkpointed session the user wants to continue, or None (declined ones are discarded)"""
+    state = checkpoint.load()
+    if state is None: return None
+    remaining = state["focus_minutes"] * 60 - state["elapsed_s"]
+    if remaining > 0:
+        progress = state["elapsed_s"] / (state["focus_minutes"] * 60)
+        answer = QMessageBox.question(None, "FlightFocus Pro",
+                                      f"✈️ Resume your flight?\n\n{state['flight']}\n"
+                                      f"{format_hms(remaining)} left • {progress * 100:.0f}% flown")
+        if answer == QMessageBox.StandardButton.Yes: return state
+    checkpoint.clear()
+    return None
 
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args(sys.argv)
+    trace = StartupTrace(args.startup_trace)
+    trace.mark("python imports")
+    catalog = load_catalog(args.catalog, REAL_WORLD_FLIGHTS)
+    trace.mark("route catalog opened")
+
+    settings = QSettings(SETTINGS_ORG, SETTINGS_APP)
+    if args.map_renderer: settings.setValue("map/renderer", args.map_renderer)
+    map_renderer = settings.value("map/renderer", "web")
+    if map_renderer not in MAP_RENDERERS: map_renderer = "web"
+    if args.theme: settings.setValue("ui/theme", args.theme)
+    if args.home is not None: settings.setValue("routes/home_airport", args.home.strip().upper())
+
+    # The ffcache:// scheme must be registered before the QApplication exists; sharing GL contexts
+    # up front is what allows QtWebEngineWidgets itself to be imported later.
+    # The native renderer never loads QtWebEngine at all.
+    if map_renderer == "web":
+        try:
+            from tile_cache import register_cache_scheme
+        except (ImportError, OSError) as e:
+            print(f"[map] QtWebEngine unavailable ({e}); using the native map", file=sys.stderr)
+            map_renderer = "native"
+        else:
+            register_cache_scheme()
+            QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+            trace.mark("url scheme registered")
+    if args.team and map_renderer != "web": sys.exit("--team needs the web map (--map-renderer web): the native map has no fleet layer")
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setApplicationName("FlightFocus Pro")
     app.setStyle('Fusion')
     font = QFont("Cantarell", 10)
     app.setFont(font)
-    window = FlightFocusPro()
+    trace.mark("QApplication created")
+
+    profiler = None
+    if args.profile or args.profile_log or args.profile_trace:
+        profiler = Profiler(args.profile_log)
+        app.aboutToQuit.connect(profiler.flush_log)
+        if args.profile_trace: app.aboutToQuit.connect(lambda: profiler.dump_chrome_trace(args.profile_trace))
+    if args.warp <= 0: sys.exit("--warp must be positive")
+    history = None if args.no_history else SessionHistory(args.history)
+    checkpoint = None if args.no_checkpoint else SessionCheckpoint(args.checkpoint)
+    resume = offer_resume(checkpoint) if checkpoint is not None and not args.team else None
+    status_server = None
+    if not args.no_status_server:
+        status_server = StatusServer(args.status_socket)
+        if not status_server.start():
+            print(f"[status] {args.status_socket} is in use by another instance; status API disabled", file=sys.stderr)
+            status_server = None
+    window = FlightFocusPro(catalog, trace, profiler, map_renderer, SimClock(args.warp), args.record, args.airports,
+                            history, checkpoint, resume, status_server)
+    app.aboutToQuit.connect(window.close_history)
+    app.aboutToQuit.connect(window.close_checkpoint)
+    if status_server is not None: app.aboutToQuit.connect(status_server.close)
+    if args.team: window.load_team(args.team)
     window.show()
+    trace.mark("window shown")
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - terminal mode
+The same focus sessions for SSH boxes and minimal desktops, without PyQt6 or a web engine:
+- route selection straight from the route catalog (same rules as the flight list)
+- countdown / progress / altitude / distance redrawn on one terminal line, only when a
+  visible value changes (about once a second)
+- no Qt or NumPy imports, so it starts in well under 100 ms (--from loads NumPy for the airport index)
+"""
+
+import sys
+import time
+import shutil
+import argparse
+
+from flights import REAL_WORLD_FLIGHTS, FOCUS_PRESETS, telemetry, format_hms
+from flight_profiles import FlightProfile
+from route_catalog import RouteCatalog, load_catalog, route_cities, haversine_km, DEFAULT_CATALOG_PATH
+from session_clock import SessionClock, SimClock
+from session_replay import SessionRecorder
+
+# Without a terminal (logs, pipes) print a plain line this often instead of redrawing
+LOG_INTERVAL_S = 60.0
+BAR_MIN_WIDTH = 10
+LIST_LIMIT = 20
+
+
+def available(catalog, focus_minutes, show_all=False):
+    """Catalog indices offered for a focus time, closest duration first"""
+    return range(len(catalog)) if show_all else catalog.select(focus_minutes)
+
+
+def prompt_flight(catalog, indices, focus_minutes):
+    shown = list(indices[:LIST_LIMIT])
+    print(f"Flights for a {focus_minutes} min focus session:")
+    for n, i in enumerate(shown, 1):
+        name, data = catalog.record(i)
+        print(f"  {n:2}. {name:<48} {data['real_duration']:4} min  {data['callsign']}")
+    while True:
+        try:
+            answer = input(f"Select flight [1-{len(shown)}, default 1]: ").strip() or "1"
+        except EOFError:
+            answer = "1"
+        if answer.isdigit() and 1 <= int(answer) <= len(shown):
+            return catalog.record(shown[int(answer) - 1])
+
+
+def status_line(callsign, values, width):
+    head = f"✈ {callsign} "
+    tail = (f" {values['progress'] * 100:3.0f}%  {format_hms(values['seconds_left'])}  {values['altitude_ft']:,} ft  "
+            f"{values['ground_speed_kts']} kt  {values['remaining_km']:,} km")
+    bar_width = max(width - len(head) - len(tail) - 3, BAR_MIN_WIDTH)
+    filled = int(values["progress"] * bar_width)
+    return f"{head}[{'#' * filled}{'.' * (bar_width - filled)}]{tail}"
+
+
+def run_session(name, data, focus_minutes, warp=1.0, record_path=None):
+    total_km = haversine_km(*data["coords"])
+    start_city, end_city = route_cities(name)
+    print(f"{data['callsign']}  {start_city} → {end_city}  ·  {data['aircraft']}  ·  "
+          f"{int(total_km):,} km  ·  {focus_minutes} min focus (Ctrl+C to abort)")
+
+    profile = FlightProfile.for_flight(data)
+    sim = SimClock(warp)
+    clock = SessionClock(focus_minutes * 60, sim)
+    recorder = SessionRecorder(record_path, name, data, focus_minutes, total_km, warp) if record_path else None
+    interactive = sys.stdout.isatty()
+    last_line, last_log = None, float("-inf")
+    try:
+        while True:
+            values = telemetry(clock, total_km, profile)
+            if recorder: recorder.tick(values)
+            if interactive:
+                width = shutil.get_terminal_size().columns - 1
+                line = status_line(data["callsign"], values, width)
+                # Redraw in place only when the text changed
+                if line != last_line:
+                    sys.stdout.write("\r" + line + "\x1b[K")
+                    sys.stdout.flush()
+                    last_line = line
+            elif clock.finished() or time.monotonic() - last_log >= LOG_INTERVAL_S:
+                print(status_line(data["callsign"], values, 80), flush=True)
+                last_log = time.monotonic()
+
+            if clock.finished(): break
+            # Sleep until the countdown or the percent next changes
+            time.sleep(sim.real_seconds(clock.plan_wakeup()) or 0)
+    except KeyboardInterrupt:
+        print("\nFlight aborted.")
+        return 130
+    finally:
+        if recorder: recorder.close()
+    print(f"\nArrived in {end_city} ✓")
+    return 0
+
+
+def parse_args(argv):
+    presets = ", ".join(f"{minutes}" for _, minutes in FOCUS_PRESETS)
+    parser = argparse.ArgumentParser(description="FlightFocus Pro - terminal mode")
+    parser.add_argument("-m", "--minutes", type=int, default=60, help=f"focus time in minutes (presets: {presets})")
+    parser.add_argument("-f", "--flight", help="route to fly: part of its name or a callsign prefix")
+    parser.add_argument("--all", action="store_true", help="offer every route, not just those matching the focus time")
+    parser.add_argument("--list", action="store_true", help="list matching routes and exit")
+    parser.add_argument("--warp", type=float, default=1.0, help="run N times faster than real time (demos, testing)")
+    parser.add_argument("--record", metavar="PATH", help="record every tick for session_replay.py verify")
+    parser.add_argument("--from", dest="home", metavar="AIRPORT",
+                        help="generate routes from a home airport (IATA code, city or lat,lon) instead of the catalog")
+    parser.add_argument("--airports", metavar="PATH", help="airport list for --from (bundled CSV or OpenFlights airports.dat)")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH,
+                        help="compiled route catalog (.ffcat, see route_catalog.py); built-in routes if missing")
+    return parser.parse_args(argv[1:])
+
+
+def main(argv=None):
+    args = parse_args(argv or sys.argv)
+    if args.minutes <= 0: sys.exit("--minutes must be positive")
+    if args.warp <= 0: sys.exit("--warp must be positive")
+    if args.home:
+        from airports import AirportIndex, AIRPORTS_PATH
+        airports = AirportIndex.load(args.airports or AIRPORTS_PATH)
+        home = airports.find(args.home)
+        if home is None: sys.exit(f"No airport matches {args.home!r}.")
+        catalog = RouteCatalog.from_flights(dict(airports.routes_for(home, args.minutes)))
+    else:
+        catalog = load_catalog(args.catalog, REAL_WORLD_FLIGHTS)
+    indices = available(catalog, args.minutes, args.all)
+    if not len(indices): sys.exit("No routes in the catalog.")
+
+    if args.list:
+        for i in indices:
+            name, data = catalog.record(i)
+            print(f"{name:<48} {data['real_duration']:4} min  {data['distance_km']:6,} km  {data['callsign']}")
+        return 0
+
+    if args.flight:
+        found = catalog.find(args.flight, indices)
+        if found is None: found = catalog.find(args.flight)
+        if found is None: sys.exit(f"No route matches {args.flight!r}.")
+        chosen = catalog.record(found)
+    elif sys.stdin.isatty():
+        chosen = prompt_flight(catalog, indices, args.minutes)
+    else:
+        chosen = catalog.record(indices[0])
+    return run_session(*chosen, args.minutes, args.warp, args.record)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - flight profiles
+Altitude and ground speed from the aircraft type and the route, instead of one ramp to 38,000 ft:
+- AIRCRAFT_PERFORMANCE: cruise level, climb / descent rates and cruise speed per type
+- a profile is worked out in the real flight's minutes (taxi, climb, cruise, descent, taxi;
+  short hops level off lower) and sampled at PROFILE_STEPS + 1 evenly spaced fractions of
+  the flight. The focus time only rescales the clock, so one row serves every focus preset.
+- a row is (altitude ft, fraction of the distance flown, ground speed kt) quantized to uint16,
+  so a row built on the fly and one read from the cache are identical (replays stay exact)
+- telemetry is one interpolation between two samples per tick; the map's route table is
+  re-timed with the same distance curve, so the plane, the dashboard and the km left agree
+- the batch builder fills the table for a whole catalog on a process pool and caches it as
+  a memory-mapped .npy next to the catalog
+Only the table needs NumPy; profiles themselves are plain Python (terminal mode).
+
+Build:  python flight_profiles.py build routes.ffcat [--workers N]
+"""
+
+import os
+import argparse
+
+PROFILE_VERSION = 1
+PROFILE_STEPS = 64
+FRACTION_SCALE = 65535
+CHUNK_ROUTES = 2000
+
+# cruise ft, climb ft/min, descent ft/min, cruise ground speed kt (still air)
+AIRCRAFT_PERFORMANCE = {
+    "Airbus A220": (39000, 2200, 1900, 445),
+    "Airbus A319": (37000, 2000, 1800, 447),
+    "Airbus A320": (37000, 1900, 1800, 450),
+    "Airbus A320neo": (39000, 2000, 1800, 450),
+    "Airbus A321": (36000, 1700, 1800, 450),
+    "Airbus A321neo": (37000, 1800, 1800, 450),
+    "Airbus A330": (39000, 1600, 1800, 470),
+    "Airbus A330neo": (41000, 1700, 1800, 470),
+    "Airbus A350": (41000, 1700, 1800, 488),
+    "Airbus A380": (39000, 1400, 1700, 490),
+    "Boeing 737": (37000, 1900, 1800, 453),
+    "Boeing 737 MAX": (39000, 2000, 1800, 453),
+    "Boeing 747": (37000, 1500, 1800, 492),
+    "Boeing 757": (39000, 2200, 1900, 461),
+    "Boeing 767": (39000, 1800, 1800, 459),
+    "Boeing 777": (39000, 1600, 1800, 482),
+    "Boeing 787": (41000, 1700, 1800, 488),
+    "Embraer E170": (37000, 2000, 1800, 430),
+    "Embraer E175": (37000, 2000, 1800, 430),
+    "Embraer E190": (39000, 2000, 1800, 447),
+    "Embraer E195": (39000, 1900, 1800, 447),
+    "Bombardier CRJ700": (37000, 2200, 1900, 447),
+    "Bombardier CRJ900": (37000, 2100, 1900, 447),
+    "Dash 8 Q400": (25000, 1800, 1500, 360),
+    "ATR 72": (24000, 1300, 1500, 275),
+    "ATR 42": (24000, 1400, 1500, 265),
+}
+DEFAULT_PERFORMANCE = AIRCRAFT_PERFORMANCE["Airbus A320"]
+
+TAXI_OUT_MIN = 12
+TAXI_IN_MIN = 6
+TAXI_KTS = 15
+LIFTOFF_KTS = 160
+APPROACH_KTS = 140
+# Short hops level off at ~FL(1.5 x distance in nm), and spend at least this share of the airborne time level
+FT_PER_NM = 150
+MIN_LEVEL_FT = 10000
+MIN_LEVEL_SHARE = 0.2
+# Block time the distance does not need is spent on the ground (taxi, queues), up to this share
+MAX_GROUND_SHARE = 0.5
+KM_PER_NM = 1.852
+# Breakpoints 2..5 are airborne: lift-off, top of climb, top of descent, touchdown
+AIRBORNE = slice(2, 6)
+
+
+def _segments(aircraft, distance_km, real_minutes, ground_minutes=None):
+    """Breakpoints (minute, altitude ft, speed kt) of the piecewise-linear profile"""
+    cruise_ft, climb_fpm, descent_fpm, cruise_kts = AIRCRAFT_PERFORMANCE.get(aircraft, DEFAULT_PERFORMANCE)
+    total = max(float(real_minutes), 1.0)
+    if ground_minutes is None: ground_minutes = TAXI_OUT_MIN + TAXI_IN_MIN
+    ground_minutes = min(ground_minutes, MAX_GROUND_SHARE * total)
+    taxi_out = ground_minutes * TAXI_OUT_MIN / (TAXI_OUT_MIN + TAXI_IN_MIN)
+    land = total - (ground_minutes - taxi_out)
+    airborne = land - taxi_out
+    level = min(cruise_ft, max(distance_km / KM_PER_NM * FT_PER_NM, MIN_LEVEL_FT),
+                (1 - MIN_LEVEL_SHARE) * airborne / (1.0 / climb_fpm + 1.0 / descent_fpm))
+    level = max(round(level / 1000) * 1000, 1000)
+    # Lower levels mean a lower true airspeed
+    level_kts = cruise_kts * (0.6 + 0.4 * level / cruise_ft)
+    return [(0.0, 0, TAXI_KTS), (taxi_out, 0, TAXI_KTS),
+            (taxi_out, 0, LIFTOFF_KTS), (taxi_out + level / climb_fpm, level, level_kts),
+            (land - level / descent_fpm, level, level_kts), (land, 0, APPROACH_KTS),
+            (land, 0, TAXI_KTS), (total, 0, TAXI_KTS)]
+
+
+def _flown_nm(points, t):
+    """Still-air nm flown from lift-off to minute t (exact: speed is linear on every segment)"""
+    nm = 0.0
+    airborne = points[AIRBORNE]
+    for (t0, _, v0), (t1, _, v1) in zip(airborne, airborne[1:]):
+        if t <= t0: break
+        end = min(t, t1)
+        v_end = v0 + (v1 - v0) * (end - t0) / (t1 - t0) if t1 > t0 else v1
+        nm += (end - t0) / 60 * (v0 + v_end) / 2
+    return nm
+
+
+def profile_points(aircraft, distance_km, real_minutes):
+    """_segments() with the block time the distance does not need moved to the ground"""
+    points = _segments(aircraft, distance_km, real_minutes)
+    level_kts = points[3][2]
+    spare_nm = _flown_nm(points, points[-1][0]) - distance_km / KM_PER_NM
+    if spare_nm <= 0: return points
+    return _segments(aircraft, distance_km, real_minutes, TAXI_OUT_MIN + TAXI_IN_MIN + 60 * spare_nm / level_kts)
+
+
+def build_profile(aircraft, distance_km, real_minutes, steps=PROFILE_STEPS):
+    """Flat list of steps + 1 (altitude ft, distance fraction x FRACTION_SCALE, ground speed kt) samples"""
+    points = profile_points(aircraft, distance_km, real_minutes)
+    total = points[-1][0]
+    still_nm = _flown_nm(points, total)
+    # Whatever still does not fit the route's real distance is wind
+    wind = distance_km / KM_PER_NM / still_nm if still_nm > 0 else 1.0
+    row, i = [], 0
+    for k in range(steps + 1):
+        t = total * k / steps
+        while i < len(points) - 2 and t > points[i + 1][0]: i += 1
+        (t0, a0, v0), (t1, a1, v1) = points[i], points[i + 1]
+        f = (t - t0) / (t1 - t0) if t1 > t0 else 1.0
+        airborne = AIRBORNE.start <= i < AIRBORNE.stop - 1
+        fraction = min(_flown_nm(points, t) / still_nm, 1.0) if still_nm > 0 else k / steps
+        row += [int(round(a0 + (a1 - a0) * f)), int(round(fraction * FRACTION_SCALE)),
+                int(round((v0 + (v1 - v0) * f) * (wind if airborne else 1.0)))]
+    return row
+
+
+class FlightProfile:
+    """One route's samples; at() is O(1) whatever the progress"""
+
+    def __init__(self, samples, steps=PROFILE_STEPS):
+        self.steps = steps
+        self.altitudes = samples[0::3]
+        self.fractions = [v / FRACTION_SCALE for v in samples[1::3]]
+        self.speeds = samples[2::3]
+        self.level = max(self.altitudes)
+
+    @classmethod
+    def for_flight(cls, data):
+        return cls(build_profile(data["aircraft"], data["distance_km"], data["real_duration"]))
+
+    def _bracket(self, progress):
+        x = min(max(progress, 0.0), 1.0) * self.steps
+        i = min(int(x), self.steps - 1)
+        return i, x - i
+
+    def at(self, progress):
+        """(altitude ft, distance fraction flown, ground speed kt) at a 0..1 time fraction"""
+        i, f = self._bracket(progress)
+        alt, frac, gs = self.altitudes, self.fractions, self.speeds
+        return (alt[i] + (alt[i + 1] - alt[i]) * f, frac[i] + (frac[i + 1] - frac[i]) * f,
+                gs[i] + (gs[i + 1] - gs[i]) * f)
+
+    def in_cruise(self, progress):
+        i, _ = self._bracket(progress)
+        return self.altitudes[i] == self.altitudes[i + 1] == self.level
+
+    def distance_fractions(self, steps):
+        """Distance flown at steps + 1 evenly spaced time fractions (re-timing the route table)"""
+        return [self.at(k / steps)[1] for k in range(steps + 1)]
+
+
+# --- cached table for a whole catalog ---
+def table_path(catalog_path):
+    return f"{catalog_path}.profiles-v{PROFILE_VERSION}.npy"
+
+
+def _build_chunk(rows):
+    from array import array
+    return array("H", (v for row in rows for v in build_profile(*row))).tobytes()
+
+
+def build_table(catalog, path, workers=None):
+    """Profiles for every route of the catalog, built on a process pool, written atomically"""
+    import numpy as np
+    from concurrent.futures import ProcessPoolExecutor
+    n = len(catalog)
+    rows = [(catalog.aircraft_names[catalog.aircraft_idx[i]], catalog.distances[i], catalog.durations[i]) for i in range(n)]
+    tmp = path + ".tmp"
+    table = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.uint16, shape=(n, (PROFILE_STEPS + 1) * 3))
+    chunks = [rows[a:a + CHUNK_ROUTES] for a in range(0, n, CHUNK_ROUTES)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for k, data in enumerate(pool.map(_build_chunk, chunks)):
+            start = k * CHUNK_ROUTES
+            table[start:start + len(chunks[k])] = np.frombuffer(data, dtype=np.uint16).reshape(len(chunks[k]), -1)
+    table.flush()
+    del table
+    os.replace(tmp, path)
+    return n
+
+
+class ProfileTable:
+    """Memory-mapped profile rows for one compiled catalog"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def open(cls, catalog):
+        """The catalog's cached table, or None if it is missing or older than the catalog"""
+        source = catalog.source
+        if source is None: return None
+        path = table_path(source)
+        try:
+            if os.path.getmtime(path) < os.path.getmtime(source): return None
+            import numpy as np
+            rows = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if rows.shape != (len(catalog), (PROFILE_STEPS + 1) * 3): return None
+        return cls(rows)
+
+    def profile(self, i):
+        return FlightProfile(self.rows[i].tolist())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute flight profiles for a compiled route catalog")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("catalog", help="compiled .ffcat catalog")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+    from route_catalog import RouteCatalog
+    catalog = RouteCatalog.open(args.catalog)
+    count = build_table(catalog, table_path(args.catalog), args.workers)
+    print(f"Wrote {count:,} profiles to {table_path(args.catalog)}")
+
+
+if __name__ == "__main__":
+    main()
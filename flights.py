@@ -0,0 +1,83 @@
+"""
+FlightFocus Pro - routes and flight model
+Qt-free (and NumPy-free) so the terminal mode can share it with the GUI:
+- the built-in routes and focus presets
+- the altitude / distance model behind the dashboard (a flight_profiles.FlightProfile when
+  the aircraft is known; the generic ramp below otherwise)
+"""
+
+import math
+
+# --- REAL WORLD ROUTES ---
+REAL_WORLD_FLIGHTS = {
+    # Short Flights (25-90 mins)
+    "🇬🇧 LONDON → 🇫🇷 PARIS": { "coords": [51.4700, -0.4543, 49.0097, 2.5479], "real_duration": 85, "distance_km": 344, "aircraft": "Airbus A320", "callsign": "BAF123" },
+    "🇺🇸 NY (JFK) → 🇺🇸 WASHINGTON": { "coords": [40.6413, -73.7781, 38.9531, -77.4565], "real_duration": 75, "distance_km": 333, "aircraft": "Boeing 737", "callsign": "DAL456" },
+    "🇦🇪 DUBAI → 🇶🇦 DOHA": { "coords": [25.2532, 55.3657, 25.2609, 51.5651], "real_duration": 70, "distance_km": 379, "aircraft": "Airbus A320", "callsign": "QTR789" },
+    "🇯🇵 TOKYO → 🇰🇷 SEOUL": { "coords": [35.5494, 139.7798, 37.4602, 126.4407], "real_duration": 135, "distance_km": 1157, "aircraft": "Boeing 787", "callsign": "JAL234" },
+    "🇩🇪 BERLIN → 🇨🇿 PRAGUE": { "coords": [52.3667, 13.5033, 50.1008, 14.2600], "real_duration": 65, "distance_km": 280, "aircraft": "Airbus A319", "callsign": "BER567" },
+    
+    # Medium Flights (90-180 mins)
+    "🇪🇸 MADRID → 🇮🇹 ROME": { "coords": [40.4839, -3.5679, 41.8003, 12.2389], "real_duration": 145, "distance_km": 1365, "aircraft": "Airbus A321", "callsign": "IBE345" },
+    "🇺🇸 SEATTLE → 🇺🇸 SAN FRANCISCO": { "coords": [47.4502, -122.3088, 37.6213, -122.3790], "real_duration": 125, "distance_km": 1090, "aircraft": "Boeing 737", "callsign": "UAL678" },
+    "🇮🇳 MUMBAI → 🇦🇪 DUBAI": { "coords": [19.0896, 72.8656, 25.2532, 55.3657], "real_duration": 180, "distance_km": 1934, "aircraft": "Boeing 777", "callsign": "UAE901" },
+    "🇬🇧 LONDON → 🇹🇷 ISTANBUL": { "coords": [51.4700, -0.4543, 41.2768, 28.7293], "real_duration": 235, "distance_km": 2502, "aircraft": "Airbus A330", "callsign": "THY123" },
+    
+    # Long Flights (180-360 mins)
+    "🇺🇸 NEW YORK → 🇬🇧 LONDON": { "coords": [40.6413, -73.7781, 51.4700, -0.4543], "real_duration": 415, "distance_km": 5566, "aircraft": "Boeing 777", "callsign": "BAW001" },
+    "🇯🇵 TOKYO → 🇸🇬 SINGAPORE": { "coords": [35.5494, 139.7798, 1.3644, 103.9915], "real_duration": 440, "distance_km": 5328, "aircraft": "Boeing 787", "callsign": "SIA012" },
+    "🇩🇪 FRANKFURT → 🇺🇸 NEW YORK": { "coords": [50.0379, 8.5622, 40.6413, -73.7781], "real_duration": 510, "distance_km": 6205, "aircraft": "Airbus A380", "callsign": "DLH403" },
+    
+    # Ultra Long Haul (360+ mins)
+    "🇺🇸 LOS ANGELES → 🇦🇺 SYDNEY": { "coords": [33.9416, -118.4085, -33.9399, 151.1753], "real_duration": 900, "distance_km": 12051, "aircraft": "Boeing 787", "callsign": "QFA012" },
+    "🇬🇧 LONDON → 🇦🇺 PERTH": { "coords": [51.4700, -0.4543, -31.9385, 115.9672], "real_duration": 1020, "distance_km": 14498, "aircraft": "Boeing 787", "callsign": "QFA009" },
+    "🇶🇦 DOHA → 🇳🇿 AUCKLAND": { "coords": [25.2609, 51.5651, -37.0082, 174.7850], "real_duration": 960, "distance_km": 14535, "aircraft": "Boeing 777", "callsign": "QTR920" }
+}
+
+FOCUS_PRESETS = [
+    ("Quick Focus", 25), ("Standard Session", 40), ("Deep Work", 60), ("Extended Focus", 90),
+    ("Movie Length", 120), ("Study Block", 180), ("Work Shift", 240), ("Marathon", 360)
+]
+
+# Longest focus session offered (custom time box, status API, team files)
+MAX_FOCUS_MINUTES = 720
+
+CRUISE_ALTITUDE_FT = 38000
+# Climb and descent each take this fraction of the session; the altitude is flat in between
+CLIMB_FRACTION = 0.1
+
+
+def in_cruise(progress):
+    return CLIMB_FRACTION <= progress <= 1 - CLIMB_FRACTION
+
+
+def altitude_ft(progress):
+    """Linear climb, flat cruise, linear descent"""
+    if progress < CLIMB_FRACTION: return CRUISE_ALTITUDE_FT * progress / CLIMB_FRACTION
+    if progress > 1 - CLIMB_FRACTION: return CRUISE_ALTITUDE_FT * (1 - progress) / CLIMB_FRACTION
+    return CRUISE_ALTITUDE_FT
+
+
+def remaining_km(total_km, progress):
+    """Great-circle distance left; slerp waypoints are equal arcs, so distance is linear in progress"""
+    return total_km * (1 - min(max(progress, 0.0), 1.0))
+
+
+def format_hms(seconds):
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h:02}:{m:02}:{s:02}"
+
+
+def telemetry(clock, total_km, profile=None):
+    """Dashboard values at one reading of the session clock; nothing else goes in, so replays match"""
+    elapsed = clock.elapsed()
+    progress = elapsed / clock.total_seconds if clock.total_seconds else 1.0
+    values = {"t": elapsed, "progress": progress, "seconds_left": math.ceil(clock.total_seconds - elapsed)}
+    if profile is None:
+        values.update(altitude_ft=int(altitude_ft(progress)), remaining_km=int(remaining_km(total_km, progress)))
+    else:
+        # One interpolation between two precomputed samples
+        altitude, flown, speed = profile.at(progress)
+        values.update(altitude_ft=int(altitude), remaining_km=int(total_km * (1 - flown)), ground_speed_kts=int(speed))
+    return values
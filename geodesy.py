@@ -0,0 +1,117 @@
+"""
+FlightFocus Pro - great-circle route engine
+- Waypoints are spherical linear interpolations (slerp) between the two airports,
+  so the plane stays on the drawn geodesic instead of a straight lat/lng line.
+- Cumulative distance and bearing tables are computed in one vectorized pass;
+  the map page and the dashboard only ever do a table lookup.
+"""
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+ROUTE_STEPS = 256
+# Fraction of the route used to take the heading at a waypoint
+BEARING_LOOKAHEAD = 1e-4
+
+
+def to_unit_vectors(lat, lon):
+    """Degrees -> (N, 3) unit vectors on the sphere"""
+    phi, lam = np.radians(lat), np.radians(lon)
+    cos_phi = np.cos(phi)
+    return np.stack([cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)], axis=-1)
+
+
+def initial_bearings(lat1, lon1, lat2, lon2):
+    """Vectorized forward azimuth in degrees [0, 360) from point 1 to point 2"""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dlam = np.radians(lon2 - lon1)
+    y = np.sin(dlam) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(dlam)
+    return (np.degrees(np.arctan2(y, x)) + 360.0) % 360.0
+
+
+def distances_km(lat, lon, lats, lons):
+    """Batched haversine: great-circle km from one point to many"""
+    phi1, phi2 = np.radians(lat), np.radians(lats)
+    a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(np.radians(lons - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class RouteTable:
+    """Precomputed waypoint / distance / bearing table for one route"""
+
+    def __init__(self, lats, lons, cum_km, bearings):
+        self.lats = lats
+        self.lons = lons          # unwrapped: continuous across the antimeridian
+        self.cum_km = cum_km
+        self.bearings = bearings
+        self.steps = len(lats) - 1
+        self._fractions = np.linspace(0.0, 1.0, len(lats))
+
+    @property
+    def total_km(self):
+        return float(self.cum_km[-1])
+
+    def distance_at(self, progress):
+        return float(np.interp(progress, self._fractions, self.cum_km))
+
+    def remaining_km(self, progress):
+        return self.total_km - self.distance_at(progress)
+
+    def position(self, progress):
+        """(lat, lon, bearing) at a 0..1 progress fraction"""
+        i = min(int(max(progress, 0.0) * self.steps), self.steps)
+        lat = float(np.interp(progress, self._fractions, self.lats))
+        lon = float(np.interp(progress, self._fractions, self.lons))
+        return lat, lon, float(self.bearings[i])
+
+    def to_payload(self):
+        """Compact JSON-ready form shipped to the map page once per route"""
+        return {
+            "lat": np.round(self.lats, 5).tolist(),
+            "lng": np.round(self.lons, 5).tolist(),
+            "bearing": np.round(self.bearings, 1).tolist(),
+            "cumKm": np.round(self.cum_km, 2).tolist(),
+            "totalKm": round(self.total_km, 2),
+        }
+
+
+def _slerp(p1, p2, omega, t):
+    if omega < 1e-9: return np.repeat(p1[None, :], len(t), axis=0)
+    sin_omega = np.sin(omega)
+    return (np.sin((1.0 - t) * omega) / sin_omega)[:, None] * p1 + (np.sin(t * omega) / sin_omega)[:, None] * p2
+
+
+def _lat_lon(points):
+    lats = np.degrees(np.arcsin(np.clip(points[:, 2], -1.0, 1.0)))
+    return lats, np.degrees(np.unwrap(np.arctan2(points[:, 1], points[:, 0])))
+
+
+def great_circle_points(lat1, lon1, lat2, lon2, fractions):
+    """(lats, lons) at distance fractions along the great circle, without the route table (lons unwrapped)"""
+    p1, p2 = to_unit_vectors(np.array([lat1, lat2]), np.array([lon1, lon2]))
+    omega = float(np.arccos(np.clip(np.dot(p1, p2), -1.0, 1.0)))
+    return _lat_lon(_slerp(p1, p2, omega, np.clip(np.asarray(fractions, dtype=float), 0.0, 1.0)))
+
+
+def great_circle_route(lat1, lon1, lat2, lon2, steps=ROUTE_STEPS, fractions=None):
+    """Build the RouteTable for one origin/destination pair in a single batched call.
+    fractions: distance flown at each of the steps + 1 rows (a flight profile's curve, so rows
+    are evenly spaced in time); evenly spaced in distance by default."""
+    p1, p2 = to_unit_vectors(np.array([lat1, lat2]), np.array([lon1, lon2]))
+    omega = float(np.arccos(np.clip(np.dot(p1, p2), -1.0, 1.0)))
+    t = np.linspace(0.0, 1.0, steps + 1) if fractions is None else np.clip(np.asarray(fractions, dtype=float), 0.0, 1.0)
+    lats, lons = _lat_lon(_slerp(p1, p2, omega, t))
+
+    # Slerp is uniform in arc length, so cumulative distance is exactly linear in t
+    cum_km = t * omega * EARTH_RADIUS_KM
+
+    # Heading of the path at each row: towards a point just ahead (rows may repeat while on the ground)
+    ahead_lats, ahead_lons = _lat_lon(_slerp(p1, p2, omega, np.minimum(t + BEARING_LOOKAHEAD, 1.0)))
+    bearings = initial_bearings(lats, lons, ahead_lats, ahead_lons)
+    # At the destination: reverse azimuth from a point just behind
+    at_end = t > 1.0 - BEARING_LOOKAHEAD
+    if at_end.any():
+        behind_lats, behind_lons = _lat_lon(_slerp(p1, p2, omega, np.array([1.0 - BEARING_LOOKAHEAD])))
+        bearings[at_end] = (initial_bearings(lats[-1], lons[-1], behind_lats[0], behind_lons[0]) + 180.0) % 360.0
+    return RouteTable(lats, lons, cum_km, bearings)
@@ -0,0 +1,158 @@
+"""
+FlightFocus Pro - opt-in instrumentation
+Spans, samples and counters for the hot paths (telemetry jitter, flight-list rebuilds,
+page loads, in-page frame cost, renderer memory). Disabled by default: the NULL_PROFILER
+stand-in turns every call into a no-op, so instrumented code pays nothing.
+Results feed the on-screen overlay and can be dumped to a rotating log or Chrome-trace JSON.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import nullcontext
+from logging.handlers import RotatingFileHandler
+
+MAX_TRACE_EVENTS = 200_000
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+
+_NULL_SPAN = nullcontext()
+
+
+def process_rss_mb(pid):
+    """Resident set size of one process from /proc, or None where unavailable"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class Metric:
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = float("-inf")
+        self.last = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.last = value
+
+    def summary(self):
+        return {"count": self.count, "mean": self.total / self.count if self.count else None,
+                "max": self.max if self.count else None, "last": self.last}
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._finish(self.name, self.start, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """Collects metrics and trace events; one instance per process"""
+    enabled = True
+
+    def __init__(self, log_path=None):
+        self.metrics = {}
+        self.events = deque(maxlen=MAX_TRACE_EVENTS)
+        self._open = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self.log = None
+        if log_path:
+            os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+            handler = RotatingFileHandler(log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.log = logging.getLogger("flight_focus.profile")
+            self.log.setLevel(logging.INFO)
+            self.log.propagate = False
+            self.log.addHandler(handler)
+
+    def _us(self, t):
+        return int((t - self._origin) * 1e6)
+
+    def _metric(self, name):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = Metric()
+        return metric
+
+    def _finish(self, name, start, end):
+        with self._lock:
+            self._metric(name + "_ms").add((end - start) * 1000)
+            self.events.append({"name": name, "ph": "X", "ts": self._us(start), "dur": self._us(end) - self._us(start),
+                                "pid": self._pid, "tid": threading.get_ident()})
+
+    def span(self, name):
+        """Context manager timing a synchronous block"""
+        return _Span(self, name)
+
+    def begin(self, name):
+        """Start an asynchronous span (e.g. a page load finished by a signal)"""
+        self._open[name] = time.perf_counter()
+
+    def end(self, name):
+        start = self._open.pop(name, None)
+        if start is not None:
+            self._finish(name, start, time.perf_counter())
+
+    def sample(self, name, value):
+        """Record one observation of a value (also emitted as a trace counter)"""
+        if value is None: return
+        with self._lock:
+            self._metric(name).add(value)
+            self.events.append({"name": name, "ph": "C", "ts": self._us(time.perf_counter()),
+                                "pid": self._pid, "args": {"value": value}})
+
+    def summary(self):
+        with self._lock:
+            return {name: m.summary() for name, m in sorted(self.metrics.items())}
+
+    def flush_log(self):
+        if self.log: self.log.info(json.dumps(self.summary(), separators=(",", ":")))
+
+    def dump_chrome_trace(self, path):
+        """Write events in the Chrome trace format (chrome://tracing, Perfetto)"""
+        with self._lock:
+            events = list(self.events)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, path)
+
+
+class NullProfiler:
+    """Stand-in used when instrumentation is off; every call is a no-op"""
+    enabled = False
+    metrics = {}
+
+    def span(self, name): return _NULL_SPAN
+    def begin(self, name): pass
+    def end(self, name): pass
+    def sample(self, name, value): pass
+    def summary(self): return {}
+    def flush_log(self): pass
+    def dump_chrome_trace(self, path): pass
+
+
+NULL_PROFILER = NullProfiler()
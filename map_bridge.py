@@ -0,0 +1,110 @@
+"""
+FlightFocus Pro - map page bridge
+Typed Python <-> JS command API over QWebChannel. The map page is loaded once;
+every session afterwards is just loadRoute / setProgress / setDaylight / reset on the live page.
+"""
+
+import json
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+
+class MapBridge(QObject):
+    """Registered on the page's QWebChannel as `bridge`"""
+    # Python -> JS (the page connects to these)
+    loadRouteRequested = pyqtSignal(str)       # JSON payload: route table + info panel + focus seconds
+    progressChanged = pyqtSignal(float, float) # progress 0..1, progress per second for extrapolation
+    resetRequested = pyqtSignal()
+    statsIntervalChanged = pyqtSignal(int)     # ms between page stats reports, 0 = off
+    fleetChanged = pyqtSignal(str)             # JSON: routes + progress of every concurrent session
+    fleetProgressChanged = pyqtSignal(str)     # JSON: [[id, progress, rate], ...] in one batch
+    daylightChanged = pyqtSignal(str)          # JSON: terminator shape (lng from the subsolar point) + nightfall points
+    sunMoved = pyqtSignal(float, float)        # subsolar lat, lng: the page shifts the terminator shape
+
+    # JS -> Python
+    pageReady = pyqtSignal()
+    firstFrameRendered = pyqtSignal()
+    statsReported = pyqtSignal(object)         # dict from the page's getRenderStats()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ready = False
+        self._pending_route = None
+        self._pending_progress = None
+        self._stats_interval = 0
+        self._pending_fleet = None
+        self._pending_fleet_progress = None
+        self._pending_daylight = None
+        self._pending_sun = None
+
+    def loadRoute(self, route_table, info, focus_seconds):
+        payload = json.dumps({"route": route_table.to_payload(), "info": info, "focusSeconds": focus_seconds},
+                             separators=(",", ":"))
+        self._pending_progress = self._pending_daylight = self._pending_sun = None
+        if self.ready: self.loadRouteRequested.emit(payload)
+        else: self._pending_route = payload
+
+    def setProgress(self, progress, rate_per_sec):
+        if self.ready: self.progressChanged.emit(float(progress), float(rate_per_sec))
+        else: self._pending_progress = (float(progress), float(rate_per_sec))
+
+    def reset(self):
+        self._pending_route = self._pending_progress = None
+        self._pending_daylight = self._pending_sun = None
+        if self.ready: self.resetRequested.emit()
+
+    def setStatsInterval(self, interval_ms):
+        self._stats_interval = int(interval_ms)
+        if self.ready: self.statsIntervalChanged.emit(self._stats_interval)
+
+    def setFleet(self, payload):
+        self._pending_fleet_progress = None
+        if self.ready: self.fleetChanged.emit(payload)
+        else: self._pending_fleet = payload
+
+    def setFleetProgress(self, batch):
+        if self.ready: self.fleetProgressChanged.emit(batch)
+        else: self._pending_fleet_progress = batch
+
+    def setDaylight(self, payload):
+        if self.ready: self.daylightChanged.emit(payload)
+        else: self._pending_daylight = payload
+
+    def setSunPosition(self, lat, lng):
+        if self.ready: self.sunMoved.emit(float(lat), float(lng))
+        else: self._pending_sun = (float(lat), float(lng))
+
+    @pyqtSlot()
+    def notifyReady(self):
+        # Commands issued before the page finished bootstrapping are replayed once, latest state only
+        self.ready = True
+        if self._pending_route is not None:
+            self.loadRouteRequested.emit(self._pending_route)
+        if self._pending_progress is not None:
+            self.progressChanged.emit(*self._pending_progress)
+        self._pending_route = self._pending_progress = None
+        if self._pending_daylight is not None:
+            self.daylightChanged.emit(self._pending_daylight)
+        if self._pending_sun is not None:
+            self.sunMoved.emit(*self._pending_sun)
+        self._pending_daylight = self._pending_sun = None
+        if self._pending_fleet is not None:
+            self.fleetChanged.emit(self._pending_fleet)
+        if self._pending_fleet_progress is not None:
+            self.fleetProgressChanged.emit(self._pending_fleet_progress)
+        self._pending_fleet = self._pending_fleet_progress = None
+        if self._stats_interval:
+            self.statsIntervalChanged.emit(self._stats_interval)
+        self.pageReady.emit()
+
+    @pyqtSlot()
+    def notifyFirstFrame(self):
+        # First frame drawn after a setProgress that (re)started the animation
+        self.firstFrameRendered.emit()
+
+    @pyqtSlot(str)
+    def reportStats(self, stats_json):
+        try:
+            self.statsReported.emit(json.loads(stats_json))
+        except ValueError:
+            pass
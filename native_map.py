@@ -0,0 +1,490 @@
+"""
+FlightFocus Pro - native map view
+A QPainter alternative to the Leaflet page for machines where a whole Chromium
+renderer is too heavy:
+- bundled, hand-simplified coastlines (data/coastlines.json), no tiles, no network
+- coastlines, graticule, route and info panel are painted once into a cached QPixmap
+- every tick only repaints the dirty rectangle around the plane and its label
+- the day/night terminator is part of the static layer, shifted from the shape sent once per
+  flight; it moves every few minutes of flight time, and only then is the layer rebuilt
+Exposes the same command API as MapBridge (loadRoute / setProgress / setDaylight / reset / ...).
+"""
+
+import os
+import json
+import math
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF, pyqtSignal
+from PyQt6.QtGui import QPainter, QPainterPath, QPixmap, QPen, QColor, QFont, QPolygonF, QFontMetrics
+
+COASTLINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "coastlines.json")
+
+MAX_MERCATOR_LAT = 85.0
+MIN_SPAN_DEG = 12.0
+FIT_PADDING = 0.18
+MIN_INTERVAL_MS, MAX_INTERVAL_MS = 16, 500
+
+COLORS = {
+    "ocean": "#1f2a33",
+    "land": "#3a3d41",
+    "coast": "#5e5c64",
+    "graticule": "#2b3742",
+    "route": "#367bf0",
+    "flown": "#57e389",
+    "plane": "#367bf0",
+    "panel": "#2d2d2d",
+    "text": "#f6f5f4",
+    "text_secondary": "#deddda",
+    "header": "#367bf0",
+    "night": "#0b1026",
+    "sun": "#f9f06b",
+}
+NIGHT_ALPHA = 120
+# Same texts as the page's plane label
+LABEL_FORMAT = "FEDORA FOCUS: {}%"
+ARRIVED_LABEL = "ARRIVED ✓ FOCUS COMPLETE"
+
+
+def mercator_y(lat):
+    """Web Mercator northing in degrees-equivalent units, so lon/lat scale alike at the equator"""
+    phi = np.radians(np.clip(lat, -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT))
+    return np.degrees(np.log(np.tan(np.pi / 4 + phi / 2)))
+
+
+@lru_cache(maxsize=1)
+def load_coastlines(path=COASTLINES_PATH):
+    """Coastline rings as (lon, mercator y) float arrays, loaded once per process"""
+    try:
+        with open(path) as f:
+            rings = json.load(f)["rings"]
+    except (OSError, ValueError, KeyError):
+        return ()
+    out = []
+    for ring in rings:
+        coords = np.asarray(ring["coords"], dtype=float).reshape(-1, 2)
+        out.append((coords[:, 0], mercator_y(coords[:, 1])))
+    return tuple(out)
+
+
+def polygon(xs, ys):
+    return QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())])
+
+
+class NativeMapView(QWidget):
+    """QPainter flight view; a drop-in for the QWebEngineView + MapBridge pair"""
+    pageReady = pyqtSignal()
+    firstFrameRendered = pyqtSignal()
+    statsReported = pyqtSignal(object)
+
+    # Plane glyph (same outline as the page's SVG), pointing north, in a 24x24 box
+    PLANE_SIZE = 44
+    LABEL_OFFSET = 46
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ready = True
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.coastlines = load_coastlines()
+
+        self.route = None
+        self.info = None
+        self.focus_seconds = 1.0
+        self.sync_progress = 0.0
+        self.sync_time = 0.0
+        self.rate = 0.0
+        self.running = False
+        self.frozen = False
+        self.first_frame_pending = False
+
+        # Screen-space state, rebuilt with the static layer
+        self.static = None
+        self.route_px = None
+        self.plane_pos = None
+        self.plane_bearing = 0.0
+        self.percent = -1
+        self.progress = 0.0
+
+        # Terminator shape as (lon offsets from the subsolar point, mercator y), subsolar point, nightfall points
+        self.night = None
+        self.sun = None
+        self.nightfall = []
+
+        self.label_font = QFont("Cantarell", 10, QFont.Weight.Bold)
+        self.plane_path = self.build_plane_path()
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.timeout.connect(self.animate)
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(lambda: self.statsReported.emit(self.render_stats()))
+
+        self.ticks = 0
+        self.renders = 0
+        self.interval_ms = 0
+        self.render_ms_total = 0.0
+        self.max_render_ms = 0.0
+        self.window_start = time.perf_counter()
+        self.window_renders = 0
+        self.fps = 0.0
+
+    # --- COMMAND API (mirrors MapBridge) ---
+    def loadRoute(self, route_table, info, focus_seconds):
+        self.route = route_table
+        self.info = info
+        self.focus_seconds = max(float(focus_seconds), 1.0)
+        self.sync_progress, self.rate, self.running = 0.0, 0.0, False
+        self.night, self.sun, self.nightfall = None, None, []
+        self.frame_timer.stop()
+        self.invalidate_static()
+
+    def setProgress(self, progress, rate_per_sec):
+        self.sync_progress = float(progress)
+        self.rate = float(rate_per_sec)
+        self.sync_time = time.monotonic()
+        self.running = self.route is not None
+        self.first_frame_pending = True
+        self.schedule(0)
+
+    def reset(self):
+        self.route = self.info = None
+        self.night, self.sun, self.nightfall = None, None, []
+        self.running = False
+        self.frame_timer.stop()
+        self.invalidate_static()
+
+    def setDaylight(self, payload):
+        data = json.loads(payload)
+        self.night = (np.asarray(data["dlng"], dtype=float), mercator_y(np.asarray(data["lat"], dtype=float)))
+        self.nightfall = [(p["lng"], p["lat"], p["progress"]) for p in data["nightfall"]]
+        self.static = None
+        self.update()
+
+    def setSunPosition(self, lat, lng):
+        self.sun = (float(lat), float(lng))
+        self.static = None
+        self.update()
+
+    def setStatsInterval(self, interval_ms):
+        if interval_ms > 0: self.stats_timer.start(int(interval_ms))
+        else: self.stats_timer.stop()
+
+    def setFrozen(self, frozen):
+        """Window hidden or screen locked: no frames at all until thawed, then one catch-up frame"""
+        self.frozen = bool(frozen)
+        if self.frozen: self.frame_timer.stop()
+        elif self.running: self.schedule(0)
+
+    def setFleet(self, payload):
+        """The team fleet layer is drawn by the Leaflet page only: the app hides the team map with this view"""
+
+    def setFleetProgress(self, batch):
+        pass
+
+    def render_stats(self):
+        """Same keys as the page's getRenderStats(); there is no JS heap here"""
+        return {"fps": self.fps, "ticks": self.ticks, "renders": self.renders, "intervalMs": self.interval_ms,
+                "renderMs": self.render_ms_total / self.renders if self.renders else 0.0,
+                "maxRenderMs": self.max_render_ms, "heapBytes": None}
+
+    # --- PROJECTION ---
+    def progress_at(self, now):
+        return min(self.sync_progress + self.rate * (now - self.sync_time), 1.0)
+
+    def fit_transform(self):
+        """Scale/offset fitting the route (plus padding) into the widget, keeping Mercator aspect"""
+        xs, ys = self.route_xy
+        x0, x1 = float(xs.min()), float(xs.max())
+        y0, y1 = float(ys.min()), float(ys.max())
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        span_x = max((x1 - x0) * (1 + 2 * FIT_PADDING), MIN_SPAN_DEG)
+        span_y = max((y1 - y0) * (1 + 2 * FIT_PADDING), MIN_SPAN_DEG)
+        w, h = max(self.width(), 1), max(self.height(), 1)
+        scale = min(w / span_x, h / span_y)
+        return scale, w / 2 - cx * scale, h / 2 + cy * scale
+
+    def to_screen(self, xs, ys):
+        scale, ox, oy = self.transform
+        return xs * scale + ox, oy - ys * scale
+
+    # --- STATIC LAYER ---
+    def invalidate_static(self):
+        self.static = None
+        self.plane_pos = None
+        self.percent = -1
+        self.update()
+
+    def resizeEvent(self, event):
+        self.static = None
+        super().resizeEvent(event)
+
+    def build_static(self):
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QColor(COLORS["ocean"]))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if self.route is not None:
+            self.route_xy = (self.route.lons, mercator_y(self.route.lats))
+        else:
+            self.route_xy = (np.array([-150.0, 170.0]), mercator_y(np.array([-50.0, 70.0])))
+        self.transform = self.fit_transform()
+        self.paint_graticule(painter)
+        self.paint_land(painter)
+        self.paint_night(painter)
+
+        if self.route is not None:
+            sx, sy = self.to_screen(*self.route_xy)
+            self.route_px = (sx, sy)
+            pen = QPen(QColor(COLORS["route"]), 3, Qt.PenStyle.CustomDashLine, Qt.PenCapStyle.RoundCap)
+            pen.setDashPattern([3, 3])
+            painter.setPen(pen)
+            painter.drawPolyline(polygon(sx, sy))
+            painter.setPen(QPen(QColor(COLORS["text"]), 2))
+            painter.setBrush(QColor(COLORS["route"]))
+            for i in (0, -1):
+                painter.drawEllipse(QPointF(sx[i], sy[i]), 6, 6)
+            self.paint_nightfall(painter)
+            self.paint_info_panel(painter)
+
+        self.paint_header(painter)
+        painter.end()
+        self.static = pixmap
+
+    def visible_offsets(self):
+        """Multiples of 360 degrees at which world copies overlap the view (routes are unwrapped)"""
+        scale, ox, _ = self.transform
+        left, right = -ox / scale, (self.width() - ox) / scale
+        return [k * 360.0 for k in range(math.floor(left / 360) - 1, math.ceil(right / 360) + 2)
+                if left < k * 360 + 190 and right > k * 360 - 180]
+
+    def paint_land(self, painter):
+        path = QPainterPath()
+        path.setFillRule(Qt.FillRule.WindingFill)
+        for offset in self.visible_offsets():
+            for xs, ys in self.coastlines:
+                sx, sy = self.to_screen(xs + offset, ys)
+                path.addPolygon(polygon(sx, sy))
+                path.closeSubpath()
+        painter.setPen(QPen(QColor(COLORS["coast"]), 1))
+        painter.setBrush(QColor(COLORS["land"]))
+        painter.drawPath(path)
+
+    def paint_graticule(self, painter):
+        scale, ox, oy = self.transform
+        step = 30 if scale < 4 else 10 if scale < 20 else 5
+        painter.setPen(QPen(QColor(COLORS["graticule"]), 1))
+        left, right = -ox / scale, (self.width() - ox) / scale
+        for lon in range(math.floor(left / step) * step, math.ceil(right / step) * step + 1, step):
+            x = lon * scale + ox
+            painter.drawLine(QPointF(x, 0), QPointF(x, self.height()))
+        for lat in range(-80, 81, step):
+            y = oy - float(mercator_y(lat)) * scale
+            painter.drawLine(QPointF(0, y), QPointF(self.width(), y))
+
+    def paint_night(self, painter):
+        if self.night is None or self.sun is None: return
+        dlon, ys = self.night
+        sx, sy = self.to_screen(dlon + self.sun[1], ys)
+        night = QColor(COLORS["night"])
+        night.setAlpha(NIGHT_ALPHA)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(night)
+        painter.drawPolygon(polygon(sx, sy))
+        painter.setBrush(QColor(COLORS["sun"]))
+        for offset in self.visible_offsets():
+            x, y = self.to_screen(self.sun[1] + offset, mercator_y(self.sun[0]))
+            painter.drawEllipse(QPointF(float(x), float(y)), 9, 9)
+
+    def paint_nightfall(self, painter):
+        painter.setFont(self.label_font)
+        for lon, lat, progress in self.nightfall:
+            x, y = self.to_screen(lon, mercator_y(lat))
+            pos = QPointF(float(x), float(y))
+            painter.setPen(QPen(QColor(COLORS["text"]), 2))
+            painter.setBrush(QColor(COLORS["night"]))
+            painter.drawEllipse(pos, 6, 6)
+            text = f"🌙 NIGHTFALL · {round(progress * 100)}%"
+            width = QFontMetrics(self.label_font).horizontalAdvance(text) + 20
+            label = QRectF(pos.x() - width / 2, pos.y() + 12, width, 24)
+            painter.setPen(QPen(QColor(COLORS["coast"]), 2))
+            painter.drawRoundedRect(label, 6, 6)
+            painter.setPen(QColor(COLORS["text"]))
+            painter.drawText(label, Qt.AlignmentFlag.AlignCenter, text)
+
+    def paint_header(self, painter):
+        painter.setFont(QFont("Cantarell", 12, QFont.Weight.Bold))
+        text = "✈️ FlightFocus Pro - Native View"
+        rect = QRectF(20, 20, QFontMetrics(painter.font()).horizontalAdvance(text) + 40, 40)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(COLORS["header"]))
+        painter.drawRoundedRect(rect, 8, 8)
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+    def paint_info_panel(self, painter):
+        lines = [f"📏 Distance: {self.info['distance']} km", f"🛩️ Aircraft: {self.info['aircraft']}",
+                 f"🕐 Real Duration: {self.info['duration']}", f"📍 Route: {self.info['route']}",
+                 f"⚡ Speed: {self.info['speed']}"]
+        body = QFont("Cantarell", 10)
+        title = QFont("Cantarell", 13, QFont.Weight.Bold)
+        width = max(QFontMetrics(body).horizontalAdvance(l) for l in lines) + 40
+        rect = QRectF(self.width() - width - 20, 20, width, 64 + 24 * len(lines))
+        painter.setPen(QPen(QColor(COLORS["coast"]), 2))
+        painter.setBrush(QColor(COLORS["panel"]))
+        painter.drawRoundedRect(rect, 12, 12)
+        painter.setFont(title)
+        painter.setPen(QColor(COLORS["flown"]))
+        painter.drawText(rect.adjusted(20, 16, -20, 0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                         f"✈️ {self.info['callsign']}")
+        painter.setFont(body)
+        painter.setPen(QColor(COLORS["text_secondary"]))
+        for i, line in enumerate(lines):
+            painter.drawText(QPointF(rect.left() + 20, rect.top() + 70 + 24 * i), line)
+
+    # --- DYNAMIC LAYER ---
+    @staticmethod
+    def build_plane_path():
+        outline = [(21, 16), (21, 14), (13, 9), (13, 3.5), (12, 2), (11, 2), (10, 3.5), (10, 9), (2, 14), (2, 16),
+                   (10, 13.5), (10, 19), (8, 20.5), (8, 22), (11.5, 21), (15, 22), (15, 20.5), (13, 19), (13, 13.5)]
+        path = QPainterPath()
+        path.addPolygon(QPolygonF([QPointF(x - 11.5, y - 12) for x, y in outline]))
+        path.closeSubpath()
+        return path
+
+    def position_px(self, progress):
+        sx, sy = self.route_px
+        x = min(max(progress, 0.0), 1.0) * (len(sx) - 1)
+        i = min(int(x), len(sx) - 2)
+        f = x - i
+        return QPointF(sx[i] + (sx[i + 1] - sx[i]) * f, sy[i] + (sy[i + 1] - sy[i]) * f), i
+
+    def label_text(self):
+        return ARRIVED_LABEL if self.progress >= 1.0 else LABEL_FORMAT.format(self.percent)
+
+    def dynamic_rect(self, pos):
+        """Screen area covered by the plane and its label at pos"""
+        half = self.PLANE_SIZE / 2 + 8
+        label_w = QFontMetrics(self.label_font).horizontalAdvance(ARRIVED_LABEL) + 40
+        plane = QRectF(pos.x() - half, pos.y() - half, 2 * half, 2 * half)
+        label = QRectF(pos.x() - label_w / 2, pos.y() - self.LABEL_OFFSET - 18, label_w, 36)
+        return plane.united(label)
+
+    def place_plane(self, progress):
+        pos, i = self.position_px(progress)
+        self.plane_pos, self.plane_bearing = pos, float(self.route.bearings[i])
+        self.percent, self.progress = round(progress * 100), progress
+
+    def render(self, progress):
+        """Move the plane if it moved a pixel, turned or the percent changed; repaint only what it covered"""
+        last, last_bearing, last_label = self.plane_pos, self.plane_bearing, self.label_text()
+        self.place_plane(progress)
+        pos = self.plane_pos
+        if last is not None and abs(pos.x() - last.x()) < 1 and abs(pos.y() - last.y()) < 1 \
+                and self.plane_bearing == last_bearing and self.label_text() == last_label:
+            self.plane_pos = last
+            return False
+
+        dirty = self.dynamic_rect(pos)
+        if last is not None: dirty = dirty.united(self.dynamic_rect(last))
+        self.update(dirty.toAlignedRect().adjusted(-2, -2, 2, 2))
+        return True
+
+    def next_change_in(self, progress, pos, percent):
+        """Seconds until one pixel of travel or the next percent step, like the page scheduler"""
+        ahead, _ = self.position_px(min(progress + self.rate, 1.0))
+        px_per_sec = max(abs(ahead.x() - pos.x()), abs(ahead.y() - pos.y()))
+        until_pixel = 1.0 / px_per_sec if px_per_sec > 0 else MAX_INTERVAL_MS / 1000
+        until_percent = ((percent + 0.5) / 100 - progress) / self.rate if self.rate > 0 else MAX_INTERVAL_MS / 1000
+        return min(max(min(until_pixel, until_percent) * 1000, MIN_INTERVAL_MS), MAX_INTERVAL_MS)
+
+    def schedule(self, delay_ms):
+        self.interval_ms = delay_ms
+        self.frame_timer.setTimerType(Qt.TimerType.PreciseTimer if delay_ms <= MIN_INTERVAL_MS else Qt.TimerType.CoarseTimer)
+        self.frame_timer.start(int(delay_ms))
+
+    def animate(self):
+        if not self.running or self.frozen or not self.isVisible(): return
+        if self.static is None:
+            # Geometry is only known once painted; the paint event reschedules us
+            self.update()
+            return
+        self.ticks += 1
+        progress = self.progress_at(time.monotonic())
+        self.render(progress)
+        if progress >= 1.0: return
+        self.schedule(self.next_change_in(progress, self.plane_pos, self.percent))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.running: self.schedule(0)
+
+    # --- PAINTING ---
+    def paintEvent(self, event):
+        t0 = time.perf_counter()
+        if self.static is None or self.static.deviceIndependentSize().toSize() != self.size():
+            self.build_static()
+            if self.route is not None and self.plane_pos is not None: self.place_plane(self.progress)
+            # animate() gives up while the layer is missing (resize, terminator move): pick it up again
+            if self.running and not self.frozen and not self.frame_timer.isActive(): self.schedule(0)
+
+        painter = QPainter(self)
+        rect = event.rect()
+        dpr = self.static.devicePixelRatio()
+        painter.drawPixmap(QRectF(rect), self.static, QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr))
+
+        if self.route is not None and self.plane_pos is not None:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setClipRect(rect)
+            self.paint_flown(painter)
+            self.paint_plane(painter)
+        painter.end()
+
+        if self.plane_pos is None: return
+        elapsed = (time.perf_counter() - t0) * 1000
+        self.renders += 1
+        self.window_renders += 1
+        self.render_ms_total += elapsed
+        self.max_render_ms = max(self.max_render_ms, elapsed)
+        now = time.perf_counter()
+        if now - self.window_start >= 1.0:
+            self.fps = self.window_renders / (now - self.window_start)
+            self.window_start, self.window_renders = now, 0
+        if self.first_frame_pending:
+            self.first_frame_pending = False
+            self.firstFrameRendered.emit()
+
+    def paint_flown(self, painter):
+        sx, sy = self.route_px
+        _, i = self.position_px(self.progress)
+        flown = polygon(sx[:i + 1], sy[:i + 1])
+        flown.append(self.plane_pos)
+        painter.setPen(QPen(QColor(COLORS["flown"]), 3, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+        painter.drawPolyline(flown)
+
+    def paint_plane(self, painter):
+        pos = self.plane_pos
+        painter.save()
+        painter.translate(pos)
+        painter.rotate(self.plane_bearing)
+        painter.scale(self.PLANE_SIZE / 24, self.PLANE_SIZE / 24)
+        painter.setPen(QPen(QColor(COLORS["text"]), 0.6))
+        painter.setBrush(QColor(COLORS["plane"]))
+        painter.drawPath(self.plane_path)
+        painter.restore()
+
+        text = self.label_text()
+        painter.setFont(self.label_font)
+        width = QFontMetrics(self.label_font).horizontalAdvance(text) + 24
+        label = QRectF(pos.x() - width / 2, pos.y() - self.LABEL_OFFSET - 15, width, 30)
+        painter.setPen(QPen(QColor(COLORS["route"]), 2))
+        painter.setBrush(QColor(COLORS["panel"]))
+        painter.drawRoundedRect(label, 6, 6)
+        painter.setPen(QColor(COLORS["text"]))
+        painter.drawText(label, Qt.AlignmentFlag.AlignCenter, text)
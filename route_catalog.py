@@ -0,0 +1,342 @@
+"""
+FlightFocus Pro - route catalog
+- Compact, column-oriented route store sorted by block time, so the focus-time
+  window and the nearest-duration fallback are bisect range queries.
+- Large catalogs (e.g. OpenFlights airports.dat + routes.dat) are compiled once into
+  a binary .ffcat file and memory-mapped on launch; records decode lazily on access.
+
+Compile:  python route_catalog.py compile airports.dat routes.dat routes.ffcat
+"""
+
+import os
+import sys
+import csv
+import math
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+CATALOG_MAGIC = b"FFRC"
+CATALOG_VERSION = 1
+HEADER = struct.Struct("<4sIIIII")  # magic, version, count, aircraft count, name blob bytes, aircraft blob bytes
+CALLSIGN_BYTES = 8
+DEFAULT_CATALOG_PATH = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share")), "flight-focus", "routes.ffcat")
+
+# Focus-time window (as a multiple of the focus minutes) and fallback size
+WINDOW_MIN_FACTOR = 0.3
+WINDOW_MAX_FACTOR = 2.0
+FALLBACK_COUNT = 3
+
+EARTH_RADIUS_KM = 6371.0088
+# Block time model: taxi/climb/approach overhead plus cruise distance per minute
+BLOCK_OVERHEAD_MIN = 40
+CRUISE_KM_PER_MIN = 14.5
+
+# OpenFlights equipment codes -> display names (first listed type wins)
+EQUIPMENT_NAMES = {
+    "319": "Airbus A319", "320": "Airbus A320", "321": "Airbus A321", "32A": "Airbus A320", "32B": "Airbus A321",
+    "32N": "Airbus A320neo", "32Q": "Airbus A321neo", "332": "Airbus A330", "333": "Airbus A330", "339": "Airbus A330neo",
+    "359": "Airbus A350", "351": "Airbus A350", "388": "Airbus A380", "221": "Airbus A220", "223": "Airbus A220",
+    "733": "Boeing 737", "734": "Boeing 737", "735": "Boeing 737", "736": "Boeing 737", "737": "Boeing 737",
+    "738": "Boeing 737", "739": "Boeing 737", "7M8": "Boeing 737 MAX", "7M9": "Boeing 737 MAX", "73H": "Boeing 737",
+    "744": "Boeing 747", "74H": "Boeing 747", "752": "Boeing 757", "753": "Boeing 757", "763": "Boeing 767",
+    "764": "Boeing 767", "772": "Boeing 777", "773": "Boeing 777", "77L": "Boeing 777", "77W": "Boeing 777",
+    "788": "Boeing 787", "789": "Boeing 787", "781": "Boeing 787", "E70": "Embraer E170", "E75": "Embraer E175",
+    "E90": "Embraer E190", "E95": "Embraer E195", "CR9": "Bombardier CRJ900", "CR7": "Bombardier CRJ700",
+    "DH4": "Dash 8 Q400", "AT7": "ATR 72", "AT5": "ATR 42",
+}
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2 +
+         math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def estimate_block_minutes(distance_km):
+    """Gate-to-gate time: fixed taxi/climb/approach overhead plus cruise at ~870 km/h"""
+    return int(round(BLOCK_OVERHEAD_MIN + distance_km / CRUISE_KM_PER_MIN))
+
+
+def block_minutes_to_km(minutes):
+    """Inverse of estimate_block_minutes: the distance that takes `minutes` gate to gate"""
+    return max(minutes - BLOCK_OVERHEAD_MIN, 0) * CRUISE_KM_PER_MIN
+
+
+def default_aircraft(distance_km):
+    if distance_km < 800: return "Airbus A320"
+    if distance_km < 4000: return "Boeing 737"
+    if distance_km < 9000: return "Boeing 787"
+    return "Boeing 777"
+
+
+def route_cities(name):
+    """'🇬🇧 LONDON → 🇫🇷 PARIS' -> ('LONDON', 'PARIS'); names without a flag prefix pass through"""
+    parts = name.split(" → ")
+    return tuple(p.split(" ", 1)[1] if p and not p[:1].isalnum() and " " in p else p for p in parts)
+
+
+def _pad8(n):
+    return (-n) % 8
+
+
+class ClosenessOrder:
+    """Indices lo..hi-1 by |duration - minutes|, closest first. The runs either side of the bisect
+    point are merged only as far as rows are read (the list view reads a screenful)."""
+
+    def __init__(self, durations, minutes, lo, hi, limit=None):
+        self.durations = durations
+        self.minutes = minutes
+        self.lo, self.hi = lo, hi
+        split = min(max(bisect_left(durations, minutes, lo, hi), lo), hi)
+        self._left, self._right = split - 1, split
+        self._order = []
+        self._len = hi - lo if limit is None else max(min(limit, hi - lo), 0)
+
+    def __len__(self):
+        return self._len
+
+    def __eq__(self, other):
+        if not isinstance(other, ClosenessOrder): return NotImplemented
+        return (self.durations is other.durations and self.minutes == other.minutes
+                and (self.lo, self.hi, self._len) == (other.lo, other.hi, other._len))
+
+    def _extend(self, n):
+        """Walk outward until n rows are known"""
+        d, m, order = self.durations, self.minutes, self._order
+        lo, hi, left, right = self.lo, self.hi, self._left, self._right
+        while len(order) < n:
+            if right >= hi or (left >= lo and m - d[left] <= d[right] - m):
+                order.append(left); left -= 1
+            else:
+                order.append(right); right += 1
+        self._left, self._right = left, right
+
+    def __getitem__(self, row):
+        if isinstance(row, slice): return [self[r] for r in range(*row.indices(self._len))]
+        if row < 0: row += self._len
+        if not 0 <= row < self._len: raise IndexError(row)
+        if row >= len(self._order): self._extend(row + 1)
+        return self._order[row]
+
+    def __iter__(self):
+        for row in range(self._len): yield self[row]
+
+    def index(self, i):
+        """Row of catalog index i; ValueError if it is not listed"""
+        if not self.lo <= i < self.hi: raise ValueError(i)
+        while not (self._left < i < self._right) and len(self._order) < self._len:
+            self._extend(len(self._order) + 1)
+        if self._left < i < self._right: return self._order.index(i)
+        raise ValueError(i)
+
+
+class RouteCatalog:
+    """Duration-sorted route columns; records are (name, data) tuples shaped like REAL_WORLD_FLIGHTS"""
+
+    def __init__(self, durations, distances, coords, aircraft_idx, aircraft_names, callsigns, name_at, source=None):
+        self.durations = durations        # sorted ascending, minutes
+        self.distances = distances
+        self.coords = coords              # lat1, lon1, lat2, lon2 interleaved
+        self.aircraft_idx = aircraft_idx
+        self.aircraft_names = aircraft_names
+        self.callsigns = callsigns        # bytes, CALLSIGN_BYTES per route
+        self._name_at = name_at
+        self.source = source              # the .ffcat path; None for an in-memory catalog
+        self._mmap = None  # keeps the mapping alive for the column views
+
+    # --- construction ---
+    @classmethod
+    def from_flights(cls, flights):
+        """In-memory catalog over a REAL_WORLD_FLIGHTS-style dict"""
+        rows = sorted(flights.items(), key=lambda kv: kv[1]['real_duration'])
+        aircraft_names = sorted({d['aircraft'] for _, d in rows})
+        aircraft_lookup = {a: i for i, a in enumerate(aircraft_names)}
+        names = [n for n, _ in rows]
+        return cls(
+            durations=array("H", (d['real_duration'] for _, d in rows)),
+            distances=array("I", (d['distance_km'] for _, d in rows)),
+            coords=array("f", (c for _, d in rows for c in d['coords'])),
+            aircraft_idx=array("H", (aircraft_lookup[d['aircraft']] for _, d in rows)),
+            aircraft_names=aircraft_names,
+            callsigns=b"".join(d['callsign'].encode("ascii")[:CALLSIGN_BYTES].ljust(CALLSIGN_BYTES, b"\0") for _, d in rows),
+            name_at=names.__getitem__,
+        )
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a compiled .ffcat file; O(1) in the number of routes"""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size: raise ValueError(f"{path}: truncated route catalog")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, n_aircraft, name_bytes, aircraft_bytes = HEADER.unpack_from(mm, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            raise ValueError(f"{path}: not a FlightFocus route catalog (v{CATALOG_VERSION})")
+
+        view = memoryview(mm)
+        offset = HEADER.size + _pad8(HEADER.size)
+
+        def column(fmt, length):
+            nonlocal offset
+            size = struct.calcsize(fmt) * length
+            if offset + size > len(mm): raise ValueError(f"{path}: truncated route catalog")
+            col = view[offset:offset + size]
+            offset += size + _pad8(size)
+            if sys.byteorder != "little":
+                col = array(fmt, col.tobytes()); col.byteswap()
+                return col
+            return col.cast(fmt) if fmt != "B" else col
+
+        durations = column("H", count)
+        distances = column("I", count)
+        coords = column("f", 4 * count)
+        aircraft_idx = column("H", count)
+        name_offsets = column("I", count + 1)
+        callsigns = column("B", CALLSIGN_BYTES * count)
+        names_blob = column("B", name_bytes)
+        aircraft_names = column("B", aircraft_bytes).tobytes().decode("utf-8").split("\n")[:n_aircraft]
+
+        def name_at(i):
+            return bytes(names_blob[name_offsets[i]:name_offsets[i + 1]]).decode("utf-8")
+
+        catalog = cls(durations, distances, coords, aircraft_idx, aircraft_names, callsigns, name_at, source=path)
+        catalog._mmap = mm
+        return catalog
+
+    # --- access ---
+    def __len__(self):
+        return len(self.durations)
+
+    def name(self, i):
+        return self._name_at(i)
+
+    def record(self, i):
+        c = self.coords
+        data = {
+            "coords": [round(c[4 * i], 4), round(c[4 * i + 1], 4), round(c[4 * i + 2], 4), round(c[4 * i + 3], 4)],
+            "real_duration": self.durations[i],
+            "distance_km": self.distances[i],
+            "aircraft": self.aircraft_names[self.aircraft_idx[i]],
+            "callsign": self.callsign(i),
+        }
+        return self.name(i), data
+
+    def callsign(self, i):
+        return bytes(self.callsigns[CALLSIGN_BYTES * i:CALLSIGN_BYTES * (i + 1)]).rstrip(b"\0").decode("ascii")
+
+    def records(self, indices):
+        return [self.record(i) for i in indices]
+
+    # --- queries ---
+    def duration_range(self, lo_minutes, hi_minutes):
+        """Indices with lo <= duration <= hi (already in duration order)"""
+        return range(bisect_left(self.durations, lo_minutes), bisect_right(self.durations, hi_minutes))
+
+    def by_closeness(self, minutes, within=None, limit=None):
+        """Indices ordered by |duration - minutes| (a lazy ClosenessOrder: O(log n) whatever the window)"""
+        within = within if within is not None else range(len(self))
+        return ClosenessOrder(self.durations, minutes, within.start, within.stop, limit)
+
+    def find(self, query, within=None):
+        """First index whose name contains the query or whose callsign starts with it (case-insensitive)"""
+        query = query.lower()
+        for i in within if within is not None else range(len(self)):
+            name, data = self.record(i)
+            if query in name.lower() or data["callsign"].lower().startswith(query): return i
+        return None
+
+    def select(self, focus_minutes):
+        """Routes for a focus time: the 0.3x-2.0x window closest first, else the nearest few"""
+        window = self.duration_range(focus_minutes * WINDOW_MIN_FACTOR, focus_minutes * WINDOW_MAX_FACTOR)
+        if len(window):
+            return self.by_closeness(focus_minutes, within=window)
+        return self.by_closeness(focus_minutes, limit=FALLBACK_COUNT)
+
+
+# --- COMPILER ---
+def write_catalog(path, routes):
+    """routes: iterable of (name, data) in REAL_WORLD_FLIGHTS shape; written duration-sorted"""
+    routes = sorted(routes, key=lambda r: (r[1]['real_duration'], r[1]['distance_km']))
+    aircraft_names = sorted({d['aircraft'] for _, d in routes})
+    aircraft_lookup = {a: i for i, a in enumerate(aircraft_names)}
+
+    names_blob = bytearray()
+    name_offsets = array("I", [0])
+    for name, _ in routes:
+        names_blob += name.encode("utf-8")
+        name_offsets.append(len(names_blob))
+    aircraft_blob = "\n".join(aircraft_names).encode("utf-8")
+
+    columns = [
+        array("H", (d['real_duration'] for _, d in routes)),
+        array("I", (d['distance_km'] for _, d in routes)),
+        array("f", (c for _, d in routes for c in d['coords'])),
+        array("H", (aircraft_lookup[d['aircraft']] for _, d in routes)),
+        name_offsets,
+        b"".join(d['callsign'].encode("ascii", "replace")[:CALLSIGN_BYTES].ljust(CALLSIGN_BYTES, b"\0") for _, d in routes),
+        bytes(names_blob),
+        aircraft_blob,
+    ]
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        header = HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(routes), len(aircraft_names), len(names_blob), len(aircraft_blob))
+        f.write(header + b"\0" * _pad8(len(header)))
+        for col in columns:
+            if isinstance(col, array) and sys.byteorder != "little":
+                col = array(col.typecode, col); col.byteswap()
+            raw = col.tobytes() if isinstance(col, array) else col
+            f.write(raw + b"\0" * _pad8(len(raw)))
+    os.replace(tmp, path)
+    return len(routes)
+
+
+def read_openflights(airports_path, routes_path):
+    """Yield (name, data) for each distinct non-stop airport pair in OpenFlights data"""
+    airports = {}
+    with open(airports_path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            try:
+                airports[row[0]] = (row[2] or row[1], row[4] if row[4] != "\\N" else row[5], float(row[6]), float(row[7]))
+            except (IndexError, ValueError):
+                continue
+
+    seen = set()
+    with open(routes_path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 9 or row[7] != "0": continue
+            src, dst = airports.get(row[3]), airports.get(row[5])
+            if src is None or dst is None or (row[3], row[5]) in seen or row[3] == row[5]: continue
+            seen.add((row[3], row[5]))
+
+            distance = haversine_km(src[2], src[3], dst[2], dst[3])
+            equipment = row[8].split()
+            aircraft = EQUIPMENT_NAMES.get(equipment[0]) if equipment else None
+            flight_no = (int(row[3]) * 31 + int(row[5])) % 900 + 100 if row[3].isdigit() and row[5].isdigit() else 100
+            yield (f"{src[0].upper()} ({src[1]}) → {dst[0].upper()} ({dst[1]})", {
+                "coords": [src[2], src[3], dst[2], dst[3]],
+                "real_duration": estimate_block_minutes(distance),
+                "distance_km": int(round(distance)),
+                "aircraft": aircraft or default_aircraft(distance),
+                "callsign": f"{row[0]}{flight_no}",
+            })
+
+
+def load_catalog(path, fallback_flights):
+    """Open a compiled catalog if present and readable, otherwise wrap the built-in routes"""
+    if path and os.path.exists(path):
+        try:
+            return RouteCatalog.open(path)
+        except (ValueError, OSError) as e:
+            print(f"[catalog] {e}; using the built-in routes", file=sys.stderr)
+    return RouteCatalog.from_flights(fallback_flights)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 5 or sys.argv[1] != "compile":
+        sys.exit(__doc__.strip().splitlines()[-1])
+    count = write_catalog(sys.argv[4], read_openflights(sys.argv[2], sys.argv[3]))
+    print(f"Wrote {count:,} routes to {sys.argv[4]}")
@@ -0,0 +1,103 @@
+"""
+FlightFocus Pro - route search index
+Search-as-you-type over a RouteCatalog (route names, cities, IATA codes, callsigns):
+- every route is folded to lowercase ASCII words (accents and flags dropped)
+- prefix index: the sorted vocabulary plus CSR postings (word -> routes), so all words
+  sharing a prefix are one contiguous slice found with two binary searches
+- every query word is a word prefix; results are intersected smallest first and the
+  per-word sets are cached, so a keystroke only looks up the word being typed
+- results are sorted catalog indices, i.e. duration order, which is what the
+  focus-time filter needs to combine with them cheaply
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import OrderedDict
+
+import numpy as np
+
+from route_catalog import WINDOW_MIN_FACTOR, WINDOW_MAX_FACTOR
+
+NON_WORD = re.compile(r"[^a-z0-9\n]+")
+# Per-word results kept for the query being typed (and backspace)
+TERM_CACHE_SIZE = 64
+
+
+def fold_many(texts):
+    """['São Paulo (GRU)', ...] -> [['sao', 'paulo', 'gru'], ...]; one normalize/regex pass for all"""
+    joined = unicodedata.normalize("NFKD", "\n".join(t.replace("\n", " ") for t in texts))
+    joined = NON_WORD.sub(" ", joined.encode("ascii", "ignore").decode("ascii").lower())
+    return [line.split() for line in joined.split("\n")]
+
+
+def fold(text):
+    return fold_many([text])[0]
+
+
+class RouteSearchIndex:
+    """Word-prefix index over one catalog"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        n = len(catalog)
+        words = fold_many([f"{catalog.name(i)} {catalog.callsign(i)}" for i in range(n)])
+
+        # Word ids in first-seen order, renumbered to sorted-vocabulary order afterwards
+        ids, word_ids, route_ids = {}, [], []
+        for route, route_words in enumerate(words):
+            for w in set(route_words):
+                word_ids.append(ids.setdefault(w, len(ids)))
+                route_ids.append(route)
+        self.vocab = sorted(ids)
+        rank = np.empty(len(ids), dtype=np.int64)
+        for r, w in enumerate(self.vocab): rank[ids[w]] = r
+
+        word_ids = rank[np.asarray(word_ids, dtype=np.int64)]
+        route_ids = np.asarray(route_ids, dtype=np.int64)
+        by_word = np.lexsort((route_ids, word_ids))
+        self.postings = route_ids[by_word]
+        self.offsets = np.searchsorted(word_ids[by_word], np.arange(len(self.vocab) + 1))
+        self._terms = OrderedDict()
+
+    def __len__(self):
+        return len(self.catalog)
+
+    def term_matches(self, term):
+        """Sorted routes having a word that starts with term"""
+        cached = self._terms.get(term)
+        if cached is not None:
+            self._terms.move_to_end(term)
+            return cached
+        # Words are [a-z0-9] only, so '{' sorts after every word with this prefix
+        a, b = bisect_left(self.vocab, term), bisect_left(self.vocab, term + "{")
+        ids = self.postings[self.offsets[a]:self.offsets[b]]
+        if b - a > 1:
+            # Union of many words' postings: a bitmap over the routes is O(n), no sort
+            mask = np.zeros(len(self), dtype=bool)
+            mask[ids] = True
+            ids = np.flatnonzero(mask)
+        self._terms[term] = ids
+        if len(self._terms) > TERM_CACHE_SIZE: self._terms.popitem(last=False)
+        return ids
+
+    def search(self, query):
+        """Sorted catalog indices matching every word of the query as a word prefix; None for an empty query"""
+        terms = sorted(set(fold(query)))
+        if not terms: return None
+        sets = sorted((self.term_matches(t) for t in terms), key=len)
+        result = sets[0]
+        for ids in sets[1:]:
+            if not len(result): break
+            mask = np.zeros(len(self), dtype=bool)
+            mask[ids] = True
+            result = result[mask[result]]
+        return result
+
+    def select(self, matches, focus_minutes):
+        """Matches inside the focus-time window, closest block time first (all matches if none fit)"""
+        durations = np.asarray(self.catalog.durations)
+        window = self.catalog.duration_range(focus_minutes * WINDOW_MIN_FACTOR, focus_minutes * WINDOW_MAX_FACTOR)
+        lo, hi = np.searchsorted(matches, [window.start, window.stop])
+        pool = matches[lo:hi] if hi > lo else matches
+        return pool[np.argsort(np.abs(durations[pool].astype(np.int64) - focus_minutes), kind="stable")]
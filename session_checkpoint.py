@@ -0,0 +1,132 @@
+"""
+FlightFocus Pro - crash-safe session checkpoints
+So a crash, kill or reboot mid-session can resume where it left off:
+- a new session replaces the file atomically (temp file, fsync, rename): the first line
+  holds everything needed to rebuild the flight (name, route data, focus time, warp)
+- progress is appended as one short JSON line every CHECKPOINT_INTERVAL_S; the fsync
+  happens on a background thread every SYNC_EVERY lines, or at once for pause / hide / quit
+- a torn last line is ignored on load, and the log is compacted (same atomic rename)
+  before it grows past MAX_RECORDS
+- arrival or abort deletes the file: nothing to resume
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(os.environ.get("XDG_STATE_HOME", os.path.expanduser("~/.local/state")),
+                                       "flight-focus", "session.ckpt")
+CHECKPOINT_VERSION = 1
+CHECKPOINT_INTERVAL_S = 30.0
+SYNC_EVERY = 4
+MAX_RECORDS = 256
+
+
+def _line(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def _fsync_dir(path):
+    fd = os.open(os.path.dirname(path), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_checkpoint(path=DEFAULT_CHECKPOINT_PATH):
+    """Session header merged with its last complete progress record, or None"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+    except OSError:
+        return None
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue  # torn write from the crash, or the trailing ''
+    if not records or records[0].get("version") != CHECKPOINT_VERSION: return None
+    state = dict(records[0])
+    for record in records[1:]: state.update(record)
+    return state
+
+
+class SessionCheckpoint:
+    """Append-only checkpoint log for the session in progress (one per user)"""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_PATH, interval_s=CHECKPOINT_INTERVAL_S):
+        self.path = path
+        self.interval_s = interval_s
+        self.file = None
+        self.header = None
+        self.records = 0
+        self.unsynced = 0
+        self.last_write = None
+        # fsync can take tens of ms on a busy disk: keep it off the UI thread, in order
+        self._sync = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-sync")
+
+    def load(self):
+        return read_checkpoint(self.path)
+
+    def begin(self, flight, data, focus_minutes, elapsed_s=0.0, warp=1.0):
+        self.header = {"version": CHECKPOINT_VERSION, "flight": flight, "data": data, "focus_minutes": focus_minutes,
+                       "warp": warp, "started_at": time.time() - elapsed_s}
+        self._rewrite({"elapsed_s": elapsed_s, "paused": False, "t": time.time()})
+
+    def _rewrite(self, record):
+        """Header + one record into a temp file, fsynced, then renamed over the log"""
+        self._close_file()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(_line(self.header) + _line(record))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        _fsync_dir(self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+        self.records, self.unsynced, self.last_write = 1, 0, time.monotonic()
+
+    def due(self):
+        return self.file is not None and time.monotonic() - self.last_write >= self.interval_s
+
+    def write(self, elapsed_s, paused=False, sync=False):
+        if self.file is None: return
+        record = {"elapsed_s": round(elapsed_s, 3), "paused": paused, "t": time.time()}
+        if self.records >= MAX_RECORDS:
+            self._rewrite(record)
+            return
+        self.file.write(_line(record))
+        self.file.flush()
+        self.records += 1
+        self.unsynced += 1
+        self.last_write = time.monotonic()
+        if sync or self.unsynced >= SYNC_EVERY:
+            self._sync.submit(os.fsync, self.file.fileno())
+            self.unsynced = 0
+
+    def _close_file(self):
+        if self.file is None: return
+        # Closed on the sync thread, after any fsync still queued for it
+        self._sync.submit(self.file.close)
+        self.file = None
+
+    def clear(self):
+        """Session over (arrived / aborted): nothing to resume next launch"""
+        self._close_file()
+        self.header = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        """Quit: keep the log (the session resumes next launch), but make sure it is on disk"""
+        if self.file is not None:
+            self.file.flush()
+            self._sync.submit(os.fsync, self.file.fileno())
+        self._close_file()
+        self._sync.shutdown(wait=True)
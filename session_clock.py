@@ -0,0 +1,160 @@
+"""
+FlightFocus Pro - session clock
+Progress is derived from a monotonic clock instead of counting timer ticks, so it
+cannot drift under load and keeps counting across suspend (CLOCK_BOOTTIME on Linux).
+The clock also plans the next wakeup for the next visible change and keeps jitter stats.
+SimClock sits in front of the real clock and is shared by the telemetry and the map: N x
+time-warp and pause/resume. ManualClock only moves when told to, for deterministic replay.
+"""
+
+import math
+import time
+
+
+def boottime():
+    """Monotonic seconds that include time spent suspended where the OS supports it"""
+    return time.clock_gettime(time.CLOCK_BOOTTIME)
+
+
+def default_time_source():
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        try:
+            boottime()
+            return boottime
+        except OSError:
+            pass
+    return time.monotonic
+
+
+class ManualClock:
+    """Time source that only advances when told to (replay, tests)"""
+
+    def __init__(self, start=0.0):
+        self.t = float(start)
+
+    def __call__(self):
+        return self.t
+
+    def advance(self, seconds):
+        self.t += seconds
+
+    def advance_to(self, t):
+        self.t = max(self.t, float(t))
+
+
+class SimClock:
+    """Simulation time: a real time source scaled by a warp factor, which can be paused.
+    Callable, so it plugs into SessionClock as its time source."""
+
+    def __init__(self, warp=1.0, source=None):
+        self.source = source or default_time_source()
+        self.warp = float(warp)
+        self.paused = False
+        self._real0 = self.source()
+        self._sim0 = 0.0
+
+    def __call__(self):
+        if self.paused: return self._sim0
+        return self._sim0 + (self.source() - self._real0) * self.warp
+
+    def _rebase(self):
+        self._sim0, self._real0 = self(), self.source()
+
+    @property
+    def rate(self):
+        """Simulated seconds per real second right now"""
+        return 0.0 if self.paused else self.warp
+
+    def set_warp(self, warp):
+        if warp <= 0: raise ValueError("warp must be positive")
+        self._rebase()
+        self.warp = float(warp)
+
+    def pause(self):
+        if self.paused: return
+        self._rebase()
+        self.paused = True
+
+    def resume(self):
+        if not self.paused: return
+        self._real0 = self.source()
+        self.paused = False
+
+    def real_seconds(self, sim_seconds):
+        """Real time until sim_seconds of simulation have passed (None while paused)"""
+        if self.paused or sim_seconds is None: return None
+        return sim_seconds / self.warp
+
+
+class SessionClock:
+    """Remaining time / progress for one focus session"""
+
+    # Wake slightly after a display boundary so an early coarse timer never lands before it
+    WAKE_SLACK_S = 0.005
+
+    def __init__(self, total_seconds, time_source=None, elapsed=0.0):
+        self.now = time_source or default_time_source()
+        self.total_seconds = total_seconds
+        # elapsed > 0: a resumed session picks up that far in
+        self.started_at = self.now() - elapsed
+
+        self.wakeups = 0
+        self._deadline = None
+        self._jitter_sum = 0.0
+        self._jitter_max = 0.0
+        self._jitter_samples = 0
+
+    def elapsed(self):
+        return min(max(self.now() - self.started_at, 0.0), self.total_seconds)
+
+    def remaining(self):
+        return self.total_seconds - self.elapsed()
+
+    def progress(self):
+        return self.elapsed() / self.total_seconds if self.total_seconds else 1.0
+
+    def finished(self):
+        return self.remaining() <= 0
+
+    def display_seconds(self):
+        """Whole seconds shown on the countdown (rounded up, so 0 only on arrival)"""
+        return math.ceil(self.remaining())
+
+    def seconds_until_next_change(self):
+        """Time until the countdown or the whole-percent progress next changes"""
+        remaining = self.remaining()
+        if remaining <= 0: return None
+        until_second = remaining - (math.ceil(remaining) - 1)
+        progress = self.progress()
+        until_percent = ((math.floor(progress * 100 + 0.5) + 0.5) / 100 - progress) * self.total_seconds
+        return max(min(until_second, until_percent), 0.0) + self.WAKE_SLACK_S
+
+    def plan_wakeup(self):
+        """Delay in seconds for the next tick, remembered so the tick can measure its jitter"""
+        delay = self.seconds_until_next_change()
+        self._deadline = None if delay is None else self.now() + delay
+        return delay
+
+    def cancel_wakeup(self):
+        """Forget the planned wakeup (ticks suspended on purpose), so the next one is not counted as late"""
+        self._deadline = None
+
+    def on_wakeup(self):
+        """Record one wakeup; returns how late (positive) or early (negative) it was, in seconds"""
+        self.wakeups += 1
+        if self._deadline is None: return 0.0
+        jitter = self.now() - self._deadline
+        self._deadline = None
+        self._jitter_samples += 1
+        self._jitter_sum += abs(jitter)
+        self._jitter_max = max(self._jitter_max, abs(jitter))
+        return jitter
+
+    def stats(self):
+        return {
+            "wakeups": self.wakeups,
+            "elapsed_s": self.elapsed(),
+            "wakeups_per_min": 60 * self.wakeups / self.elapsed() if self.elapsed() else 0.0,
+            "mean_jitter_ms": 1000 * self._jitter_sum / self._jitter_samples if self._jitter_samples else 0.0,
+            "max_jitter_ms": 1000 * self._jitter_max,
+        }
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - session history
+- SQLite in WAL mode: one row per session plus its per-minute progress samples
+- all writes go through a queue to one writer thread, which commits them in batches
+  (one transaction per batch, never on the UI thread)
+- samples come once a minute, so a batch of them waits FLUSH_INTERVAL_S (several samples);
+  a session's end, flush and close commit at once
+- rollups (per day, per route, totals, streak) are updated in the same transaction as
+  a session's end, so stats() reads a handful of rows however long the history is
+- request_stats() reads them on the writer thread, for callers that must not touch the disk
+Qt-free: usable from the terminal mode and benchmarks.
+
+Usage:
+  python session_history.py stats [--history PATH]
+"""
+
+import os
+import sys
+import time
+import queue
+import sqlite3
+import argparse
+import threading
+from datetime import date, datetime, timedelta
+
+DEFAULT_HISTORY_PATH = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share")),
+                                    "flight-focus", "history.sqlite3")
+SCHEMA_VERSION = 1
+# A batch is committed once this old (5 one-a-minute samples), or at once for session ends / flush / close
+FLUSH_INTERVAL_S = 300.0
+MAX_BATCH = 500
+TOP_ROUTES = 5
+WEEKS_SHOWN = 8
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    day TEXT NOT NULL,
+    flight TEXT NOT NULL,
+    callsign TEXT,
+    aircraft TEXT,
+    focus_minutes INTEGER NOT NULL,
+    focused_s REAL NOT NULL DEFAULT 0,
+    distance_km REAL NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_day ON sessions(day);
+CREATE TABLE IF NOT EXISTS samples (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    minute INTEGER NOT NULL,
+    progress REAL NOT NULL,
+    remaining_km INTEGER NOT NULL,
+    altitude_ft INTEGER NOT NULL,
+    PRIMARY KEY (session_id, minute)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    focus_s REAL NOT NULL,
+    distance_km REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS routes (
+    flight TEXT PRIMARY KEY,
+    flights INTEGER NOT NULL,
+    distance_km REAL NOT NULL,
+    last_flown REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS routes_flights ON routes(flights);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    sessions INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    focus_s REAL NOT NULL,
+    distance_km REAL NOT NULL,
+    streak_day TEXT,
+    streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0, 0, 0, NULL, 0, 0);
+"""
+
+
+def connect(path):
+    if path != ":memory:": os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL + NORMAL: a commit is durable at the next checkpoint, and never corrupts the file
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        conn.executescript(f"BEGIN; {SCHEMA} PRAGMA user_version={SCHEMA_VERSION}; COMMIT;")
+    return conn
+
+
+def local_day(timestamp):
+    return datetime.fromtimestamp(timestamp).date().isoformat()
+
+
+class SessionHandle:
+    """Returned by begin(); its row id is only known to the writer thread"""
+    __slots__ = ("id", "day", "flight", "last_minute")
+
+    def __init__(self, day, flight):
+        self.id = None
+        self.day = day
+        self.flight = flight
+        self.last_minute = -1
+
+
+class SessionHistory:
+    """Batched writer + rollup reader for one history database"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH, on_commit=None):
+        self.path = path
+        # Called from the writer thread after a batch that ended a session (e.g. a Qt signal's emit)
+        self.on_commit = on_commit
+        self._queue = queue.Queue()
+        self._reader = None
+        self._thread = threading.Thread(target=self._run, name="session-history", daemon=True)
+        self._thread.start()
+
+    # --- UI thread: enqueue only ---
+    def begin(self, flight, data, focus_minutes, started_at=None):
+        started_at = time.time() if started_at is None else started_at
+        handle = SessionHandle(local_day(started_at), flight)
+        self._queue.put(("begin", handle, (started_at, data.get("callsign"), data.get("aircraft"), focus_minutes)))
+        return handle
+
+    def sample(self, handle, elapsed_s, values):
+        """One row per whole minute of the session; other ticks are ignored"""
+        minute = int(elapsed_s // 60)
+        if handle is None or minute <= handle.last_minute: return
+        handle.last_minute = minute
+        self._queue.put(("sample", handle, (minute, values["progress"], values["remaining_km"], values["altitude_ft"])))
+
+    def end(self, handle, focused_s, distance_km, completed, ended_at=None):
+        ended_at = time.time() if ended_at is None else ended_at
+        self._queue.put(("end", handle, (ended_at, focused_s, distance_km, int(bool(completed)))))
+
+    def flush(self, timeout=None):
+        """Commit everything queued so far; blocks until the writer has done it"""
+        done = threading.Event()
+        self._queue.put(("flush", None, done))
+        return done.wait(timeout)
+
+    def request_stats(self, callback):
+        """callback(stats()) from the writer thread, after everything queued so far is committed"""
+        self._queue.put(("stats", None, callback))
+
+    def close(self, timeout=5.0):
+        if not self._thread.is_alive(): return
+        self._queue.put(("close", None, None))
+        self._thread.join(timeout)
+
+    # --- writer thread ---
+    def _run(self):
+        try:
+            conn = connect(self.path)
+        except (sqlite3.Error, OSError) as e:
+            # Keep draining the queue: flush() and close() must still return, only nothing gets written
+            print(f"[history] {self.path}: {e}; sessions will not be recorded", file=sys.stderr)
+            conn = None
+        closing = False
+        while not closing:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL_S
+            # Samples wait for company; anything else commits right away
+            while batch[-1][0] in ("begin", "sample") and len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            ended = self._commit(conn, batch) if conn is not None else False
+            for op, _, payload in batch:
+                if op == "flush": payload.set()
+                elif op == "stats" and conn is not None: self._deliver_stats(conn, payload)
+                closing = closing or op == "close"
+            if ended and self.on_commit: self.on_commit()
+        if conn is not None: conn.close()
+
+    def _commit(self, conn, batch):
+        ended = False
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op, handle, payload in batch:
+                if op == "begin":
+                    started_at, callsign, aircraft, focus_minutes = payload
+                    handle.id = conn.execute(
+                        "INSERT INTO sessions (started_at, day, flight, callsign, aircraft, focus_minutes) VALUES (?, ?, ?, ?, ?, ?)",
+                        (started_at, handle.day, handle.flight, callsign, aircraft, focus_minutes)).lastrowid
+                elif op == "sample" and handle.id is not None:
+                    conn.execute("INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?, ?)", (handle.id, *payload))
+                elif op == "end" and handle.id is not None:
+                    self._end(conn, handle, *payload)
+                    ended = True
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction: conn.execute("ROLLBACK")
+            for op, handle, _ in batch:
+                if op == "begin": handle.id = None
+            print(f"[history] {e}: {len(batch)} queued writes dropped", file=sys.stderr)
+            return False
+        return ended
+
+    def _deliver_stats(self, conn, callback):
+        try:
+            stats = self._stats(conn)
+        except sqlite3.Error as e:
+            print(f"[history] {e}: stats unavailable", file=sys.stderr)
+            return
+        callback(stats)
+
+    def _end(self, conn, handle, ended_at, focused_s, distance_km, completed):
+        conn.execute("UPDATE sessions SET ended_at = ?, focused_s = ?, distance_km = ?, completed = ? WHERE id = ?",
+                     (ended_at, focused_s, distance_km, completed, handle.id))
+        conn.execute("""INSERT INTO daily VALUES (?, 1, ?, ?, ?) ON CONFLICT(day) DO UPDATE SET
+                        sessions = sessions + 1, completed = completed + excluded.completed,
+                        focus_s = focus_s + excluded.focus_s, distance_km = distance_km + excluded.distance_km""",
+                     (handle.day, completed, focused_s, distance_km))
+        if completed:
+            conn.execute("""INSERT INTO routes VALUES (?, 1, ?, ?) ON CONFLICT(flight) DO UPDATE SET
+                            flights = flights + 1, distance_km = distance_km + excluded.distance_km,
+                            last_flown = excluded.last_flown""", (handle.flight, distance_km, ended_at))
+        streak_day, streak, best = conn.execute("SELECT streak_day, streak, best_streak FROM totals").fetchone()
+        if completed and (streak_day is None or handle.day > streak_day):
+            # A streak is consecutive days with at least one completed session
+            consecutive = streak_day == (date.fromisoformat(handle.day) - timedelta(days=1)).isoformat()
+            streak = streak + 1 if consecutive else 1
+            streak_day, best = handle.day, max(best, streak)
+        conn.execute("""UPDATE totals SET sessions = sessions + 1, completed = completed + ?, focus_s = focus_s + ?,
+                        distance_km = distance_km + ?, streak_day = ?, streak = ?, best_streak = ?""",
+                     (completed, focused_s, distance_km, streak_day, streak, best))
+
+    # --- readers (any thread; WAL lets them run alongside the writer) ---
+    def stats(self, today=None):
+        """Today / last 7 days / per-week focus minutes, streaks, top routes and totals, from the rollups"""
+        if self._reader is None: self._reader = connect(self.path)
+        return self._stats(self._reader, today)
+
+    def _stats(self, db, today=None):
+        today = today or date.today()
+        first_week = today - timedelta(days=today.weekday() + 7 * (WEEKS_SHOWN - 1))
+        daily = dict(db.execute("SELECT day, focus_s FROM daily WHERE day >= ?", (first_week.isoformat(),)))
+        days = [(today - timedelta(days=i)).isoformat() for i in range(6, -1, -1)]
+        weeks = {}
+        for i in range(WEEKS_SHOWN):
+            weeks[(first_week + timedelta(weeks=i)).isoformat()] = 0.0
+        for day, focus_s in daily.items():
+            d = date.fromisoformat(day)
+            week = (d - timedelta(days=d.weekday())).isoformat()
+            if week in weeks: weeks[week] += focus_s / 60
+        sessions, completed, focus_s, distance_km, streak_day, streak, best = db.execute(
+            "SELECT sessions, completed, focus_s, distance_km, streak_day, streak, best_streak FROM totals").fetchone()
+        # The streak is still alive if its last day is today or yesterday
+        if streak_day is None or streak_day < (today - timedelta(days=1)).isoformat(): streak = 0
+        return {
+            "today_min": daily.get(today.isoformat(), 0.0) / 60,
+            "days_min": [(day, daily.get(day, 0.0) / 60) for day in days],
+            "weeks_min": list(weeks.items()),
+            "streak_days": streak,
+            "best_streak_days": best,
+            "top_routes": db.execute("SELECT flight, flights, distance_km FROM routes ORDER BY flights DESC, last_flown DESC LIMIT ?",
+                                     (TOP_ROUTES,)).fetchall(),
+            "sessions": sessions,
+            "completed": completed,
+            "focus_min": focus_s / 60,
+            "distance_km": distance_km,
+        }
+
+    def samples(self, session_id):
+        if self._reader is None: self._reader = connect(self.path)
+        return self._reader.execute("SELECT minute, progress, remaining_km, altitude_ft FROM samples WHERE session_id = ? ORDER BY minute",
+                                    (session_id,)).fetchall()
+
+
+def format_stats(stats):
+    lines = [
+        f"Today:      {stats['today_min']:.0f} min",
+        f"This week:  {stats['weeks_min'][-1][1]:.0f} min",
+        f"Streak:     {stats['streak_days']} days (best {stats['best_streak_days']})",
+        f"Flights:    {stats['completed']} completed of {stats['sessions']}",
+        f"Focused:    {stats['focus_min'] / 60:.1f} h",
+        f"Distance:   {stats['distance_km']:,.0f} km",
+    ]
+    lines += [f"  {flights:>4}x  {flight}" for flight, flights, _ in stats["top_routes"]]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FlightFocus Pro session history")
+    parser.add_argument("command", choices=["stats"])
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="history database")
+    args = parser.parse_args(argv)
+    history = SessionHistory(args.history)
+    print(format_stats(history.stats()))
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - session recording and replay
+- SessionRecorder writes one JSON line per telemetry tick (simulated time + dashboard values)
+- replay() re-runs a recording on a ManualClock, so every tick is recomputed at exactly
+  the recorded simulated time and must come out identical
+- simulate() fast-forwards a whole session wakeup by wakeup without sleeping
+Qt-free: usable from tests, benchmarks and the terminal mode.
+
+Usage:
+  python session_replay.py simulate --minutes 360 [--flight CALLSIGN]
+  python session_replay.py verify session.jsonl
+"""
+
+import sys
+import json
+import time
+import argparse
+
+from flights import REAL_WORLD_FLIGHTS, telemetry
+from flight_profiles import FlightProfile, build_profile
+from route_catalog import load_catalog, haversine_km, DEFAULT_CATALOG_PATH
+from session_clock import SessionClock, ManualClock
+
+RECORD_VERSION = 2
+# Version 1 recordings predate flight profiles and replay with the generic altitude ramp
+READABLE_VERSIONS = (1, 2)
+
+
+class SessionRecorder:
+    """Appends a session header, control events and telemetry ticks to a JSON-lines file"""
+
+    def __init__(self, path, flight, data, focus_minutes, total_km, warp=1.0):
+        self.file = open(path, "w", buffering=1)
+        self._write({"version": RECORD_VERSION, "flight": flight, "coords": data["coords"],
+                     "total_km": total_km, "focus_minutes": focus_minutes, "warp": warp, "started_at": time.time(),
+                     "profile": [data["aircraft"], data["distance_km"], data["real_duration"]]})
+
+    def _write(self, obj):
+        self.file.write(json.dumps(obj, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+    def tick(self, values):
+        self._write(values)
+
+    def event(self, clock, name, **fields):
+        """pause / resume / warp; informational, simulated time already accounts for them"""
+        self._write({"event": name, "t": clock.elapsed(), **fields})
+
+    def close(self):
+        if not self.file.closed: self.file.close()
+
+
+def read_recording(path):
+    with open(path) as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("version") not in READABLE_VERSIONS:
+        raise ValueError(f"{path}: not a session recording")
+    return lines[0], [line for line in lines[1:] if "event" not in line]
+
+
+def replay(path):
+    """Yield (recorded, recomputed) telemetry for every tick of a recording"""
+    header, ticks = read_recording(path)
+    source = ManualClock()
+    clock = SessionClock(header["focus_minutes"] * 60, source)
+    profile = FlightProfile(build_profile(*header["profile"])) if "profile" in header else None
+    for recorded in ticks:
+        source.advance_to(recorded["t"])
+        yield recorded, telemetry(clock, header["total_km"], profile)
+
+
+def verify(path):
+    """Number of ticks whose replayed values differ from the recording"""
+    return sum(1 for recorded, replayed in replay(path) if recorded != replayed)
+
+
+def simulate(data, focus_minutes, on_tick=None):
+    """Run a whole session in simulated time, one step per planned wakeup; returns all ticks"""
+    total_km = haversine_km(*data["coords"])
+    profile = FlightProfile.for_flight(data)
+    source = ManualClock()
+    clock = SessionClock(focus_minutes * 60, source)
+    ticks = []
+    while True:
+        clock.on_wakeup()
+        values = telemetry(clock, total_km, profile)
+        ticks.append(values)
+        if on_tick: on_tick(values)
+        delay = clock.plan_wakeup()
+        if delay is None: return ticks
+        source.advance(delay)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FlightFocus Pro session simulation / replay")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sim = sub.add_parser("simulate", help="fast-forward a whole session and print a summary")
+    sim.add_argument("-m", "--minutes", type=int, default=360)
+    sim.add_argument("-f", "--flight", help="part of a route name or a callsign prefix (default: closest route)")
+    sim.add_argument("--catalog", default=DEFAULT_CATALOG_PATH)
+    ver = sub.add_parser("verify", help="replay a recording and compare every tick")
+    ver.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "verify":
+        mismatches = verify(args.path)
+        print(f"{args.path}: {'OK' if not mismatches else f'{mismatches} mismatching ticks'}")
+        return 1 if mismatches else 0
+
+    catalog = load_catalog(args.catalog, REAL_WORLD_FLIGHTS)
+    chosen = catalog.record(catalog.select(args.minutes)[0])
+    if args.flight:
+        found = catalog.find(args.flight)
+        if found is None: sys.exit(f"No route matches {args.flight!r}.")
+        chosen = catalog.record(found)
+    t0 = time.perf_counter()
+    ticks = simulate(chosen[1], args.minutes)
+    elapsed = time.perf_counter() - t0
+    last = ticks[-1]
+    print(f"{chosen[0]}: {args.minutes} min in {elapsed * 1000:.1f} ms, {len(ticks)} ticks, "
+          f"final progress {last['progress']:.0%}, {last['remaining_km']} km left")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
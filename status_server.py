@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - local status API
+For tmux / waybar / GNOME extensions, over a Unix socket (owner-only), one JSON object per line:
+- {"cmd": "get"}        one-shot snapshot of the session state
+- {"cmd": "subscribe"}  the snapshot now, then again each time it changes
+- {"cmd": "start", "flight": "BAW", "minutes": 90} / {"cmd": "abort"}  control the app
+Bare words work too (`echo get | nc -U $XDG_RUNTIME_DIR/flight-focus.sock`).
+The server runs its own asyncio loop on a background thread and reads the shared session
+clock itself: the UI thread only hands over the session when it starts, pauses or ends, so
+any number of subscribers costs it nothing, and updates keep flowing while the window is hidden.
+
+Usage:
+  python status_server.py get [--format '{callsign} {progress:.0%}']
+  python status_server.py watch
+  python status_server.py start [--flight BAW] [--minutes 90]
+  python status_server.py abort
+"""
+
+import os
+import sys
+import json
+import socket
+import asyncio
+import argparse
+import threading
+import concurrent.futures
+
+from flights import telemetry, format_hms
+
+DEFAULT_SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or f"/tmp/flight-focus-{os.getuid()}",
+                                   "flight-focus.sock")
+COMMANDS = ("get", "subscribe", "start", "abort")
+# A subscriber this far behind is dropped instead of buffering for it
+MAX_CLIENT_BUFFER = 64 * 1024
+MAX_LINE_BYTES = 4096
+COMMAND_TIMEOUT_S = 5.0
+IDLE_STATE = {"state": "idle"}
+
+
+class StatusSession:
+    """What the server needs to compute the state on its own thread"""
+
+    def __init__(self, info, clock, total_km, profile, sim):
+        self.info = info          # flight, callsign, aircraft, focus_minutes
+        self.clock = clock
+        self.total_km = total_km
+        self.profile = profile
+        self.sim = sim
+
+    def snapshot(self):
+        values = telemetry(self.clock, self.total_km, self.profile)
+        state = "arrived" if self.clock.finished() else "paused" if self.sim.paused else "flying"
+        return {"state": state, **self.info, "progress": round(values["progress"], 4),
+                "seconds_left": values["seconds_left"], "remaining": format_hms(values["seconds_left"]),
+                "altitude_ft": values["altitude_ft"], "ground_speed_kts": values.get("ground_speed_kts"),
+                "remaining_km": values["remaining_km"]}
+
+    def next_change_in(self):
+        """Real seconds until the snapshot next changes (None: only when told)"""
+        if self.clock.finished(): return None
+        return self.sim.real_seconds(self.clock.seconds_until_next_change())
+
+
+class StatusServer:
+    """asyncio Unix-socket server on its own thread"""
+
+    def __init__(self, path=DEFAULT_SOCKET_PATH, on_command=None):
+        self.path = path
+        # Called on the server thread as on_command(cmd, args, future); the app resolves the
+        # concurrent future with the reply once it has acted on its own thread
+        self.on_command = on_command
+        self.loop = None
+        self._session = None
+        self._subscribers = set()
+        self._clients = set()  # connection tasks, drained on close
+        self._last = None     # last line pushed to subscribers
+        self._changed = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    # --- UI thread ---
+    def start(self):
+        """Bind and serve in the background; False if another instance already owns the socket"""
+        if _socket_alive(self.path): return False
+        self._thread = threading.Thread(target=self._run, name="status-server", daemon=True)
+        self._thread.start()
+        self._ready.wait(5.0)
+        return self.loop is not None
+
+    def set_session(self, session):
+        """A new session, None when back on the setup page; also call after pause / resume"""
+        self._session = session
+        if self.loop is not None: self.loop.call_soon_threadsafe(self._changed.set)
+
+    def close(self):
+        if self.loop is None: return
+        self.loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(2.0)
+
+    # --- server thread ---
+    def _run(self):
+        try:
+            asyncio.run(self._serve())
+        except OSError as e:
+            print(f"[status] {self.path}: {e}", file=sys.stderr)
+            self._ready.set()
+
+    async def _serve(self):
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        if os.path.exists(self.path): os.unlink(self.path)  # stale: start() found nobody listening
+        self._changed, self._stop = asyncio.Event(), asyncio.Event()
+        server = await asyncio.start_unix_server(self._client, self.path, limit=MAX_LINE_BYTES)
+        os.chmod(self.path, 0o600)
+        self.loop = asyncio.get_running_loop()
+        self._ready.set()
+        pump = asyncio.create_task(self._pump())
+        await self._stop.wait()
+        pump.cancel()
+        server.close()
+        # Hang up on every client so their handlers return, rather than being cancelled mid-read
+        for task, writer in list(self._clients): writer.close()
+        if self._clients: await asyncio.wait([task for task, _ in self._clients], timeout=1.0)
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def snapshot(self):
+        session = self._session
+        return session.snapshot() if session is not None else dict(IDLE_STATE)
+
+    async def _pump(self):
+        """Push to subscribers when the state changes: serialized once, written to everyone"""
+        while True:
+            delay = None
+            if self._subscribers:
+                line = _encode(self.snapshot())
+                if line != self._last:
+                    self._last = line
+                    for writer in list(self._subscribers): self._send(writer, line)
+                session = self._session
+                delay = session.next_change_in() if session is not None else None
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _send(self, writer, line):
+        if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+            self._subscribers.discard(writer)
+            writer.close()
+            return
+        writer.write(line)
+
+    async def _client(self, reader, writer):
+        client = (asyncio.current_task(), writer)
+        self._clients.add(client)
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw: break
+                reply = await self._handle(raw, writer)
+                if reply is not None:
+                    writer.write(_encode(reply))
+                    await writer.drain()
+        except (ConnectionError, ValueError):
+            pass  # client went away, or sent a line longer than MAX_LINE_BYTES
+        finally:
+            self._clients.discard(client)
+            self._subscribers.discard(writer)
+            writer.close()
+
+    async def _handle(self, raw, writer):
+        text = raw.decode("utf-8", "replace").strip()
+        if not text: return None
+        try:
+            request = json.loads(text) if text.startswith("{") else {"cmd": text.split()[0]}
+        except ValueError:
+            return {"error": "invalid JSON"}
+        cmd = request.get("cmd")
+        if cmd not in COMMANDS: return {"error": f"unknown command {cmd!r}", "commands": list(COMMANDS)}
+        if cmd == "get": return self.snapshot()
+        if cmd == "subscribe":
+            line = _encode(self.snapshot())
+            if not self._subscribers: self._last = line
+            self._subscribers.add(writer)
+            # Wake the pump: it may have been idle with nobody to push to
+            self._changed.set()
+            return json.loads(line)
+        if self.on_command is None: return {"error": "control is not available"}
+        future = concurrent.futures.Future()
+        self.on_command(cmd, {k: v for k, v in request.items() if k != "cmd"}, future)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), COMMAND_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            return {"error": "the app did not answer"}
+
+
+def _encode(obj):
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode()
+
+
+def _socket_alive(path):
+    if not os.path.exists(path): return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(path)
+            return True
+        except OSError:
+            return False
+
+
+# --- client ---
+def request(path, message):
+    """Send one command, yield each reply line as a dict (one for everything but subscribe)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        s.sendall(_encode(message))
+        with s.makefile("r", encoding="utf-8") as lines:
+            for line in lines:
+                yield json.loads(line)
+                if message["cmd"] != "subscribe": return
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FlightFocus Pro status client")
+    parser.add_argument("command", choices=["get", "watch", "start", "abort"])
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="status socket of the running app")
+    parser.add_argument("--format", help="Python format string over the state fields, e.g. '{callsign} {remaining}'")
+    parser.add_argument("--flight", help="start: part of a route name or a callsign prefix (default: the selected flight)")
+    parser.add_argument("--minutes", type=int, help="start: focus time")
+    args = parser.parse_args(argv)
+
+    message = {"cmd": "subscribe" if args.command == "watch" else args.command}
+    if args.flight: message["flight"] = args.flight
+    if args.minutes: message["minutes"] = args.minutes
+    try:
+        for reply in request(args.socket, message):
+            if args.format and reply.get("state") not in (None, "idle"):
+                print(args.format.format_map({k: v for k, v in reply.items() if v is not None}), flush=True)
+            else:
+                print(json.dumps(reply, ensure_ascii=False), flush=True)
+            if "error" in reply: return 1
+    except OSError as e:
+        sys.exit(f"FlightFocus Pro is not running ({args.socket}: {e.strerror})")
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from flights import REAL_WORLD_FLIGHTS, MAX_FOCUS_MINUTES
+from fleet import Fleet, read_team_file
+from route_catalog import RouteCatalog
+from session_clock import SimClock
+
+
+@pytest.fixture
+def catalog():
+    return RouteCatalog.from_flights(REAL_WORLD_FLIGHTS)
+
+
+def write_team(tmp_path, entries):
+    path = tmp_path / "team.json"
+    path.write_text(json.dumps(entries))
+    return str(path)
+
+
+def test_read_team_file(tmp_path, catalog):
+    path = write_team(tmp_path, [{"who": "Alice", "flight": "QFA012", "minutes": 90, "elapsed_minutes": 5},
+                                 {"minutes": 45}])
+    sessions = read_team_file(path, catalog)
+    assert len(sessions) == 2
+    name, data, minutes, label, elapsed_s = sessions[0]
+    assert data["callsign"] == "QFA012" and minutes == 90 and label == "Alice" and elapsed_s == 300.0
+    assert sessions[1][2] == 45 and sessions[1][3] == sessions[1][1]["callsign"]
+
+
+@pytest.mark.parametrize("entry", [
+    {"minutes": 0}, {"minutes": -30}, {"minutes": "90"}, {"minutes": 45.5}, {"minutes": True},
+    {"minutes": MAX_FOCUS_MINUTES + 1}, {"minutes": 60, "elapsed_minutes": "5"},
+    {"minutes": 60, "elapsed_minutes": -1}, {"minutes": 60, "elapsed_minutes": False},
+    {"minutes": 60, "flight": 12}, ["not", "an", "object"],
+])
+def test_bad_entries_are_skipped_and_reported(tmp_path, catalog, capsys, entry):
+    path = write_team(tmp_path, [entry, {"who": "Bob", "minutes": 60}])
+    sessions = read_team_file(path, catalog)
+    assert [s[3] for s in sessions] == ["Bob"]
+    assert "entry 1" in capsys.readouterr().err
+
+
+def test_unknown_flight_is_reported(tmp_path, catalog, capsys):
+    path = write_team(tmp_path, [{"flight": "NO SUCH FLIGHT XYZ", "minutes": 60}])
+    assert read_team_file(path, catalog) == []
+    assert "no flight matches" in capsys.readouterr().err
+
+
+def test_fleet_progress_from_team_file(tmp_path, catalog):
+    path = write_team(tmp_path, [{"who": "Alice", "minutes": 60, "elapsed_minutes": 30}])
+    fleet = Fleet(SimClock())
+    for session in read_team_file(path, catalog):
+        fleet.add(*session)
+    (sid, progress, rate), = json.loads(fleet.progress_batch())
+    assert progress == pytest.approx(0.5, abs=1e-3)
+    assert rate == pytest.approx(1 / 3600)
@@ -0,0 +1,93 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    # QSettings (renderer, theme, home airport) must not touch the real config
+    os.environ["XDG_CONFIG_HOME"] = str(tmp_path_factory.mktemp("config"))
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app):
+    import flight_focus as ff
+    window = ff.FlightFocusPro(map_renderer="native")
+    window.show()
+    app.processEvents()
+    yield window
+    window.close()
+
+
+def wait_for(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def test_search_is_indexed_off_the_ui_thread(app, window):
+    unfiltered = len(window.catalog.select(window.selected_focus_time))
+    window.search_input.setText("sydney")
+    # Until the worker thread delivers the index the list is not filtered by the query
+    if window._search is None:
+        assert window.flight_model.rowCount() == unfiltered
+        assert "INDEXING" in window.flights_group.title()
+    assert wait_for(app, lambda: window._search is not None)
+    assert "MATCHING" in window.flights_group.title()
+    names = [window.flight_model.record(r)[0] for r in range(window.flight_model.rowCount())]
+    assert names and all("SYDNEY" in name for name in names)
+
+
+def test_typing_keeps_a_listed_selection(app, window):
+    window.search_input.setText("sydney")
+    assert wait_for(app, lambda: window._search is not None)
+    assert wait_for(app, lambda: window.selected_flight is not None and "SYDNEY" in window.selected_flight)
+    selected = window.selected_flight
+    prefetches = []
+    window.prefetch_selected = lambda: prefetches.append(window.selected_flight)
+    window.search_input.setText("sydney a")
+    window.search_input.setText("sydney")
+    app.processEvents()
+    assert window.selected_flight == selected
+    assert not window.select_timer.isActive() and not prefetches
+
+
+def test_typing_debounces_a_new_selection(app, window):
+    window.search_input.setText("sydney")
+    assert wait_for(app, lambda: window._search is not None)
+    window.search_input.setText("")
+    window.select_first_flight()
+    before = window.selected_flight
+    window.search_input.setText("lon")
+    window.search_input.setText("london")
+    if before is not None and "LONDON" in before: pytest.skip("the top route is already a London one")
+    assert window.select_timer.isActive() and window.selected_flight == before
+    assert wait_for(app, lambda: not window.select_timer.isActive())
+    assert "LONDON" in window.selected_flight
+
+
+def test_clicking_a_card_selects_that_row_even_with_duplicate_names(app, tmp_path):
+    import flight_focus as ff
+    from route_catalog import RouteCatalog, write_catalog
+    route = {"coords": [51.47, -0.4543, 40.6413, -73.7781], "real_duration": 420, "distance_km": 5540,
+             "aircraft": "Boeing 777"}
+    path = str(tmp_path / "dupes.ffcat")
+    write_catalog(path, [("LONDON → NEW YORK", dict(route, callsign="BAW117")),
+                         ("LONDON → NEW YORK", dict(route, callsign="VIR3"))])
+    window = ff.FlightFocusPro(catalog=RouteCatalog.open(path), map_renderer="native")
+    try:
+        window.flight_model.set_routes(range(2), 60)
+        window.flight_list.clicked.emit(window.flight_model.index(1))
+        assert window.flight_model.selected_row == 1
+        assert window.selected_route[1] == 1
+        assert window.selected_flight_data["callsign"] == "VIR3"
+    finally:
+        window.close()
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from flights import REAL_WORLD_FLIGHTS
+from flight_profiles import (FlightProfile, ProfileTable, build_profile, build_table, table_path, PROFILE_STEPS,
+                             FRACTION_SCALE, AIRCRAFT_PERFORMANCE)
+from route_catalog import RouteCatalog, write_catalog
+
+
+@pytest.mark.parametrize("name", list(REAL_WORLD_FLIGHTS))
+def test_profile_shape(name):
+    data = REAL_WORLD_FLIGHTS[name]
+    row = build_profile(data["aircraft"], data["distance_km"], data["real_duration"])
+    assert len(row) == (PROFILE_STEPS + 1) * 3
+    assert all(0 <= v <= 65535 and isinstance(v, int) for v in row)
+    profile = FlightProfile(row)
+    assert profile.altitudes[0] == profile.altitudes[-1] == 0
+    assert profile.level <= AIRCRAFT_PERFORMANCE.get(data["aircraft"], (45000,))[0]
+    assert profile.fractions[0] == 0 and profile.fractions[-1] == 1
+    assert profile.fractions == sorted(profile.fractions)
+    assert row[1::3][-1] == FRACTION_SCALE
+
+
+def test_table_rows_match_profiles_built_on_the_fly(tmp_path):
+    path = str(tmp_path / "routes.ffcat")
+    write_catalog(path, REAL_WORLD_FLIGHTS.items())
+    catalog = RouteCatalog.open(path)
+    assert ProfileTable.open(catalog) is None
+    assert build_table(catalog, table_path(path), workers=1) == len(catalog)
+    table = ProfileTable.open(catalog)
+    for i in range(len(catalog)):
+        data = catalog.record(i)[1]
+        on_the_fly = FlightProfile.for_flight(data)
+        cached = table.profile(i)
+        for p in (0.0, 0.013, 0.5, 0.87, 1.0):
+            assert cached.at(p) == on_the_fly.at(p)
+
+
+def test_stale_table_is_ignored(tmp_path):
+    path = str(tmp_path / "routes.ffcat")
+    write_catalog(path, REAL_WORLD_FLIGHTS.items())
+    build_table(RouteCatalog.open(path), table_path(path), workers=1)
+    # Catalog recompiled after the table was built
+    later = os.path.getmtime(table_path(path)) + 10
+    os.utime(path, (later, later))
+    assert ProfileTable.open(RouteCatalog.open(path)) is None
+
+
+def test_in_memory_catalog_has_no_table():
+    assert ProfileTable.open(RouteCatalog.from_flights(REAL_WORLD_FLIGHTS)) is None
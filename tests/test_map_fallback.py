@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def test_web_map_falls_back_to_native_when_qtwebengine_is_missing(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    # None in sys.modules makes the import raise ImportError, as a broken QtWebEngine install does
+    monkeypatch.setitem(sys.modules, "PyQt6.QtWebEngineWidgets", None)
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    import flight_focus as ff
+    from native_map import NativeMapView
+
+    window = ff.FlightFocusPro(map_renderer="web")
+    window.show()
+    app.processEvents()
+    try:
+        window.ensure_web_view()
+        assert window.map_renderer == "native" and window.web_view is None
+        assert isinstance(window.map_view, NativeMapView)
+        assert not window.add_btn.isVisible()
+        assert "[map]" in capsys.readouterr().err
+        window.start_flight()
+        assert window.map_view.route is not None
+    finally:
+        window.end_flight()
+        window.close()
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from flights import REAL_WORLD_FLIGHTS
+from route_catalog import (RouteCatalog, ClosenessOrder, write_catalog, load_catalog, haversine_km,
+                           estimate_block_minutes, default_aircraft, WINDOW_MIN_FACTOR, WINDOW_MAX_FACTOR,
+                           FALLBACK_COUNT)
+
+
+def synthetic_routes(size, seed=1):
+    rng = random.Random(seed)
+    routes = []
+    for i in range(size):
+        lat1, lon1, lat2, lon2 = rng.uniform(-50, 60), rng.uniform(-180, 180), rng.uniform(-50, 60), rng.uniform(-180, 180)
+        distance = haversine_km(lat1, lon1, lat2, lon2)
+        routes.append((f"CITY {i} → TOWN {i}", {
+            "coords": [lat1, lon1, lat2, lon2], "real_duration": estimate_block_minutes(distance),
+            "distance_km": int(distance), "aircraft": default_aircraft(distance), "callsign": f"TS{i}",
+        }))
+    return routes
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = str(tmp_path / "routes.ffcat")
+    write_catalog(path, synthetic_routes(2000))
+    return path
+
+
+def brute_select(catalog, minutes):
+    durations = list(catalog.durations)
+    window = [i for i, d in enumerate(durations) if minutes * WINDOW_MIN_FACTOR <= d <= minutes * WINDOW_MAX_FACTOR]
+    pool = window or range(len(durations))
+    ranked = sorted(pool, key=lambda i: abs(durations[i] - minutes))
+    return ranked if window else ranked[:FALLBACK_COUNT]
+
+
+def test_ffcat_round_trip(tmp_path):
+    path = str(tmp_path / "builtin.ffcat")
+    assert write_catalog(path, REAL_WORLD_FLIGHTS.items()) == len(REAL_WORLD_FLIGHTS)
+    catalog = RouteCatalog.open(path)
+    assert len(catalog) == len(REAL_WORLD_FLIGHTS)
+    assert list(catalog.durations) == sorted(d["real_duration"] for d in REAL_WORLD_FLIGHTS.values())
+    for i in range(len(catalog)):
+        name, data = catalog.record(i)
+        original = REAL_WORLD_FLIGHTS[name]
+        for key in ("real_duration", "distance_km", "aircraft", "callsign"):
+            assert data[key] == original[key]
+        assert data["coords"] == pytest.approx(original["coords"], abs=1e-3)
+
+
+def test_open_matches_in_memory_catalog(catalog_path):
+    opened = RouteCatalog.open(catalog_path)
+    built = RouteCatalog.from_flights(dict(synthetic_routes(2000)))
+    assert len(opened) == len(built)
+    assert list(opened.durations) == list(built.durations)
+    assert {opened.name(i) for i in range(len(opened))} == {built.name(i) for i in range(len(built))}
+
+
+@pytest.mark.parametrize("minutes", [1, 25, 60, 90, 360, 720, 5000])
+def test_select_window(catalog_path, minutes):
+    catalog = RouteCatalog.open(catalog_path)
+    selected = catalog.select(minutes)
+    expected = brute_select(catalog, minutes)
+    assert len(selected) == len(expected)
+    # Ties may come in either order: compare the distance from the focus time row by row
+    durations = catalog.durations
+    assert [abs(durations[i] - minutes) for i in selected] == [abs(durations[i] - minutes) for i in expected]
+    assert sorted(selected) == sorted(expected)
+
+
+def test_select_reads_lazily(catalog_path):
+    catalog = RouteCatalog.open(catalog_path)
+    order = catalog.select(360)
+    assert isinstance(order, ClosenessOrder)
+    top = order[:5]
+    assert len(order._order) < len(order)
+    assert top == list(order)[:5]
+    assert order[-1] == list(order)[-1]
+    assert order.index(top[3]) == 3
+    with pytest.raises(IndexError):
+        order[len(order)]
+    with pytest.raises(ValueError):
+        order.index(len(catalog) + 1)
+
+
+def test_select_fallback_outside_every_window(catalog_path):
+    catalog = RouteCatalog.open(catalog_path)
+    # Far beyond any route's 2x window: the few nearest routes instead
+    selected = catalog.select(100000)
+    assert len(selected) == FALLBACK_COUNT
+    assert sorted(catalog.durations[i] for i in selected) == sorted(catalog.durations)[-FALLBACK_COUNT:]
+
+
+@pytest.mark.parametrize("damage", ["empty", "header", "truncated", "garbage"])
+def test_load_catalog_falls_back_on_a_bad_file(catalog_path, damage, capsys):
+    with open(catalog_path, "rb") as f:
+        raw = f.read()
+    bad = {"empty": b"", "header": raw[:10], "truncated": raw[:len(raw) // 2], "garbage": b"\x17" * 4096}[damage]
+    with open(catalog_path, "wb") as f:
+        f.write(bad)
+    catalog = load_catalog(catalog_path, REAL_WORLD_FLIGHTS)
+    assert len(catalog) == len(REAL_WORLD_FLIGHTS)
+    assert catalog.source is None
+    assert "[catalog]" in capsys.readouterr().err
+
+
+def test_load_catalog_missing_file(tmp_path):
+    catalog = load_catalog(str(tmp_path / "missing.ffcat"), REAL_WORLD_FLIGHTS)
+    assert catalog.source is None
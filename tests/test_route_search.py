@@ -0,0 +1,40 @@
+import numpy as np
+
+from flights import REAL_WORLD_FLIGHTS
+from route_catalog import RouteCatalog, WINDOW_MIN_FACTOR, WINDOW_MAX_FACTOR
+from route_search import RouteSearchIndex, fold
+
+
+def scan(catalog, query):
+    """Reference: every query word is a prefix of some word of the route"""
+    terms = fold(query)
+    hits = []
+    for i in range(len(catalog)):
+        words = fold(f"{catalog.name(i)} {catalog.callsign(i)}")
+        if all(any(w.startswith(t) for w in words) for t in terms): hits.append(i)
+    return hits
+
+
+def test_fold_drops_accents_and_flags():
+    assert fold("🇧🇷 São Paulo (GRU)") == ["sao", "paulo", "gru"]
+
+
+def test_search_matches_a_scan():
+    catalog = RouteCatalog.from_flights(REAL_WORLD_FLIGHTS)
+    index = RouteSearchIndex(catalog)
+    for query in ["lon", "LONDON", "new york", "syd", "qfa", "ba", "a", "nowhere", "to an"]:
+        assert index.search(query).tolist() == scan(catalog, query), query
+    assert index.search("  ") is None
+
+
+def test_select_keeps_the_focus_window_closest_first():
+    catalog = RouteCatalog.from_flights(REAL_WORLD_FLIGHTS)
+    index = RouteSearchIndex(catalog)
+    matches = np.arange(len(catalog))
+    for minutes in (30, 90, 360, 100000):
+        selected = index.select(matches, minutes).tolist()
+        window = [i for i in range(len(catalog))
+                  if minutes * WINDOW_MIN_FACTOR <= catalog.durations[i] <= minutes * WINDOW_MAX_FACTOR]
+        assert sorted(selected) == (window or list(range(len(catalog))))
+        gaps = [abs(catalog.durations[i] - minutes) for i in selected]
+        assert gaps == sorted(gaps)
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+import session_checkpoint
+from flights import REAL_WORLD_FLIGHTS
+from session_checkpoint import SessionCheckpoint, read_checkpoint
+
+NAME, DATA = next(iter(REAL_WORLD_FLIGHTS.items()))
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state" / "session.ckpt")
+
+
+def write_session(path, elapsed, paused=False, warp=1.0):
+    checkpoint = SessionCheckpoint(path)
+    checkpoint.begin(NAME, DATA, 45, 0.0, warp)
+    for t in elapsed: checkpoint.write(t)
+    if paused: checkpoint.write(elapsed[-1] + 1, paused=True, sync=True)
+    checkpoint.close()
+
+
+def test_last_record_wins(path):
+    write_session(path, [30.0, 60.0, 90.0], warp=4.0)
+    state = read_checkpoint(path)
+    assert (state["flight"], state["data"], state["focus_minutes"]) == (NAME, DATA, 45)
+    assert state["elapsed_s"] == 90.0 and state["warp"] == 4.0 and state["paused"] is False
+
+
+@pytest.mark.parametrize("cut", [2, 5, 12])
+def test_truncated_record_falls_back_to_the_previous_one(path, cut):
+    write_session(path, [30.0, 60.0, 90.0])
+    with open(path, "rb+") as f:
+        f.truncate(os.path.getsize(path) - cut)
+    assert read_checkpoint(path)["elapsed_s"] == 60.0
+
+
+def test_truncated_header_is_not_resumed(path):
+    write_session(path, [30.0])
+    with open(path, "rb") as f:
+        header = f.readline()
+    with open(path, "wb") as f:
+        f.write(header[:len(header) // 2])
+    assert read_checkpoint(path) is None
+
+
+def test_compaction_keeps_the_session(path, monkeypatch):
+    monkeypatch.setattr(session_checkpoint, "MAX_RECORDS", 8)
+    write_session(path, [10.0 * n for n in range(1, 30)], paused=True, warp=2.0)
+    with open(path) as f:
+        assert len(f.read().splitlines()) <= 9
+    state = read_checkpoint(path)
+    assert state["elapsed_s"] == 291.0 and state["paused"] is True and state["warp"] == 2.0
+
+
+def test_clear_leaves_nothing_to_resume(path):
+    checkpoint = SessionCheckpoint(path)
+    checkpoint.begin(NAME, DATA, 45)
+    checkpoint.clear()
+    assert read_checkpoint(path) is None
+    assert not os.path.exists(path)
+
+
+def test_resume_restores_warp_and_pause(path, tmp_path, monkeypatch):
+    pytest.importorskip("PyQt6.QtWidgets")
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    import flight_focus as ff
+
+    write_session(path, [120.0], paused=True, warp=8.0)
+    checkpoint = SessionCheckpoint(path)
+    window = ff.FlightFocusPro(map_renderer="native", checkpoint=checkpoint, resume=checkpoint.load())
+    app.processEvents()
+    try:
+        assert window.sim.warp == 8.0 and window.sim.paused
+        assert window.clock.elapsed() == pytest.approx(121.0, abs=0.5)
+        state = read_checkpoint(path)
+        assert state["warp"] == 8.0 and state["paused"] is True
+    finally:
+        window.close()
+        checkpoint.close()
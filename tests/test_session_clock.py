@@ -0,0 +1,64 @@
+import pytest
+
+from flights import REAL_WORLD_FLIGHTS, telemetry
+from flight_profiles import FlightProfile
+from route_catalog import haversine_km
+from session_clock import ManualClock, SimClock, SessionClock
+from session_replay import SessionRecorder, simulate, verify
+
+NAME, DATA = next(iter(REAL_WORLD_FLIGHTS.items()))
+
+
+def test_sim_clock_warp_and_pause():
+    real = ManualClock()
+    sim = SimClock(10.0, real)
+    real.advance(3)
+    assert sim() == pytest.approx(30)
+    sim.pause()
+    real.advance(100)
+    assert sim() == pytest.approx(30)
+    assert sim.rate == 0 and sim.real_seconds(5) is None
+    sim.resume()
+    sim.set_warp(2.0)
+    real.advance(5)
+    assert sim() == pytest.approx(40)
+    assert sim.real_seconds(10) == pytest.approx(5)
+    with pytest.raises(ValueError):
+        sim.set_warp(0)
+
+
+def test_session_clock_follows_the_sim_clock():
+    real = ManualClock()
+    clock = SessionClock(600, SimClock(60.0, real))
+    real.advance(5)
+    assert clock.progress() == pytest.approx(0.5)
+    real.advance(10)
+    assert clock.finished() and clock.progress() == 1.0
+
+
+def test_simulate_runs_to_arrival_without_sleeping():
+    ticks = simulate(DATA, 30)
+    assert ticks[0]["progress"] == 0
+    assert ticks[-1]["progress"] == 1 and ticks[-1]["seconds_left"] == 0
+    assert all(a["t"] <= b["t"] for a, b in zip(ticks, ticks[1:]))
+
+
+def test_warped_recording_replays_identically(tmp_path):
+    path = str(tmp_path / "session.jsonl")
+    total_km = haversine_km(*DATA["coords"])
+    real = ManualClock()
+    sim = SimClock(120.0, real)
+    clock = SessionClock(45 * 60, sim)
+    profile = FlightProfile.for_flight(DATA)
+    recorder = SessionRecorder(path, NAME, DATA, 45, total_km, sim.warp)
+    while not clock.finished():
+        recorder.tick(telemetry(clock, total_km, profile))
+        if clock.progress() > 0.5 and not sim.paused and sim.warp == 120.0:
+            sim.pause(); recorder.event(clock, "pause")
+            real.advance(30)
+            sim.resume(); recorder.event(clock, "resume")
+            sim.set_warp(300.0)
+        real.advance(sim.real_seconds(clock.plan_wakeup()))
+    recorder.tick(telemetry(clock, total_km, profile))
+    recorder.close()
+    assert verify(path) == 0
@@ -0,0 +1,60 @@
+import pytest
+
+from session_history import SessionHistory
+
+VALUES = {"progress": 0.5, "remaining_km": 1000, "altitude_ft": 35000}
+
+
+def fly(history, flight="A → B", minutes=3, completed=True, started_at=None):
+    handle = history.begin(flight, {"callsign": "AB1", "aircraft": "Airbus A320"}, 30, started_at)
+    for m in range(minutes): history.sample(handle, m * 60, VALUES)
+    history.end(handle, minutes * 60, 500, completed)
+    return handle
+
+
+def test_session_and_rollups(tmp_path):
+    history = SessionHistory(str(tmp_path / "history.sqlite3"))
+    handle = fly(history)
+    fly(history, completed=False)
+    assert history.flush(5)
+    stats = history.stats()
+    assert stats["sessions"] == 2 and stats["completed"] == 1
+    assert stats["today_min"] == pytest.approx(6)
+    assert stats["top_routes"] == [("A → B", 1, 500)]
+    assert [m for m, *_ in history.samples(handle.id)] == [0, 1, 2]
+    history.close()
+
+
+def test_samples_wait_for_company(tmp_path, monkeypatch):
+    commits = []
+    original = SessionHistory._commit
+    monkeypatch.setattr(SessionHistory, "_commit", lambda self, conn, batch: commits.append(len(batch)) or original(self, conn, batch))
+    history = SessionHistory(str(tmp_path / "history.sqlite3"))
+    fly(history, minutes=10)
+    assert history.flush(5)
+    # begin, ten once-a-minute samples and the end share one transaction
+    assert commits == [12, 1]
+    history.close()
+
+
+def test_request_stats_answers_on_the_writer_thread(tmp_path):
+    import threading
+    history = SessionHistory(str(tmp_path / "history.sqlite3"))
+    fly(history)
+    got, done = [], threading.Event()
+    history.request_stats(lambda stats: (got.append((threading.current_thread().name, stats)), done.set()))
+    assert done.wait(5)
+    assert got[0][0] == "session-history" and got[0][1]["sessions"] == 1
+    history.close()
+
+
+def test_unusable_database_does_not_hang(tmp_path, capsys):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    history = SessionHistory(str(blocker / "history.sqlite3"))
+    fly(history)
+    history.request_stats(lambda stats: pytest.fail("no stats without a database"))
+    assert history.flush(5)
+    history.close()
+    assert not history._thread.is_alive()
+    assert "[history]" in capsys.readouterr().err
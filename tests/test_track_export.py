@@ -0,0 +1,102 @@
+import io
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+import pytest
+
+from flights import REAL_WORLD_FLIGHTS
+from route_catalog import RouteCatalog
+from track_export import Track, export_tracks, export_catalog, format_for
+
+LA_SYDNEY = "🇺🇸 LOS ANGELES → 🇦🇺 SYDNEY"
+START = datetime(2026, 6, 21, 22, 0).timestamp()
+
+
+def render(tracks, fmt):
+    out = io.StringIO()
+    export_tracks(tracks, out, fmt)
+    return out.getvalue()
+
+
+def session(name=LA_SYDNEY, minutes=90, step_s=30, start=START):
+    return Track.for_session(name, REAL_WORLD_FLIGHTS[name], minutes, step_s, start)
+
+
+def seconds(text):
+    return datetime.strptime(text, "%Y-%m-%dT%H:%M:%SZ").timestamp()
+
+
+def test_geojson_antimeridian_times_line_up_with_the_parts():
+    track = session()
+    samples = list(track.points())
+    feature = json.loads(render([track], "geojson"))["features"][0]
+    parts = feature["geometry"]["coordinates"]
+    times = feature["properties"]["coordTimes"]
+
+    # LA -> Sydney crosses the antimeridian once: two parts, two edge points added
+    assert len(parts) == 2
+    assert [len(p) for p in times] == [len(p) for p in parts]
+    assert sum(len(p) for p in parts) == len(samples) + 2
+    assert parts[0][-1][0] == -180.0 and parts[1][0][0] == 180.0
+    assert parts[0][-1][1:] == parts[1][0][1:]
+    assert times[0][-1] == times[1][0]
+
+    flat = [seconds(t) for part in times for t in part]
+    assert flat == sorted(flat)
+    # The edge time falls between the samples either side of the crossing
+    crossing = len(parts[0]) - 1
+    assert seconds(times[0][-2]) <= seconds(times[0][-1]) <= seconds(times[1][1])
+    assert crossing == next(k for k in range(1, len(samples)) if abs(samples[k][2] - samples[k - 1][2]) > 180)
+
+
+def test_geojson_without_a_crossing_is_one_part():
+    name = next(n for n, d in REAL_WORLD_FLIGHTS.items() if abs(d["coords"][1] - d["coords"][3]) < 90)
+    track = session(name)
+    feature = json.loads(render([track], "geojson"))["features"][0]
+    assert len(feature["geometry"]["coordinates"]) == 1
+    assert len(feature["properties"]["coordTimes"][0]) == len(list(track.points()))
+
+
+def test_gpx_and_kml_list_every_sample():
+    track = session()
+    n = len(list(track.points()))
+    gpx = ET.fromstring(render([track], "gpx"))
+    ns = {"g": "http://www.topografix.com/GPX/1/1"}
+    points = gpx.findall(".//g:trkpt", ns)
+    assert len(points) == n and all(p.find("g:time", ns) is not None for p in points)
+
+    kml = ET.fromstring(render([track], "kml"))
+    ns = {"k": "http://www.opengis.net/kml/2.2", "gx": "http://www.google.com/kml/ext/2.2"}
+    assert len(kml.findall(".//k:when", ns)) == len(kml.findall(".//gx:coord", ns)) == n
+
+
+def test_session_track_spans_the_focus_time():
+    track = session(minutes=90, step_s=60)
+    points = list(track.points())
+    assert points[0][0] == START and points[-1][0] == START + 90 * 60
+    assert points[0][3] == 0 and points[-1][3] == 0
+    lat2, lon2 = REAL_WORLD_FLIGHTS[LA_SYDNEY]["coords"][2:]
+    assert points[-1][1] == pytest.approx(lat2, abs=1e-3) and points[-1][2] == pytest.approx(lon2, abs=1e-3)
+
+
+@pytest.mark.parametrize("fmt", ["gpx", "geojson", "kml"])
+def test_bulk_export_parses_with_every_route(fmt):
+    catalog = RouteCatalog.from_flights(REAL_WORLD_FLIGHTS)
+    out = io.StringIO()
+    assert export_catalog(catalog, out, fmt, step_s=600, workers=1) == len(catalog)
+    text = out.getvalue()
+    if fmt == "geojson":
+        features = json.loads(text)["features"]
+        assert [f["properties"]["name"] for f in features] == [catalog.name(i) for i in range(len(catalog))]
+        assert all("coordTimes" not in f["properties"] for f in features)
+    else:
+        root = ET.fromstring(text)
+        tag = "trk" if fmt == "gpx" else "Placemark"
+        assert sum(1 for e in root.iter() if e.tag.endswith("}" + tag)) == len(catalog)
+
+
+def test_format_from_extension():
+    assert format_for("a.GPX") == "gpx" and format_for("a.json") == "geojson"
+    with pytest.raises(ValueError):
+        format_for("a.csv")
@@ -0,0 +1,198 @@
+"""
+FlightFocus Pro - theme engine
+One application-wide stylesheet instead of a setStyleSheet() per widget:
+- FEDORA_COLORS (dark, the original look) and FEDORA_LIGHT_COLORS share the same keys
+- STYLESHEET is filled from a palette once per scheme and cached; widgets only carry an
+  objectName or a "role" / "tone" property for the sheet to select on
+- state that changes at runtime is a dynamic property (set_state): only the widget whose
+  value actually changed is re-polished
+- Theme.apply("light" | "dark" | "system") swaps the cached sheet without rebuilding widgets;
+  "system" follows the desktop colour scheme as it changes. Painted widgets (flight cards)
+  read COLORS at paint time and are repainted on the changed signal
+"""
+
+from functools import lru_cache
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtWidgets import QApplication
+
+THEME_MODES = ("system", "light", "dark")
+
+FEDORA_COLORS = {
+    "background": "#2d2d2d",      # Dark Grey (Window)
+    "surface": "#3d3d3d",         # Lighter Grey (Cards/Widgets)
+    "primary": "#367bf0",         # Fedora Blue
+    "secondary": "#2ec27e",       # Fedora Green
+    "accent": "#f9f06b",          # Fedora Yellow
+    "text": "#f6f5f4",            # White/Grey Text
+    "text_secondary": "#deddda",  # Muted Text
+    "border": "#5e5c64",          # Border Grey
+    "success": "#57e389",
+    "warning": "#f8e45c",
+    "error": "#ff7b63",
+    "hover": "#454545",           # Hovered card / button
+    "selected": "#3a4a3a",        # Selected card
+    "checked": "#2a3a2a",         # Checked preset
+    "primary_hover": "#4a8bf8",
+    "on_primary": "#ffffff",      # Text on primary / gradient
+    "muted": "#888888",           # Status line
+}
+
+FEDORA_LIGHT_COLORS = {
+    "background": "#fafafa",
+    "surface": "#ffffff",
+    "primary": "#1c71d8",
+    "secondary": "#26a269",
+    "accent": "#c64600",
+    "text": "#241f31",
+    "text_secondary": "#5e5c64",
+    "border": "#c0bfbc",
+    "success": "#26a269",
+    "warning": "#c88800",
+    "error": "#c01c28",
+    "hover": "#eef3fc",
+    "selected": "#e6f5ec",
+    "checked": "#e6f5ec",
+    "primary_hover": "#3584e4",
+    "on_primary": "#ffffff",
+    "muted": "#77767b",
+}
+
+PALETTES = {"dark": FEDORA_COLORS, "light": FEDORA_LIGHT_COLORS}
+
+# Colours of the scheme in use, updated in place by Theme.apply() (delegates read it while painting)
+COLORS = dict(FEDORA_COLORS)
+
+STYLESHEET = """
+QMainWindow {{ background-color: {background}; font-family: 'Cantarell', 'Ubuntu', sans-serif; }}
+QLabel {{ color: {text}; font-family: 'Cantarell'; }}
+QGroupBox {{
+    color: {primary}; font-weight: bold; font-size: 14px;
+    border: 2px solid {border}; border-radius: 12px; margin-top: 10px; padding-top: 20px;
+}}
+QGroupBox::title {{ subcontrol-origin: margin; left: 12px; padding: 0 8px; background-color: {background}; }}
+QScrollArea {{ border: none; background: transparent; }}
+QScrollArea > QWidget > QWidget {{ background: {background}; }}
+QScrollBar:vertical {{ border: none; background: {surface}; width: 10px; border-radius: 5px; margin: 0; }}
+QScrollBar::handle:vertical {{ background: {border}; border-radius: 5px; min-height: 20px; }}
+QScrollBar::handle:vertical:hover {{ background: {primary}; }}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
+
+#header {{ background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {primary}, stop:1 {secondary}); }}
+#headerTitle {{ font-size: 32px; font-weight: 900; color: {on_primary}; }}
+#headerBadge {{ font-size: 12px; background: rgba(0,0,0,0.2); color: {on_primary}; border-radius: 10px; padding: 4px 8px; }}
+#headerStats {{ font-size: 13px; color: rgba(255,255,255,0.9); }}
+#themeButton {{ font-size: 12px; background: rgba(0,0,0,0.2); color: {on_primary}; border: none; border-radius: 10px; padding: 4px 10px; }}
+#themeButton:hover {{ background: rgba(0,0,0,0.35); }}
+
+QPushButton[role="preset"] {{
+    background-color: {surface}; border: 2px solid {border};
+    border-radius: 12px; color: {text}; font-weight: bold;
+}}
+QPushButton[role="preset"][length="long"] {{ border-color: {warning}; }}
+QPushButton[role="preset"][length="marathon"] {{ border-color: {error}; }}
+QPushButton[role="preset"]:checked {{ background-color: {checked}; border-color: {success}; }}
+QPushButton[role="preset"]:hover {{ background-color: {hover}; border-color: {primary}; }}
+
+QComboBox[role="field"], QLineEdit[role="field"] {{
+    background: {surface}; color: {text}; border: 2px solid {border}; border-radius: 8px; padding-left: 10px;
+}}
+QPushButton[role="field"] {{ background: {surface}; color: {text}; border: 2px solid {border}; border-radius: 8px; font-weight: bold; }}
+QPushButton[role="field"]:hover {{ border-color: {primary}; }}
+
+#flightList {{ background: transparent; border: none; }}
+#footer {{ background-color: {surface}; border-top: 1px solid {border}; }}
+#beginButton {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {primary}, stop:1 {secondary});
+    color: {on_primary}; border: none; border-radius: 12px; font-size: 18px; font-weight: 900; letter-spacing: 1px;
+}}
+#beginButton:disabled {{ background: {border}; color: {text_secondary}; }}
+#teamButton {{
+    background: {background}; color: {text}; border: 2px solid {primary};
+    border-radius: 12px; font-size: 14px; font-weight: bold; padding: 0 18px;
+}}
+#teamButton:disabled {{ border-color: {border}; color: {text_secondary}; }}
+#status {{ margin-top: 10px; color: {muted}; }}
+
+#mapContainer, #mapView {{ background: {background}; }}
+#dashboard {{ background: {surface}; border-top: 3px solid {primary}; }}
+#dashboard QLabel {{ border: none; }}
+QLabel[role="caption"] {{ color: {text_secondary}; font-weight: bold; font-size: 12px; }}
+QLabel[role="value"] {{ font-size: 28px; font-weight: bold; }}
+QLabel[tone="success"] {{ color: {success}; }}
+QLabel[tone="primary"] {{ color: {primary}; }}
+QLabel[tone="warning"] {{ color: {warning}; }}
+QLabel[tone="accent"] {{ color: {accent}; }}
+QPushButton[role="control"] {{
+    background: {background}; color: {text}; border: 2px solid {border}; border-radius: 8px; font-weight: bold; padding: 0 16px;
+}}
+QPushButton[role="control"]:hover {{ border-color: {primary}; }}
+QPushButton[role="control"][paused="true"] {{ border-color: {warning}; color: {warning}; }}
+#profileOverlay {{ background: rgba(0, 0, 0, 0.75); color: {success}; font-family: monospace; font-size: 11px; padding: 8px; border-radius: 6px; }}
+"""
+
+
+@lru_cache(maxsize=None)
+def build_stylesheet(scheme):
+    """The application stylesheet for "light" or "dark", built once per scheme"""
+    return STYLESHEET.format(**PALETTES[scheme])
+
+
+def set_state(widget, name, value):
+    """Set a dynamic property the stylesheet selects on; re-polish only if it changed"""
+    if widget.property(name) == value: return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    return True
+
+
+def system_scheme():
+    """The desktop's colour scheme; dark when the platform does not say"""
+    scheme = QApplication.styleHints().colorScheme()
+    return "light" if scheme == Qt.ColorScheme.Light else "dark"
+
+
+class Theme(QObject):
+    """Applies the cached stylesheet for a mode to the whole application"""
+    changed = pyqtSignal(str)   # scheme now in use: "light" or "dark"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mode = None
+        self.scheme = None
+        QApplication.styleHints().colorSchemeChanged.connect(self.on_system_scheme)
+
+    def apply(self, mode):
+        if mode not in THEME_MODES: mode = "system"
+        self.mode = mode
+        self.set_scheme(system_scheme() if mode == "system" else mode)
+
+    def next_mode(self):
+        return THEME_MODES[(THEME_MODES.index(self.mode) + 1) % len(THEME_MODES)]
+
+    def on_system_scheme(self, scheme):
+        if self.mode == "system": self.set_scheme(system_scheme())
+
+    def set_scheme(self, scheme):
+        if scheme == self.scheme: return
+        self.scheme = scheme
+        COLORS.clear()
+        COLORS.update(PALETTES[scheme])
+        app = QApplication.instance()
+        # Fusion palette for what the sheet does not cover (popups, dialogs, completer)
+        palette = QPalette()
+        for role, key in ((QPalette.ColorRole.Window, "background"), (QPalette.ColorRole.WindowText, "text"),
+                          (QPalette.ColorRole.Base, "surface"), (QPalette.ColorRole.AlternateBase, "background"),
+                          (QPalette.ColorRole.Text, "text"), (QPalette.ColorRole.Button, "surface"),
+                          (QPalette.ColorRole.ButtonText, "text"), (QPalette.ColorRole.Highlight, "primary"),
+                          (QPalette.ColorRole.HighlightedText, "on_primary"),
+                          (QPalette.ColorRole.PlaceholderText, "text_secondary")):
+            palette.setColor(role, QColor(COLORS[key]))
+        app.setPalette(palette)
+        # Setting even the same sheet again re-polishes every widget: skip it (another window, same scheme)
+        sheet = build_stylesheet(scheme)
+        if app.styleSheet() != sheet: app.setStyleSheet(sheet)
+        self.changed.emit(scheme)
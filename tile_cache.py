@@ -0,0 +1,255 @@
+"""
+FlightFocus Pro - offline tile & asset cache
+- Disk-backed, size-bounded LRU store for Leaflet assets and basemap tiles.
+- Served to the map page through the custom ffcache:// URL scheme.
+- Fills from the network when one exists, serves cache-only when it doesn't.
+"""
+
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import QBuffer, QByteArray, QUrl, QFile, QIODevice
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt6.QtWebEngineCore import QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob
+
+CACHE_SCHEME = b"ffcache"
+CACHE_BASE_URL = "ffcache://app/"
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "flight-focus", "tiles")
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+# Upstream sources the page used to hit directly
+LEAFLET_DIST_URL = "https://unpkg.com/leaflet@1.9.4/dist/"
+TILE_UPSTREAM_URL = "https://{s}.basemaps.cartocdn.com/dark_all/{path}"
+
+# After a connectivity failure, treat the network as gone for this long and serve cache-only
+OFFLINE_BACKOFF_S = 30.0
+# Errors that mean the network is unreachable; anything else (HTTP 404, 5xx, ...) only fails that request
+OFFLINE_ERRORS = frozenset(getattr(QNetworkReply.NetworkError, name) for name in (
+    "HostNotFoundError", "TimeoutError", "ConnectionRefusedError",
+    "NetworkSessionFailedError", "TemporaryNetworkFailureError", "UnknownNetworkError"))
+
+MIME_TYPES = {
+    ".png": b"image/png", ".jpg": b"image/jpeg", ".svg": b"image/svg+xml",
+    ".js": b"application/javascript", ".css": b"text/css", ".json": b"application/json",
+}
+
+
+def register_cache_scheme():
+    """Must run before the QApplication is created"""
+    scheme = QWebEngineUrlScheme(CACHE_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme |
+                    QWebEngineUrlScheme.Flag.CorsEnabled |
+                    QWebEngineUrlScheme.Flag.ContentSecurityPolicyIgnored)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def upstream_for(host, path):
+    """Map an ffcache:// host/path onto (cache_key, upstream_url), or None if unknown"""
+    path = path.lstrip("/")
+    if host == "assets":
+        return f"assets/{path}", LEAFLET_DIST_URL + path
+    if host == "tiles":
+        # tiles/{s}/{z}/{x}/{y}{r}.png - the subdomain only spreads load, so it is not part of the key
+        subdomain, _, tile_path = path.partition("/")
+        if not tile_path: return None
+        return f"tiles/{tile_path}", TILE_UPSTREAM_URL.format(s=subdomain, path=tile_path)
+    return None
+
+
+def mime_for(key):
+    return MIME_TYPES.get(os.path.splitext(key)[1].lower(), b"application/octet-stream")
+
+
+class TileCache:
+    """Size-bounded on-disk LRU store keyed by URL path (thread-safe)"""
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # digest -> size, oldest first
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._hit_time = 0.0
+        self._miss_time = 0.0
+        self._miss_fetches = 0
+
+        os.makedirs(self.root, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        # Rebuild LRU order from file mtimes (touched on every hit)
+        entries = []
+        for bucket in os.scandir(self.root):
+            if not bucket.is_dir(): continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(".tmp"):
+                    os.unlink(entry.path)
+                    continue
+                st = entry.stat()
+                entries.append((st.st_mtime, entry.name, st.st_size))
+        entries.sort()
+        for _, digest, size in entries:
+            self._index[digest] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _digest(self, key):
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._digest(key) in self._index
+
+    def get(self, key):
+        """Return cached bytes or None; counts a hit or a miss"""
+        t0 = time.perf_counter()
+        digest = self._digest(key)
+        with self._lock:
+            if digest not in self._index:
+                self.misses += 1
+                return None
+            self._index.move_to_end(digest)
+        path = self._path(digest)
+        try:
+            with open(path, "rb") as f: data = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._total_bytes -= self._index.pop(digest, 0)
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self._hit_time += time.perf_counter() - t0
+        return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes: return
+        digest = self._digest(key)
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f: f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._total_bytes -= self._index.pop(digest, 0)
+            self._index[digest] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._index:
+            digest, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try: os.unlink(self._path(digest))
+            except OSError: pass
+
+    def record_fetch(self, seconds):
+        """Account the network time of a miss so hit vs miss latency can be compared"""
+        with self._lock:
+            self._miss_fetches += 1
+            self._miss_time += seconds
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits, "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._index), "bytes": self._total_bytes, "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "avg_hit_ms": 1000 * self._hit_time / self.hits if self.hits else 0.0,
+                "avg_miss_fetch_ms": 1000 * self._miss_time / self._miss_fetches if self._miss_fetches else 0.0,
+            }
+
+
+class CacheSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serves ffcache:// requests from a TileCache, filling it from the network on misses"""
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.network = QNetworkAccessManager(self)
+        self.offline_until = 0.0
+        self._pending = {}  # QNetworkReply -> (job, key, start_time)
+
+    def is_offline(self):
+        return time.monotonic() < self.offline_until
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        host, path = url.host(), url.path()
+
+        if host == "qt":
+            # Bundled Qt resources (qrc:/qtwebchannel/qwebchannel.js) served same-origin with the page
+            self._reply_resource(job, ":" + path)
+            return
+
+        mapping = upstream_for(host, path)
+        if mapping is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        key, upstream = mapping
+
+        data = self.cache.get(key)
+        if data is not None:
+            self._reply(job, key, data)
+            return
+        if self.is_offline():
+            job.fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+            return
+
+        request = QNetworkRequest(QUrl(upstream))
+        request.setAttribute(QNetworkRequest.Attribute.RedirectPolicyAttribute,
+                             QNetworkRequest.RedirectPolicy.NoLessSafeRedirectPolicy)
+        reply = self.network.get(request)
+        self._pending[reply] = (job, key, time.perf_counter())
+        reply.finished.connect(lambda r=reply: self._on_fetched(r))
+        # The page may cancel the request (e.g. tiles scrolled away) before we answer
+        job.destroyed.connect(lambda *_, r=reply: self._on_job_gone(r))
+
+    def _on_job_gone(self, reply):
+        if self._pending.pop(reply, None) is not None:
+            reply.abort()
+
+    def _on_fetched(self, reply):
+        reply.deleteLater()
+        entry = self._pending.pop(reply, None)
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            if reply.error() in OFFLINE_ERRORS:
+                self.offline_until = time.monotonic() + OFFLINE_BACKOFF_S
+            if entry: entry[0].fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+            return
+
+        self.offline_until = 0.0
+        data = bytes(reply.readAll())
+        if entry is None: return
+        job, key, started = entry
+        self.cache.record_fetch(time.perf_counter() - started)
+        self.cache.put(key, data)
+        self._reply(job, key, data)
+
+    def _reply(self, job, key, data):
+        buffer = QBuffer(job)
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(mime_for(key), buffer)
+
+    def _reply_resource(self, job, resource):
+        f = QFile(resource)
+        if not f.open(QIODevice.OpenModeFlag.ReadOnly):
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        self._reply(job, resource, bytes(f.readAll()))
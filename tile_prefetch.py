@@ -0,0 +1,162 @@
+"""
+FlightFocus Pro - route-corridor tile prefetch
+Warms the tile cache for the selected flight before BEGIN is pressed:
+- the planner reproduces the page's fitBounds zoom for the map size, then lists the
+  tiles of that first view plus a narrow corridor along the great circle at the next
+  zoom levels (where the user zooms in to follow the plane)
+- a bounded thread pool fetches the missing ones straight into the TileCache that
+  serves ffcache://, so the page finds them on disk
+- selecting another flight cancels the queued work; progress is reported as a Qt signal
+"""
+
+import math
+import time
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal
+
+TILE_SIZE = 256
+MAX_MERCATOR_LAT = 85.0511287798
+# Must match the page: L.tileLayer maxZoom / subdomains and fitBounds padding
+MAX_ZOOM = 19
+SUBDOMAINS = "abcd"
+FIT_PADDING_PX = 120
+# Corridor zooms beyond the fitted one, tiles either side of the path, and a hard cap per flight
+CORRIDOR_ZOOMS = 2
+CORRIDOR_HALO = 1
+MAX_PREFETCH_TILES = 800
+PREFETCH_WORKERS = 4
+FETCH_TIMEOUT_S = 10.0
+USER_AGENT = "FlightFocusPro/1.0 (tile prefetch)"
+
+
+def world_px(lat, lon, zoom):
+    """Web-Mercator pixel coordinates at a zoom level (lon may be unwrapped past +-180)"""
+    scale = TILE_SIZE * 2.0 ** zoom
+    lat = np.clip(lat, -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT)
+    x = (np.asarray(lon) + 180.0) / 360.0 * scale
+    y = (1.0 - np.log(np.tan(np.radians(lat)) + 1.0 / np.cos(np.radians(lat))) / math.pi) / 2.0 * scale
+    return x, y
+
+
+def fit_zoom(route, width, height, padding=FIT_PADDING_PX):
+    """Zoom Leaflet's fitBounds picks for the route's bounds (floor of the scale zoom, zoomSnap 1)"""
+    x, y = world_px(route.lats, route.lons, 0)
+    span_x, span_y = max(x.max() - x.min(), 1e-9), max(y.max() - y.min(), 1e-9)
+    scale = min((width - 2 * padding) / span_x, (height - 2 * padding) / span_y)
+    if scale <= 0: return 0
+    return int(min(max(math.floor(math.log2(scale)), 0), MAX_ZOOM))
+
+
+def view_tiles(route, zoom, width, height):
+    """Tiles of the fitted view: the route bounds' centre, map-sized, at zoom"""
+    x, y = world_px(route.lats, route.lons, zoom)
+    cx, cy = (x.min() + x.max()) / 2, (y.min() + y.max()) / 2
+    n = 2 ** zoom
+    xs = range(int((cx - width / 2) // TILE_SIZE), int((cx + width / 2) // TILE_SIZE) + 1)
+    ys = range(max(int((cy - height / 2) // TILE_SIZE), 0), min(int((cy + height / 2) // TILE_SIZE), n - 1) + 1)
+    return [(zoom, tx % n, ty) for ty in ys for tx in xs]
+
+
+def corridor_tiles(route, zoom, halo=CORRIDOR_HALO):
+    """Tiles the great circle passes through at zoom, plus `halo` tiles around them"""
+    x, y = world_px(route.lats, route.lons, zoom)
+    # Densify so consecutive samples are under half a tile apart at this zoom
+    length = np.sum(np.hypot(np.diff(x), np.diff(y))) / TILE_SIZE
+    t = np.linspace(0.0, 1.0, max(int(length * 2) + 2, len(x)))
+    fractions = np.linspace(0.0, 1.0, len(x))
+    tx = (np.interp(t, fractions, x) // TILE_SIZE).astype(np.int64)
+    ty = (np.interp(t, fractions, y) // TILE_SIZE).astype(np.int64)
+    n = 2 ** zoom
+    tiles = set()
+    for dx in range(-halo, halo + 1):
+        for dy in range(-halo, halo + 1):
+            keep = (ty + dy >= 0) & (ty + dy < n)
+            tiles.update(zip(((tx[keep] + dx) % n).tolist(), (ty[keep] + dy).tolist()))
+    # Path order, so the start of the flight is fetched first
+    first_seen = {}
+    for i, key in enumerate(zip((tx % n).tolist(), ty.tolist())):
+        first_seen.setdefault(key, i)
+    return [(zoom, x_, y_) for x_, y_ in sorted(tiles, key=lambda k: first_seen.get(k, len(t)))]
+
+
+def plan_tiles(route, width, height, retina=False, extra_zooms=CORRIDOR_ZOOMS, limit=MAX_PREFETCH_TILES):
+    """Ordered, de-duplicated ffcache tile paths: first view, then the corridor zoom by zoom"""
+    zoom = fit_zoom(route, width, height)
+    tiles = view_tiles(route, zoom, width, height)
+    for z in range(zoom + 1, min(zoom + extra_zooms, MAX_ZOOM) + 1):
+        tiles += corridor_tiles(route, z)
+    suffix = "@2x" if retina else ""
+    seen, paths = set(), []
+    for z, x, y in tiles:
+        if (z, x, y) in seen: continue
+        seen.add((z, x, y))
+        paths.append(f"{SUBDOMAINS[(x + y) % len(SUBDOMAINS)]}/{z}/{x}/{y}{suffix}.png")
+        if len(paths) >= limit: break
+    return paths
+
+
+class TilePrefetcher(QObject):
+    """Fetches planned tiles into a TileCache on a bounded worker pool"""
+    progress = pyqtSignal(int, int, int)   # done, total, fetched from the network
+    finished = pyqtSignal(int, int)        # total, fetched
+
+    def __init__(self, cache, upstream_for, workers=PREFETCH_WORKERS, profiler=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.upstream_for = upstream_for
+        self.profiler = profiler
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tile-prefetch")
+        self.generation = 0
+        self._futures = []
+        self._done = self._fetched = self._total = 0
+        self._offline = False
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        with self._lock: self.generation += 1
+        for f in self._futures: f.cancel()
+        self._futures = []
+
+    def prefetch(self, tile_paths):
+        """Replace any running plan with this one; tiles already on disk are skipped"""
+        self.cancel()
+        keys = [self.upstream_for("tiles", p) for p in tile_paths]
+        todo = [(key, url) for key, url in keys if key not in self.cache]
+        self._done, self._fetched, self._total, self._offline = 0, 0, len(todo), False
+        if not todo:
+            self.finished.emit(0, 0)
+            return
+        generation = self.generation
+        self._futures = [self.pool.submit(self._fetch, generation, key, url) for key, url in todo]
+
+    def _fetch(self, generation, key, url):
+        if generation != self.generation: return
+        fetched = False
+        if not self._offline and key not in self.cache:
+            t0 = time.perf_counter()
+            try:
+                request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+                with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT_S) as reply:
+                    data = reply.read()
+                self.cache.record_fetch(time.perf_counter() - t0)
+                self.cache.put(key, data)
+                fetched = True
+            except OSError:
+                # No network: give up on the rest of this plan instead of timing out tile by tile
+                self._offline = True
+            if self.profiler: self.profiler.sample("prefetch.tile_ms", 1000 * (time.perf_counter() - t0))
+        with self._lock:
+            if generation != self.generation: return
+            self._done += 1
+            self._fetched += fetched
+            done, total, fetched = self._done, self._total, self._fetched
+        self.progress.emit(done, total, fetched)
+        if done == total: self.finished.emit(total, fetched)
+
+    def shutdown(self):
+        self.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+FlightFocus Pro - track export
+What a session flew, or every route of a catalog, as GPX, GeoJSON or KML:
+- a Track regenerates its samples (time, position, altitude) on every pass, in chunks of
+  CHUNK_POINTS: position from one batched slerp, altitude from the flight profile. Writers
+  stream them point by point, so no document is ever built in memory
+- session tracks follow the session clock (a focus session of N minutes flies the whole
+  route); times are wall-clock from the session start
+- bulk mode renders a catalog on a process pool, CHUNK_ROUTES routes per task, and writes
+  the rendered chunks in catalog order with a bounded number in flight
+GeoJSON lines are split where they cross the antimeridian (RFC 7946); coordTimes are nested the
+same way, with an interpolated time for each edge point.
+
+Usage:
+  python track_export.py session -f BAW -m 90 -o flight.gpx [--step 30]
+  python track_export.py session --recording session.jsonl -o flight.kml
+  python track_export.py bulk routes.geojson [--catalog routes.ffcat] [--workers N] [--step 60]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from collections import deque
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from flights import REAL_WORLD_FLIGHTS
+from flight_profiles import FlightProfile, ProfileTable, build_profile
+from geodesy import great_circle_points
+from route_catalog import load_catalog, DEFAULT_CATALOG_PATH
+
+FORMATS = ("gpx", "geojson", "kml")
+DEFAULT_SESSION_STEP_S = 30
+DEFAULT_ROUTE_STEP_S = 60
+CHUNK_POINTS = 512
+CHUNK_ROUTES = 250
+FT_TO_M = 0.3048
+
+
+def _wrap(lon):
+    return (lon + 180.0) % 360.0 - 180.0
+
+
+def _iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Track:
+    """One flight's samples over duration_s of its clock; points() can be iterated any number of times"""
+
+    def __init__(self, name, data, duration_s, step_s, start=None, t0=0.0, t_end=None, profile=None):
+        self.name = name
+        self.data = data
+        self.duration_s = float(duration_s)   # clock seconds for the whole route
+        self.step_s = float(step_s)
+        self.start = start                    # wall-clock time at t0, None: no timestamps
+        self.t0 = t0
+        self.t_end = self.duration_s if t_end is None else min(t_end, self.duration_s)
+        self.profile = profile or FlightProfile.for_flight(data)
+
+    @classmethod
+    def for_session(cls, name, data, focus_minutes, step_s=DEFAULT_SESSION_STEP_S, start=None):
+        return cls(name, data, focus_minutes * 60, step_s, time.time() if start is None else start)
+
+    @classmethod
+    def for_recording(cls, path, step_s=DEFAULT_SESSION_STEP_S):
+        """The part of a session_replay recording that was flown (to its last tick)"""
+        from session_replay import read_recording
+        header, ticks = read_recording(path)
+        aircraft, distance_km, real_duration = header.get("profile") or ("", 0, header["focus_minutes"])
+        data = {"coords": header["coords"], "aircraft": aircraft, "distance_km": distance_km,
+                "real_duration": real_duration, "callsign": ""}
+        t0 = ticks[0]["t"] if ticks else 0.0
+        t_end = ticks[-1]["t"] if ticks else 0.0
+        start = header.get("started_at", os.path.getmtime(path) - (t_end - t0))
+        return cls(header["flight"], data, header["focus_minutes"] * 60, step_s, start, t0, t_end,
+                   FlightProfile(build_profile(aircraft, distance_km, real_duration)))
+
+    def times(self):
+        n = max(int((self.t_end - self.t0) // self.step_s), 0)
+        for k in range(n + 1): yield self.t0 + k * self.step_s
+        if self.t0 + n * self.step_s < self.t_end: yield self.t_end
+
+    def points(self):
+        """(wall-clock time or None, lat, lon, altitude m)"""
+        lat1, lon1, lat2, lon2 = self.data["coords"]
+        times = self.times()
+        while True:
+            chunk = [t for _, t in zip(range(CHUNK_POINTS), times)]
+            if not chunk: return
+            samples = [self.profile.at(t / self.duration_s) for t in chunk]
+            lats, lons = great_circle_points(lat1, lon1, lat2, lon2, [frac for _, frac, _ in samples])
+            for t, lat, lon, (alt, _, _) in zip(chunk, lats.tolist(), lons.tolist(), samples):
+                yield (None if self.start is None else self.start + t - self.t0), lat, _wrap(lon), alt * FT_TO_M
+
+    def properties(self):
+        data = self.data
+        return {"name": self.name, "callsign": data.get("callsign"), "aircraft": data.get("aircraft"),
+                "distance_km": data.get("distance_km"), "duration_min": data.get("real_duration")}
+
+
+# --- streaming writers: begin(), track() per flight, end() ---
+class GpxWriter:
+    def __init__(self, out):
+        self.out = out
+        self.count = 0
+
+    def begin(self):
+        self.out.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                       '<gpx version="1.1" creator="FlightFocus Pro" xmlns="http://www.topografix.com/GPX/1/1">\n')
+
+    def track(self, track):
+        w = self.out.write
+        props = track.properties()
+        w(f"<trk><name>{escape(track.name)}</name>")
+        if props["callsign"]: w(f"<desc>{escape(props['callsign'])} {escape(props['aircraft'])}</desc>")
+        w("<trkseg>\n")
+        for t, lat, lon, alt in track.points():
+            when = "" if t is None else f"<time>{_iso(t)}</time>"
+            w(f'<trkpt lat="{lat:.5f}" lon="{lon:.5f}"><ele>{alt:.0f}</ele>{when}</trkpt>\n')
+        w("</trkseg></trk>\n")
+        self.count += 1
+
+    def end(self):
+        self.out.write("</gpx>\n")
+
+
+def _antimeridian_parts(points):
+    """(t, lat, lon, alt, starts_part) per sample, with each +-180 crossing added as two edge points:
+    one ending the part on the line, one starting the next part across it, both at the interpolated time"""
+    prev = None
+    for t, lat, lon, alt in points:
+        if prev is not None and abs(lon - prev[2]) > 180.0:
+            t0, lat0, lon0, alt0 = prev
+            edge = 180.0 if lon0 > 0 else -180.0
+            span = (lon + 360.0 if edge > 0 else lon - 360.0) - lon0
+            f = (edge - lon0) / span if span else 0.0
+            t_edge = None if t is None else t0 + (t - t0) * f
+            lat_edge, alt_edge = lat0 + (lat - lat0) * f, alt0 + (alt - alt0) * f
+            yield t_edge, lat_edge, edge, alt_edge, False
+            yield t_edge, lat_edge, -edge, alt_edge, True
+        yield t, lat, lon, alt, prev is None
+        prev = (t, lat, lon, alt)
+
+
+class GeoJsonWriter:
+    def __init__(self, out):
+        self.out = out
+        self.count = 0
+
+    def begin(self):
+        self.out.write('{"type": "FeatureCollection", "features": [\n')
+
+    def track(self, track):
+        w = self.out.write
+        if self.count: w(",\n")
+        w('{"type": "Feature", "geometry": {"type": "MultiLineString", "coordinates": [[')
+        for n, (t, lat, lon, alt, starts) in enumerate(_antimeridian_parts(track.points())):
+            if n: w("],[" if starts else ",")
+            w(f"[{lon:.5f},{lat:.5f},{alt:.0f}]")
+        w(']]}, "properties": ')
+        props = json.dumps(track.properties(), ensure_ascii=False)
+        if track.start is not None:
+            # Second pass for the timestamps, nested like the line parts: one per coordinate
+            w(props[:-1] + ', "coordTimes": [[')
+            for n, (t, _, _, _, starts) in enumerate(_antimeridian_parts(track.points())):
+                if n: w("],[" if starts else ",")
+                w(f'"{_iso(t)}"')
+            w("]]}}")
+        else:
+            w(props + "}")
+        self.count += 1
+
+    def end(self):
+        self.out.write("\n]}\n")
+
+
+class KmlWriter:
+    def __init__(self, out):
+        self.out = out
+        self.count = 0
+
+    def begin(self):
+        self.out.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                       '<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">\n'
+                       '<Document><name>FlightFocus Pro</name>\n')
+
+    def track(self, track):
+        w = self.out.write
+        props = track.properties()
+        w(f"<Placemark><name>{escape(track.name)}</name>")
+        if props["callsign"]: w(f"<description>{escape(props['callsign'])} {escape(props['aircraft'])}</description>")
+        if track.start is None:
+            w("<LineString><tessellate>1</tessellate><altitudeMode>absolute</altitudeMode><coordinates>\n")
+            for _, lat, lon, alt in track.points(): w(f"{lon:.5f},{lat:.5f},{alt:.0f}\n")
+            w("</coordinates></LineString>")
+        else:
+            # gx:Track lists every <when>, then every <gx:coord>: two passes over the samples
+            w("<gx:Track><altitudeMode>absolute</altitudeMode>\n")
+            for t, _, _, _ in track.points(): w(f"<when>{_iso(t)}</when>\n")
+            for _, lat, lon, alt in track.points(): w(f"<gx:coord>{lon:.5f} {lat:.5f} {alt:.0f}</gx:coord>\n")
+            w("</gx:Track>")
+        w("</Placemark>\n")
+        self.count += 1
+
+    def end(self):
+        self.out.write("</Document></kml>\n")
+
+
+WRITERS = {"gpx": GpxWriter, "geojson": GeoJsonWriter, "kml": KmlWriter}
+
+
+def format_for(path, fmt=None):
+    if fmt: return fmt
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext == "json": ext = "geojson"
+    if ext not in FORMATS: raise ValueError(f"{path}: pick a format with --format ({', '.join(FORMATS)})")
+    return ext
+
+
+def export_tracks(tracks, out, fmt):
+    writer = WRITERS[fmt](out)
+    writer.begin()
+    for track in tracks: writer.track(track)
+    writer.end()
+    return writer.count
+
+
+# --- bulk: a whole catalog on a process pool ---
+def _route_tracks(catalog, start, stop, step_s):
+    """Whole routes on the real flight's clock, no timestamps; profiles from the cached table if built"""
+    table = ProfileTable.open(catalog)
+    for i in range(start, stop):
+        name, data = catalog.record(i)
+        yield Track(name, data, data["real_duration"] * 60, step_s, profile=table.profile(i) if table else None)
+
+
+def _render_chunk(task):
+    """Worker: routes [start, stop) rendered as document body text"""
+    import io
+    catalog_path, fmt, start, stop, step_s = task
+    catalog = load_catalog(catalog_path, REAL_WORLD_FLIGHTS)
+    buf = io.StringIO()
+    writer = WRITERS[fmt](buf)
+    writer.count = start   # separators depend on the position in the document
+    for track in _route_tracks(catalog, start, stop, step_s): writer.track(track)
+    return buf.getvalue()
+
+
+def export_catalog(catalog, out, fmt, step_s=DEFAULT_ROUTE_STEP_S, workers=None):
+    """Every route of the catalog into one document, rendered in parallel, written in order"""
+    from concurrent.futures import ProcessPoolExecutor
+    n = len(catalog)
+    # Workers re-open the catalog themselves: a compiled one is memory-mapped, the built-in one is rebuilt
+    tasks = [(catalog.source, fmt, a, min(a + CHUNK_ROUTES, n), step_s) for a in range(0, n, CHUNK_ROUTES)]
+    writer = WRITERS[fmt](out)
+    writer.begin()
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # At most two chunks per worker are rendered ahead of the writer
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(_render_chunk, task))
+            if len(pending) >= 2 * workers: out.write(pending.popleft().result())
+        while pending: out.write(pending.popleft().result())
+    writer.end()
+    return n
+
+
+def _open_output(path):
+    return sys.stdout if path == "-" else open(path, "w", encoding="utf-8", newline="\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export FlightFocus Pro tracks to GPX / GeoJSON / KML")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ses = sub.add_parser("session", help="the track of one focus session")
+    ses.add_argument("-f", "--flight", help="part of a route name or a callsign prefix (default: closest route)")
+    ses.add_argument("-m", "--minutes", type=int, default=60, help="focus time")
+    ses.add_argument("--recording", metavar="PATH", help="a session recorded with --record (flight, focus time and start from it)")
+    ses.add_argument("--start", help="session start, ISO 8601 (default: now)")
+    ses.add_argument("--step", type=float, default=DEFAULT_SESSION_STEP_S, help="seconds of session time between samples")
+    ses.add_argument("-o", "--output", default="-", help="output file (format from the extension), - for stdout")
+    ses.add_argument("--catalog", default=DEFAULT_CATALOG_PATH)
+    ses.add_argument("--format", choices=FORMATS)
+    bulk = sub.add_parser("bulk", help="every route of the catalog, in parallel")
+    bulk.add_argument("output", help="output file (format from the extension)")
+    bulk.add_argument("--catalog", default=DEFAULT_CATALOG_PATH, help="compiled catalog (default: built-in routes if missing)")
+    bulk.add_argument("--step", type=float, default=DEFAULT_ROUTE_STEP_S, help="seconds of flight time between samples")
+    bulk.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    bulk.add_argument("--format", choices=FORMATS)
+    args = parser.parse_args(argv)
+    if args.step <= 0: sys.exit("--step must be positive")
+    try:
+        fmt = format_for(args.output, args.format) if args.output != "-" else (args.format or "gpx")
+    except ValueError as e:
+        sys.exit(str(e))
+
+    if args.command == "bulk":
+        catalog = load_catalog(args.catalog, REAL_WORLD_FLIGHTS)
+        t0 = time.perf_counter()
+        with _open_output(args.output) as out:
+            count = export_catalog(catalog, out, fmt, args.step, args.workers)
+        print(f"Wrote {count:,} routes to {args.output} in {time.perf_counter() - t0:.1f} s", file=sys.stderr)
+        return 0
+
+    if args.recording:
+        track = Track.for_recording(args.recording, args.step)
+    else:
+        catalog = load_catalog(args.catalog, REAL_WORLD_FLIGHTS)
+        index = catalog.find(args.flight) if args.flight else catalog.select(args.minutes)[0]
+        if index is None: sys.exit(f"No route matches {args.flight!r}.")
+        start = datetime.fromisoformat(args.start).timestamp() if args.start else None
+        track = Track.for_session(*catalog.record(index), args.minutes, args.step, start)
+    out = _open_output(args.output)
+    try:
+        export_tracks([track], out, fmt)
+    finally:
+        if out is not sys.stdout: out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())